@@ -0,0 +1,141 @@
+# ============================================================================
+# BENCHMARK PROFILEUR DE COLONNES - mg-platform/benchmarks/bench_column_profiler.py
+# ============================================================================
+
+"""
+Compare l'analyse de colonnes multi-passes (analyze_column_legacy) et le
+profil vectorisé en une passe (analyze_column) sur un fichier synthétique.
+
+Usage (depuis mg-platform/):
+    python benchmarks/bench_column_profiler.py --rows 100000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mcp_server.tools.data_analyzer import (  # noqa: E402
+    analyze_column, analyze_column_legacy, clean_dataframe
+)
+
+NON_DIFFUSIBLE = "INFORMATION NON-DIFFUSIBLE"
+COMMUNES = ["LAGNY-SUR-MARNE", "BUSSY-SAINT-GEORGES", "TORCY", "CHANTELOUP-EN-BRIE",
+            "MONTEVRAIN", "SERRIS", "CHESSY", "THORIGNY-SUR-MARNE", "POMPONNE", "COLLEGIEN"]
+FORMES = ["SAS", "SARL", "SASU", "EURL", "SCI", "Entrepreneur individuel", "SA"]
+NAF = ["6201Z", "4711D", "5610A", "4332A", "6831Z", "8559A", "4120A", "7022Z", "9602A", "4941A"]
+
+
+def build_synthetic_dataframe(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Fichier synthétique aux 27 colonnes du fichier Marne & Gondoire"""
+    rng = np.random.default_rng(seed)
+
+    def pick(values, missing_rate=0.0, missing_value=""):
+        col = rng.choice(values, size=rows).astype(object)
+        col[rng.random(rows) < missing_rate] = missing_value
+        return col
+
+    names = np.array([f"ENTREPRISE {i:05d}" for i in range(rows // 3 or 1)])
+    streets = np.array([f"{n} RUE DE LA GARE" for n in range(1, 200)])
+    first_names = np.array(["MARIE", "JEAN", "SOPHIE", "PIERRE", "LUCIE", "NICOLAS"])
+    websites = np.array([f"https://www.entreprise{i}.fr" for i in range(5000)])
+    dates = pd.to_datetime("2000-01-01") + pd.to_timedelta(rng.integers(0, 9000, rows), unit="D")
+
+    data = {
+        "Numéro de fiche": np.arange(rows),
+        "SIRET": rng.integers(10**13, 10**14 - 1, rows),
+        "Nom courant/Dénomination": pick(names, 0.02),
+        "Enseigne": pick(names, 0.6),
+        "Adresse - complément dʼadresse": pick(np.array(["BAT A", "ZAC DU GUE", "CENTRE COMMERCIAL"]), 0.85),
+        "Adresse - numéro et voie": pick(streets, 0.05),
+        "Adresse - distribution postale": np.where(rng.random(rows) < 0.95, np.nan, 77400.0),
+        "Adresse - CP et commune": pick(np.array([f"77400 {c}" for c in COMMUNES])),
+        "Commune": pick(np.array(COMMUNES)),
+        "Code NAF": pick(np.array(NAF)),
+        "Libellé NAF": pick(np.array([f"Activité {code}" for code in NAF])),
+        "Forme juridique": pick(np.array(FORMES)),
+        "Forme juridique agrégée": pick(np.array(["Société commerciale", "Entreprise individuelle"])),
+        "Année": rng.integers(2020, 2026, rows),
+        "Tranche effectif établissement": pick(np.array(["0 salarié", "1 à 2 salariés", "3 à 5 salariés"]), 0.3),
+        "Effectif réel établissement": rng.integers(0, 250, rows),
+        "Genre": pick(np.array(["M", "F"]), 0.4, NON_DIFFUSIBLE),
+        "Nom": pick(np.array(["MARTIN", "BERNARD", "DUBOIS", "THOMAS", "ROBERT"]), 0.4, NON_DIFFUSIBLE),
+        "Prénom": pick(first_names, 0.4, NON_DIFFUSIBLE),
+        "Date de création établissement": dates,
+        "Date annonce évènement juridique": dates,
+        "Date évènement juridique": dates,
+        "Libellé type évènement juridique": pick(np.array(["Création", "Modification", "Radiation"]), 0.5),
+        "Provenance": pick(np.array(["BODACC", "INSEE", "contact@greffe.fr"])),
+        "Texte annonce évènement juridique": pick(np.array([f"Annonce n°{i} capital {i * 100} euros" for i in range(3000)]), 0.5),
+        "Type de la source": pick(np.array(["Presse", "Registre"])),
+        "Site Web établissement": pick(websites, 0.9)
+    }
+
+    return pd.DataFrame(data)
+
+
+def time_profiler(analyze, df: pd.DataFrame, repeat: int):
+    """Meilleur temps sur `repeat` exécutions de l'analyse de toutes les colonnes"""
+    best = float("inf")
+    results = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = {col: analyze(df[col], col) for col in df.columns}
+        best = min(best, time.perf_counter() - start)
+
+    return best, results
+
+
+def compare_results(legacy: dict, vectorized: dict) -> list:
+    """Différences entre les deux implémentations (hors ordre des patterns)"""
+    differences = []
+
+    for col, old in legacy.items():
+        new = vectorized[col]
+        for key in ("missing_count", "present_count", "completion_rate", "detected_type", "enrichment_potential"):
+            if old[key] != new[key]:
+                differences.append(f"{col}.{key}: {old[key]} != {new[key]}")
+
+        if sorted(old["missing_patterns_detected"]) != sorted(new["missing_patterns_detected"]):
+            differences.append(f"{col}.missing_patterns_detected")
+
+        for key, value in old["content_analysis"].items():
+            if value != new["content_analysis"].get(key):
+                differences.append(f"{col}.content_analysis.{key}: {value!r} != {new['content_analysis'].get(key)!r}")
+
+    return differences
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du profileur de colonnes")
+    parser.add_argument("--rows", type=int, default=100_000, help="Nombre de lignes synthétiques")
+    parser.add_argument("--repeat", type=int, default=3, help="Nombre de répétitions (meilleur temps)")
+    args = parser.parse_args()
+
+    df = clean_dataframe(build_synthetic_dataframe(args.rows))
+    print(f"📊 Fichier synthétique: {len(df):,} lignes × {len(df.columns)} colonnes")
+
+    legacy_time, legacy_results = time_profiler(analyze_column_legacy, df, args.repeat)
+    vectorized_time, vectorized_results = time_profiler(analyze_column, df, args.repeat)
+
+    print(f"🐢 Multi-passes (legacy): {legacy_time:.3f}s")
+    print(f"🚀 Une passe (vectorisé): {vectorized_time:.3f}s")
+    print(f"⚡ Accélération: x{legacy_time / vectorized_time:.1f}")
+
+    differences = compare_results(legacy_results, vectorized_results)
+    if differences:
+        print(f"⚠️ {len(differences)} différence(s) de résultat:")
+        for difference in differences[:20]:
+            print(f"   - {difference}")
+    else:
+        print("✅ Résultats identiques")
+
+
+if __name__ == "__main__":
+    main()
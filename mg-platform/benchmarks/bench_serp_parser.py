@@ -0,0 +1,107 @@
+# ============================================================================
+# BENCHMARK PARSING DES RÉSULTATS - mg-platform/benchmarks/bench_serp_parser.py
+# ============================================================================
+
+"""
+Compare les backends de parsing des pages de résultats (SerpParser) sur des
+pages DuckDuckGo / Google enregistrées : latence par page et liens extraits
+identiques à ceux du parseur historique (BeautifulSoup html.parser).
+
+Les fixtures sont dans benchmarks/fixtures/serp/<moteur>_<requête>.html.
+
+Usage (depuis mg-platform/):
+    python benchmarks/bench_serp_parser.py --repeat 200
+    python benchmarks/bench_serp_parser.py --all-links
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mcp_server.tools.ai_agent.search.serp_parser import BACKENDS, SerpParser  # noqa: E402
+from mcp_server.tools.ai_agent.utils.validators import is_valid_business_website  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "serp"
+
+# Nombre de liens retenus par les moteurs (valeurs par défaut de WebSearchEngine)
+MAX_RESULTS = {"duckduckgo": 5, "google": 3}
+
+
+def load_fixtures() -> list:
+    """(nom, moteur, contenu) pour chaque page enregistrée"""
+    fixtures = []
+
+    for path in sorted(FIXTURES_DIR.glob("*.html")):
+        engine = path.stem.split("_", 1)[0]
+        if engine in MAX_RESULTS:
+            fixtures.append((path.stem, engine, path.read_bytes()))
+
+    return fixtures
+
+
+def time_backend(parser: SerpParser, engine: str, content: bytes, max_results: int, repeat: int):
+    """Médiane et meilleur temps (ms) d'un parsing sur `repeat` exécutions"""
+    timings = []
+    links = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        links = parser.parse_results(engine, content, max_results, is_valid_business_website)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings), min(timings), links
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du parsing des pages de résultats")
+    parser.add_argument("--repeat", type=int, default=100, help="Nombre de répétitions par page")
+    parser.add_argument("--all-links", action="store_true",
+                        help="Extraire tous les liens (sans arrêt à max_results)")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures()
+    if not fixtures:
+        print(f"❌ Aucune fixture dans {FIXTURES_DIR}")
+        return
+
+    # Backends réellement installés (resolve_backend remplace ceux qui manquent)
+    backends = [name for name in BACKENDS if SerpParser(name).backend == name]
+    print(f"📄 {len(fixtures)} page(s) de résultats, backends: {', '.join(backends)}")
+
+    differences = []
+
+    for name, engine, content in fixtures:
+        max_results = 1000 if args.all_links else MAX_RESULTS[engine]
+        print(f"\n🔎 {name} ({len(content) / 1024:.0f} Ko, max_results={max_results})")
+
+        reference_time = None
+        reference_links = None
+
+        for backend in reversed(backends):  # bs4 en premier : référence
+            median_ms, best_ms, links = time_backend(SerpParser(backend), engine, content, max_results, args.repeat)
+
+            if reference_time is None:
+                reference_time, reference_links = median_ms, links
+
+            speedup = reference_time / median_ms if median_ms else float("inf")
+            print(f"   {backend:<11} médiane {median_ms:8.3f} ms   meilleur {best_ms:8.3f} ms   "
+                  f"x{speedup:5.1f}   {len(links)} lien(s)")
+
+            if links != reference_links:
+                differences.append(f"{name} [{backend}]: {links} != {reference_links}")
+
+    print()
+    if differences:
+        print(f"⚠️ {len(differences)} différence(s) de résultat:")
+        for difference in differences[:20]:
+            print(f"   - {difference}")
+    else:
+        print("✅ Liens extraits identiques pour tous les backends")
+
+
+if __name__ == "__main__":
+    main()
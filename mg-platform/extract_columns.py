@@ -13,6 +13,8 @@ import os
 from pathlib import Path
 from datetime import datetime
 
+from mcp_server.tools.excel_cache import read_excel_cached
+
 def find_excel_file():
     """Trouve automatiquement le fichier Excel dans data/raw/"""
     try:
@@ -218,8 +220,8 @@ def extract_columns_analysis():
     print(f"📁 Fichier trouvé: {file_path}")
     
     try:
-        # Lire le fichier Excel
-        df = pd.read_excel(file_path, engine='openpyxl')
+        # Lire le fichier Excel (cache colonnaire si déjà parsé)
+        df = read_excel_cached(file_path)
         df = df.fillna('')  # Remplacer NaN par chaînes vides
         
         print(f"📊 Analyse de {len(df)} lignes × {len(df.columns)} colonnes...")
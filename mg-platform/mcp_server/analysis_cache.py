@@ -0,0 +1,190 @@
+# ============================================================================
+# CACHE DES RÉSULTATS D'ANALYSE - mcp_server/analysis_cache.py
+# ============================================================================
+
+"""
+Mémoïsation des résultats d'analyse de fichier
+- Clé = (empreinte du fichier, version de l'analyseur)
+- Mémoire (LRU borné) puis débordement JSON sur disque (data/cache/analysis/)
+- Un seul calcul même si plusieurs endpoints le demandent en même temps
+- Les résultats en erreur ne sont jamais mis en cache
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Statut renvoyé aux endpoints (header X-Analysis-Cache)
+CACHE_HIT = "hit"
+CACHE_DISK = "disk"
+CACHE_MISS = "miss"
+
+
+class AnalysisCache:
+    """Cache thread-safe des résultats de analyze_complete_file"""
+
+    def __init__(self, spill_dir: Optional[str] = None, max_entries: int = 16):
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "spill_errors": 0}
+
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._compute_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+    def get_or_compute(self, fingerprint: str, version: str,
+                       compute: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], str]:
+        """
+        Résultat d'analyse mémoïsé
+
+        Args:
+            fingerprint: Empreinte du fichier analysé
+            version: Version de l'analyseur (invalide le cache si elle change)
+            compute: Calcul à lancer en cas d'absence
+
+        Returns:
+            (résultat, statut) avec statut "hit", "disk" ou "miss"
+        """
+        key = (fingerprint, version)
+
+        result = self._get_memory(key)
+        if result is not None:
+            return result, CACHE_HIT
+
+        with self._lock:
+            compute_lock = self._compute_locks.setdefault(key, threading.Lock())
+
+        with compute_lock:
+            # Calculé par une requête concurrente pendant l'attente
+            result = self._get_memory(key)
+            if result is not None:
+                return result, CACHE_HIT
+
+            result = self._read_spill(key)
+            if result is not None:
+                self._put_memory(key, result)
+                with self._lock:
+                    self.stats["disk_hits"] += 1
+                return result, CACHE_DISK
+
+            try:
+                result = compute()
+            finally:
+                with self._lock:
+                    self._compute_locks.pop(key, None)
+
+            with self._lock:
+                self.stats["misses"] += 1
+
+            if "error" not in result:
+                self._put_memory(key, result)
+                self._write_spill(key, result)
+
+            return result, CACHE_MISS
+
+    def invalidate(self, fingerprint: Optional[str] = None) -> int:
+        """Supprime les résultats d'un fichier (tous si fingerprint absent), mémoire et disque"""
+        with self._lock:
+            keys = [key for key in self._entries if fingerprint is None or key[0] == fingerprint]
+            for key in keys:
+                del self._entries[key]
+
+        if self.spill_dir and self.spill_dir.exists():
+            pattern = f"{fingerprint[:16]}_*.json" if fingerprint else "*.json"
+            for spill_file in self.spill_dir.glob(pattern):
+                spill_file.unlink(missing_ok=True)
+
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Compteurs du cache"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_ratio"] = round((stats["hits"] + stats["disk_hits"]) / lookups, 3) if lookups else 0.0
+        stats["spill_dir"] = str(self.spill_dir) if self.spill_dir else None
+        return stats
+
+    def _get_memory(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+            return result
+
+    def _put_memory(self, key: Tuple[str, str], result: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _spill_path(self, key: Tuple[str, str]) -> Optional[Path]:
+        if not self.spill_dir:
+            return None
+        fingerprint, version = key
+        return self.spill_dir / f"{fingerprint[:16]}_{version}.json"
+
+    def _read_spill(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Relit un résultat débordé sur disque (ignoré s'il ne correspond pas à la clé)"""
+        path = self._spill_path(key)
+        if path is None or not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            path.unlink(missing_ok=True)
+            return None
+
+        if payload.get("fingerprint") != key[0] or payload.get("analyzer_version") != key[1]:
+            return None
+
+        return payload.get("result")
+
+    def _write_spill(self, key: Tuple[str, str], result: Dict[str, Any]):
+        """Écrit le résultat sur disque (écriture atomique)"""
+        path = self._spill_path(key)
+        if path is None:
+            return
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".json.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {"fingerprint": key[0], "analyzer_version": key[1], "result": result},
+                    f, ensure_ascii=False, default=str
+                )
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            with self._lock:
+                self.stats["spill_errors"] += 1
+
+
+# Instance partagée par processus
+_analysis_cache: Optional[AnalysisCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """
+    Retourne le cache du processus
+    Débordement disque dans ANALYSIS_CACHE_DIR (défaut data/cache/analysis, vide = désactivé)
+    """
+    global _analysis_cache
+
+    with _cache_lock:
+        if _analysis_cache is None:
+            default_dir = Path(__file__).resolve().parent.parent / "data" / "cache" / "analysis"
+            spill_dir = os.getenv("ANALYSIS_CACHE_DIR", str(default_dir))
+            _analysis_cache = AnalysisCache(spill_dir=spill_dir or None)
+
+    return _analysis_cache
@@ -0,0 +1,225 @@
+# ============================================================================
+# REGISTRE DES DATASETS EN MÉMOIRE - mcp_server/dataset_registry.py
+# ============================================================================
+
+"""
+Registre processus des DataFrames chargés par le serveur
+- Clé = empreinte du fichier Excel (chemin + mtime + taille + hash)
+- Une seule copie nettoyée + contexte colonnes (DataLoader.analyze_file_context)
+- Chargement unique même si plusieurs requêtes arrivent en même temps
+- Budget mémoire : éviction LRU des datasets les moins récemment utilisés
+- Les DataFrames servis sont partagés : les consommateurs ne doivent pas les modifier
+- Reconstruction après rechargement à chaud des outils (reset_dataset_registry)
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .tools.excel_cache import compute_file_fingerprint
+
+DEFAULT_MEMORY_BUDGET_MB = 512
+
+
+class DatasetRegistry:
+    """Registre thread-safe des datasets nettoyés, partagé par tous les endpoints"""
+
+    def __init__(self, memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB):
+        self.memory_budget_bytes = int(memory_budget_mb * 1024 * 1024)
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "evictions": 0}
+
+        # Import à la construction : un registre reconstruit après /tools/reload
+        # utilise le DataLoader rechargé, pas celui du premier import
+        from .tools.ai_agent.core.config import get_config
+        from .tools.ai_agent.data.loader import DataLoader
+
+        self._loader = DataLoader(get_config())
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, file_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retourne le dataset d'un fichier, chargé une seule fois par empreinte
+
+        Args:
+            file_path: Chemin du fichier Excel (auto-détection dans data/raw/ si absent)
+
+        Returns:
+            Entrée du registre : fingerprint, file_path, df, context, memory_bytes, ...
+        """
+        file_path = self._resolve_path(file_path)
+        fingerprint = compute_file_fingerprint(file_path)
+
+        entry = self._lookup(fingerprint)
+        if entry is not None:
+            return entry
+
+        # Un verrou par empreinte : les requêtes concurrentes attendent le même chargement
+        with self._lock:
+            load_lock = self._load_locks.setdefault(fingerprint, threading.Lock())
+
+        with load_lock:
+            entry = self._lookup(fingerprint, count_miss=False)
+            if entry is not None:
+                return entry
+
+            entry = self._load(file_path, fingerprint)
+
+            with self._lock:
+                self.stats["loads"] += 1
+                self._drop_other_versions(entry["file_path"], fingerprint)
+                self._entries[fingerprint] = entry
+                self._enforce_budget(keep=fingerprint)
+                self._load_locks.pop(fingerprint, None)
+
+        return entry
+
+    def reload(self, file_path: Optional[str] = None) -> Dict[str, Any]:
+        """Force le rechargement d'un fichier (purge toutes ses versions en mémoire)"""
+        file_path = self._resolve_path(file_path)
+        resolved = str(Path(file_path).resolve())
+
+        with self._lock:
+            for fingerprint in [fp for fp, e in self._entries.items() if e["file_path"] == resolved]:
+                del self._entries[fingerprint]
+                self.stats["evictions"] += 1
+
+        return self.get(file_path)
+
+    def evict(self, fingerprint: Optional[str] = None) -> int:
+        """
+        Retire un dataset du registre (tous si fingerprint absent)
+
+        Returns:
+            Nombre de datasets retirés
+        """
+        with self._lock:
+            if fingerprint is None:
+                count = len(self._entries)
+                self._entries.clear()
+            else:
+                count = 1 if self._entries.pop(fingerprint, None) is not None else 0
+
+            self.stats["evictions"] += count
+            return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques du registre et description des datasets chargés"""
+        with self._lock:
+            stats = dict(self.stats)
+            datasets = [self.describe(entry) for entry in self._entries.values()]
+
+        lookups = stats["hits"] + stats["misses"]
+        stats.update({
+            "hit_ratio": round(stats["hits"] / lookups, 3) if lookups else 0.0,
+            "datasets": datasets,
+            "memory_used_mb": round(sum(d["memory_mb"] for d in datasets), 2),
+            "memory_budget_mb": round(self.memory_budget_bytes / (1024 * 1024), 2)
+        })
+        return stats
+
+    @staticmethod
+    def describe(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Vue JSON d'une entrée (sans le DataFrame)"""
+        return {
+            "fingerprint": entry["fingerprint"],
+            "file_path": entry["file_path"],
+            "rows": len(entry["df"]),
+            "columns": len(entry["df"].columns),
+            "memory_mb": round(entry["memory_bytes"] / (1024 * 1024), 2),
+            "load_seconds": entry["load_seconds"],
+            "loaded_at": entry["loaded_at"],
+            "hits": entry["hits"]
+        }
+
+    def _resolve_path(self, file_path: Optional[str]) -> str:
+        """Chemin explicite ou auto-détection du fichier Excel"""
+        file_path = file_path or self._loader.find_excel_file()
+
+        if not file_path or not os.path.exists(file_path):
+            raise FileNotFoundError(f"Aucun fichier Excel trouvé ({file_path or 'data/raw/'})")
+
+        return file_path
+
+    def _lookup(self, fingerprint: str, count_miss: bool = True) -> Optional[Dict[str, Any]]:
+        """Entrée en mémoire (rafraîchit l'ordre LRU)"""
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+
+            if entry is None:
+                if count_miss:
+                    self.stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(fingerprint)
+            entry["hits"] += 1
+            entry["last_access"] = time.time()
+            self.stats["hits"] += 1
+            return entry
+
+    def _load(self, file_path: str, fingerprint: str) -> Dict[str, Any]:
+        """Lecture (via le cache colonnaire), nettoyage et contexte colonnes"""
+        start = time.time()
+
+        loader = type(self._loader)(self._loader.config)
+        df = loader.load_excel_file(file_path, fingerprint=fingerprint)
+
+        return {
+            "fingerprint": fingerprint,
+            "file_path": str(Path(file_path).resolve()),
+            "df": df,
+            "context": loader.file_context,
+            "memory_bytes": int(df.memory_usage(deep=True).sum()),
+            "load_seconds": round(time.time() - start, 3),
+            "loaded_at": time.time(),
+            "last_access": time.time(),
+            "hits": 0
+        }
+
+    def _drop_other_versions(self, file_path: str, fingerprint: str):
+        """Un fichier modifié remplace sa version précédente"""
+        for stale in [fp for fp, e in self._entries.items() if e["file_path"] == file_path and fp != fingerprint]:
+            del self._entries[stale]
+            self.stats["evictions"] += 1
+
+    def _enforce_budget(self, keep: str):
+        """Éviction LRU jusqu'à respecter le budget (le dataset courant est conservé)"""
+        used = sum(e["memory_bytes"] for e in self._entries.values())
+
+        for fingerprint in list(self._entries):
+            if used <= self.memory_budget_bytes:
+                break
+            if fingerprint == keep:
+                continue
+
+            used -= self._entries.pop(fingerprint)["memory_bytes"]
+            self.stats["evictions"] += 1
+
+
+# Instance partagée par processus
+_registry: Optional[DatasetRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_dataset_registry() -> DatasetRegistry:
+    """Retourne le registre du processus (budget via DATASET_MEMORY_BUDGET_MB)"""
+    global _registry
+
+    with _registry_lock:
+        if _registry is None:
+            budget = float(os.getenv("DATASET_MEMORY_BUDGET_MB", DEFAULT_MEMORY_BUDGET_MB))
+            _registry = DatasetRegistry(memory_budget_mb=budget)
+
+    return _registry
+
+
+def reset_dataset_registry():
+    """Abandonne le registre du processus (reconstruit au prochain accès, datasets relus)"""
+    global _registry
+
+    with _registry_lock:
+        _registry = None
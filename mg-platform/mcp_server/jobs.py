@@ -0,0 +1,272 @@
+# ============================================================================
+# GESTIONNAIRE DE JOBS EN ARRIÈRE-PLAN - mcp_server/jobs.py
+# ============================================================================
+
+"""
+Exécution des enrichissements hors requête HTTP
+- Soumission immédiate : un identifiant de job est renvoyé tout de suite
+- Pool de workers borné (JOBS_MAX_WORKERS), les jobs en trop attendent en file
+- États : queued -> running (<-> paused) -> succeeded | failed | cancelled
+- Progression mise à jour par l'agent, consultable via GET /jobs/{id}
+- Annulation / pause coopératives des jobs démarrés via leur jeton de contrôle
+- Historique borné des jobs terminés
+"""
+
+import os
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_PAUSED = "paused"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+TERMINAL_STATES = {JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED}
+
+
+class JobManager:
+    """File de jobs thread-safe adossée à un ThreadPoolExecutor borné"""
+
+    def __init__(self, max_workers: int = 2, max_history: int = 200):
+        self.max_workers = max_workers
+        self.max_history = max_history
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._futures: Dict[str, Future] = {}
+        self._controls: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, func: Callable[[Dict[str, Any]], Dict[str, Any]],
+               params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Soumet un job au pool
+
+        Args:
+            kind: Type de job (ex: "ai-agent/enrich")
+            func: Fonction exécutée dans un worker, reçoit le job et retourne un dict résultat
+                  (un résultat contenant "error" marque le job en échec)
+            params: Paramètres affichés dans le statut du job
+
+        Returns:
+            Vue publique du job créé
+        """
+        job_id = uuid.uuid4().hex[:12]
+        job = {
+            "id": job_id,
+            "kind": kind,
+            "status": JOB_QUEUED,
+            "params": params or {},
+            "created_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "progress": {},
+            "result": None,
+            "error": None,
+            "cancel_requested": False
+        }
+
+        with self._lock:
+            self._jobs[job_id] = job
+            self._prune_history()
+            self._futures[job_id] = self._executor.submit(self._run, job, func)
+
+        return self.describe(job)
+
+    def get(self, job_id: str, include_result: bool = True) -> Optional[Dict[str, Any]]:
+        """Vue publique d'un job (None si inconnu)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self.describe(job, include_result) if job else None
+
+    def get_future(self, job_id: str) -> Optional[Future]:
+        """Future du job, pour attendre sa fin (ex: asyncio.wrap_future)"""
+        with self._lock:
+            return self._futures.get(job_id)
+
+    def list_jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Jobs les plus récents d'abord (sans les résultats)"""
+        with self._lock:
+            jobs = list(self._jobs.values())[-limit:]
+            return [self.describe(job, include_result=False) for job in reversed(jobs)]
+
+    def attach_control(self, job_id: str, control: Any):
+        """
+        Associe un jeton de contrôle (RunControl) à un job démarré
+        Une annulation ou une pause demandée avant l'association est appliquée tout de suite.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+
+            self._controls[job_id] = control
+            if job["cancel_requested"]:
+                control.cancel("Job annulé")
+            elif job["status"] == JOB_PAUSED:
+                control.pause()
+
+    def cancel(self, job_id: str, reason: str = "Job annulé") -> Optional[Dict[str, Any]]:
+        """
+        Annule un job : immédiatement s'il est en file, au prochain point de contrôle s'il tourne
+
+        Returns:
+            Vue du job après tentative (None si inconnu) ; un job terminé n'est pas modifié
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+
+            future = self._futures.get(job_id)
+            if job["status"] == JOB_QUEUED and future is not None and future.cancel():
+                job["status"] = JOB_CANCELLED
+                job["finished_at"] = time.time()
+            elif job["status"] not in TERMINAL_STATES:
+                job["cancel_requested"] = True
+                control = self._controls.get(job_id)
+                if control is not None:
+                    control.cancel(reason)
+
+            return self.describe(job, include_result=False)
+
+    def pause(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Met en pause un job démarré (effectif au prochain point de contrôle)"""
+        return self._set_paused(job_id, True)
+
+    def resume(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Reprend un job en pause"""
+        return self._set_paused(job_id, False)
+
+    def _set_paused(self, job_id: str, paused: bool) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+
+            expected = JOB_RUNNING if paused else JOB_PAUSED
+            if job["status"] == expected and not job["cancel_requested"]:
+                job["status"] = JOB_PAUSED if paused else JOB_RUNNING
+                control = self._controls.get(job_id)
+                if control is not None and paused:
+                    control.pause()
+                elif control is not None:
+                    control.resume()
+
+            return self.describe(job, include_result=False)
+
+    def update_progress(self, job_id: str, event: Dict[str, Any]):
+        """Met à jour la progression d'un job à partir d'un événement de l'agent"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+
+            progress = job["progress"]
+            progress["last_event"] = event.get("type")
+            progress["last_message"] = event.get("message")
+            progress["updated_at"] = time.time()
+
+            if event.get("type") == "result":
+                progress["completed"] = event.get("completed", 0)
+                progress["total"] = event.get("total", 0)
+                progress["percentage"] = event.get("percentage", 0)
+                progress["succeeded"] = progress.get("succeeded", 0) + (1 if event.get("success") else 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Compteurs par état, file d'attente et workers"""
+        with self._lock:
+            counts = {state: 0 for state in (JOB_QUEUED, JOB_RUNNING, JOB_PAUSED, JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)}
+            for job in self._jobs.values():
+                counts[job["status"]] += 1
+
+        return {
+            "max_workers": self.max_workers,
+            "queue_depth": counts[JOB_QUEUED],
+            "in_flight": counts[JOB_RUNNING] + counts[JOB_PAUSED],
+            "by_status": counts
+        }
+
+    @staticmethod
+    def describe(job: Dict[str, Any], include_result: bool = True) -> Dict[str, Any]:
+        """Copie publique d'un job (durées calculées)"""
+        view = {key: value for key, value in job.items() if key != "result"}
+        view["progress"] = dict(job["progress"])
+
+        if job["started_at"]:
+            end = job["finished_at"] or time.time()
+            view["duration_seconds"] = round(end - job["started_at"], 1)
+
+        if include_result:
+            view["result"] = job["result"]
+
+        return view
+
+    def _run(self, job: Dict[str, Any], func: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        """Exécution d'un job dans un worker"""
+        with self._lock:
+            job["status"] = JOB_RUNNING
+            job["started_at"] = time.time()
+
+        try:
+            result = func(job)
+            error = result.get("error") if isinstance(result, dict) else None
+            if isinstance(result, dict) and result.get("cancelled"):
+                status = JOB_CANCELLED
+            else:
+                status = JOB_FAILED if error else JOB_SUCCEEDED
+        except Exception as e:
+            result = None
+            error = f"{type(e).__name__}: {str(e)}"
+            status = JOB_FAILED
+            traceback.print_exc()
+
+        with self._lock:
+            job.update({
+                "status": status,
+                "result": result,
+                "error": error,
+                "finished_at": time.time()
+            })
+            self._controls.pop(job["id"], None)
+
+        return result
+
+    def _prune_history(self):
+        """Oublie les jobs terminés les plus anciens au-delà de max_history"""
+        overflow = len(self._jobs) - self.max_history
+
+        for job_id in list(self._jobs):
+            if overflow <= 0:
+                break
+            if self._jobs[job_id]["status"] in TERMINAL_STATES:
+                del self._jobs[job_id]
+                self._futures.pop(job_id, None)
+                overflow -= 1
+
+    def shutdown(self, wait: bool = False):
+        """Arrête le pool (les jobs en file sont abandonnés)"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Instance partagée par processus
+_job_manager: Optional[JobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """Retourne le gestionnaire de jobs du processus (JOBS_MAX_WORKERS workers)"""
+    global _job_manager
+
+    with _manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager(max_workers=int(os.getenv("JOBS_MAX_WORKERS", 2)))
+
+    return _job_manager
@@ -1,6 +1,6 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
 import uvicorn
 import os
 from dotenv import load_dotenv
@@ -9,13 +9,83 @@ from typing import List, Optional
 import json
 import asyncio
 import time
-from concurrent.futures import ThreadPoolExecutor
-import queue
+import sys
 import threading
+from pathlib import Path
+
+# Racine du projet importable (lancement via "python main.py" depuis mcp_server/)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from mcp_server.dataset_registry import get_dataset_registry, reset_dataset_registry
+from mcp_server.analysis_cache import get_analysis_cache
+from mcp_server.tool_registry import get_tool_registry
+from mcp_server.progress_bus import get_progress_bus
+from mcp_server.jobs import get_job_manager
+from mcp_server.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, get_metrics_registry
 
 # Charger les variables d'environnement
 load_dotenv()
-progress_updates = {}  # session_id -> queue
+
+# Progression temps réel : une file asyncio par stream SSE
+progress_bus = get_progress_bus()
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("STREAM_HEARTBEAT_SECONDS", 5))
+
+# Jobs d'enrichissement exécutés hors requête HTTP (pool borné)
+job_manager = get_job_manager()
+
+# Modules outils chargés une seule fois (rechargement à chaud via /tools/reload)
+tool_registry = get_tool_registry()
+
+# Métriques Prometheus (GET /metrics)
+metrics_registry = get_metrics_registry()
+http_requests_total = metrics_registry.counter(
+    "mcp_http_requests_total", "Requêtes HTTP par route et statut", ("method", "route", "status")
+)
+http_request_duration = metrics_registry.histogram(
+    "mcp_http_request_duration_seconds", "Latence HTTP par route (jusqu'aux en-têtes de réponse)", ("method", "route")
+)
+http_requests_in_flight = metrics_registry.gauge("mcp_http_requests_in_flight", "Requêtes HTTP en cours")
+
+
+def get_shared_dataset(file_path: Optional[str] = None) -> dict:
+    """Dataset nettoyé du registre processus (chargé une seule fois par empreinte)"""
+    return get_dataset_registry().get(file_path)
+
+
+def get_agent_store():
+    """Store d'enrichissement partagé avec l'agent (None si désactivé)"""
+    ai_agent_module = tool_registry.get_module("ai_agent")
+    return ai_agent_module.get_enrichment_store(ai_agent_module.DEFAULT_CONFIG)
+
+
+def get_session_metrics(session_id: Optional[str] = None) -> Optional[dict]:
+    """Métriques structurées d'une session (vivantes en mémoire, sinon persistées dans le store)"""
+    ai_agent_module = tool_registry.get_module("ai_agent")
+    return ai_agent_module.get_session_index(get_agent_store()).get(session_id)
+
+
+def get_shared_analysis(data_analyzer, response: Optional[Response] = None) -> dict:
+    """
+    Analyse complète du dataset partagé, mémoïsée par (empreinte, version analyseur)
+    Les endpoints de rapport ne font plus que du formatage.
+    """
+    dataset = get_shared_dataset()
+    version = getattr(data_analyzer, "ANALYZER_VERSION", "0")
+    
+    result, cache_status = get_analysis_cache().get_or_compute(
+        dataset["fingerprint"],
+        version,
+        lambda: data_analyzer.analyze_complete_file(file_path=dataset["file_path"], df=dataset["df"])
+    )
+    
+    if response is not None:
+        response.headers["X-Analysis-Cache"] = cache_status
+        response.headers["X-Analysis-Fingerprint"] = dataset["fingerprint"][:16]
+        response.headers["X-Analyzer-Version"] = version
+    
+    return result
 
 
 # Configuration de l'application
@@ -36,6 +106,112 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Latence et statut par route (template de la route, cardinalité bornée)"""
+    start = time.perf_counter()
+    http_requests_in_flight.inc()
+    status = 500
+    
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        http_requests_in_flight.inc(-1)
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", "unmatched")
+        http_requests_total.inc(method=request.method, route=route_path, status=status)
+        http_request_duration.observe(time.perf_counter() - start, method=request.method, route=route_path)
+
+
+def collect_job_metrics(registry):
+    """Jobs d'enrichissement : en cours, file d'attente, par statut"""
+    stats = job_manager.get_stats()
+    registry.gauge("mcp_jobs_in_flight", "Jobs en cours d'exécution (running + paused)").set(stats["in_flight"])
+    registry.gauge("mcp_jobs_queue_depth", "Jobs en file d'attente").set(stats["queue_depth"])
+    registry.gauge("mcp_jobs_max_workers", "Workers du pool de jobs").set(stats["max_workers"])
+    by_status = registry.gauge("mcp_jobs", "Jobs connus par statut (historique borné)", ("status",))
+    for status, count in stats["by_status"].items():
+        by_status.set(count, status=status)
+
+
+def collect_search_metrics(registry):
+    """Compteurs de recherche de l'agent IA : moteurs, limiteur, caches"""
+    snapshot = tool_registry.get_module("ai_agent").get_search_stats().snapshot()
+    
+    search_requests = registry.counter(
+        "mcp_search_requests_total", "Requêtes HTTP de recherche par moteur et statut", ("engine", "status")
+    )
+    for (engine, status), count in snapshot["requests"].items():
+        search_requests.set(count, engine=engine, status=status)
+    
+    waits = registry.counter("mcp_rate_limit_waits_total", "Passages par le limiteur de débit", ("engine",))
+    delayed = registry.counter("mcp_rate_limit_delayed_total", "Requêtes retardées par le limiteur", ("engine",))
+    wait_seconds = registry.counter("mcp_rate_limit_wait_seconds_total", "Attente imposée par le limiteur", ("engine",))
+    for engine, stats in snapshot["rate_limit_waits"].items():
+        waits.set(stats["count"], engine=engine)
+        delayed.set(stats["delayed"], engine=engine)
+        wait_seconds.set(round(stats["seconds"], 3), engine=engine)
+    
+    # Budgets du limiteur partagé : ralentissements demandés et backoff en cours par source
+    throttled = registry.counter("mcp_rate_limit_throttled_total", "Réponses HTTP 202 / 429 reçues", ("source",))
+    backoff = registry.gauge("mcp_rate_limit_backoff_factor", "Multiplicateur d'intervalle en cours", ("source",))
+    for source, stats in tool_registry.get_module("ai_agent").get_rate_limiter_stats().items():
+        throttled.set(stats["throttled"], source=source)
+        backoff.set(stats["backoff_factor"], source=source)
+    
+    # Disjoncteurs des moteurs : 0 fermé, 1 demi-ouvert (sonde), 2 ouvert
+    circuit_state = registry.gauge("mcp_circuit_breaker_state", "État du disjoncteur (0 fermé, 1 sonde, 2 ouvert)", ("engine",))
+    circuit_trips = registry.counter("mcp_circuit_breaker_trips_total", "Ouvertures du disjoncteur", ("engine",))
+    circuit_rejected = registry.counter("mcp_circuit_breaker_rejected_total", "Requêtes évitées circuit ouvert", ("engine",))
+    for engine, stats in tool_registry.get_module("ai_agent").get_circuit_breaker_stats().items():
+        circuit_state.set({"closed": 0, "half_open": 1, "open": 2}[stats["state"]], engine=engine)
+        circuit_trips.set(stats["trips"], engine=engine)
+        circuit_rejected.set(stats["rejected"], engine=engine)
+    
+    # Ordonnanceur des pages candidates : créneaux occupés, attentes, robots.txt
+    fetch_stats = tool_registry.get_module("ai_agent").get_fetch_scheduler_stats()
+    if fetch_stats:
+        registry.gauge("mcp_fetch_in_flight", "Pages candidates en cours de téléchargement").set(fetch_stats["in_flight"])
+        registry.gauge("mcp_fetch_queued", "Téléchargements en attente d'un créneau").set(fetch_stats["queued"])
+        registry.counter("mcp_fetch_slot_wait_seconds_total", "Attente des créneaux par hôte").set(fetch_stats["wait_seconds"])
+        registry.counter("mcp_fetch_robots_disallowed_total", "Pages ignorées (robots.txt)").set(fetch_stats["robots_disallowed"])
+    
+    page_downloads = registry.counter("mcp_page_downloads_total", "Corps de pages candidates lus par issue", ("outcome",))
+    for outcome, count in snapshot["page_downloads"].items():
+        page_downloads.set(count, outcome=outcome)
+    registry.counter("mcp_page_bytes_read_total", "Octets de pages lus (décompressés)").set(snapshot["page_bytes"]["read"])
+    registry.counter("mcp_page_bytes_saved_total", "Octets de pages non téléchargés (plafond, non HTML)").set(
+        snapshot["page_bytes"]["saved"]
+    )
+    
+    cache_lookups = registry.counter("mcp_cache_lookups_total", "Consultations des caches par issue", ("cache", "outcome"))
+    hit_ratio = registry.gauge("mcp_cache_hit_ratio", "Part des consultations servies par le cache", ("cache",))
+    totals = {}
+    for (cache, outcome), count in snapshot["cache_lookups"].items():
+        cache_lookups.set(count, cache=cache, outcome=outcome)
+        hits, lookups = totals.get(cache, (0, 0))
+        totals[cache] = (hits + (count if outcome == "hit" else 0), lookups + count)
+    for cache, (hits, lookups) in totals.items():
+        hit_ratio.set(round(hits / lookups, 4) if lookups else 0.0, cache=cache)
+
+
+def collect_analysis_cache_metrics(registry):
+    """Cache des analyses de dataset du serveur (mêmes familles que les caches de recherche)"""
+    stats = get_analysis_cache().get_stats()
+    cache_lookups = registry.counter("mcp_cache_lookups_total", "Consultations des caches par issue", ("cache", "outcome"))
+    for key, outcome in (("hits", "hit"), ("disk_hits", "disk_hit"), ("misses", "miss")):
+        cache_lookups.set(stats[key], cache="analysis", outcome=outcome)
+    registry.gauge("mcp_cache_hit_ratio", "Part des consultations servies par le cache", ("cache",)).set(
+        stats["hit_ratio"], cache="analysis"
+    )
+
+
+metrics_registry.add_collector(collect_job_metrics)
+metrics_registry.add_collector(collect_search_metrics)
+metrics_registry.add_collector(collect_analysis_cache_metrics)
+
 # Routes principales
 @app.get("/")
 async def root():
@@ -60,6 +236,11 @@ async def root():
         ]
     }
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Métriques du serveur au format texte Prometheus"""
+    return PlainTextResponse(metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
+
 @app.get("/health")
 async def health_check():
     """Vérification de l'état du serveur"""
@@ -67,6 +248,8 @@ async def health_check():
         "status": "healthy",
         "service": "mg-data-mcp",
         "uptime": "running",
+        "uptime_seconds": round(time.time() - metrics_registry.started_at, 1),
+        "jobs": job_manager.get_stats(),
         "components": {
             "server": "✅ Actif",
             "basic_tools": "✅ Disponible",
@@ -75,31 +258,14 @@ async def health_check():
     }
 
 @app.get("/analyze-advanced")
-async def analyze_advanced():
+async def analyze_advanced(response: Response):
     """Analyse avancée avec détection précise des opportunités LinkedIn"""
     try:
-        # Import direct du fichier
-        import os
-        import importlib.util
-        
-        # Chemin vers le fichier data_analyzer.py
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        analyzer_path = os.path.join(current_dir, "tools", "data_analyzer.py")
-        
-        if not os.path.exists(analyzer_path):
-            return {
-                "error": f"Fichier non trouvé: {analyzer_path}",
-                "current_dir": current_dir,
-                "tools_exists": os.path.exists(os.path.join(current_dir, "tools"))
-            }
-        
-        # Charger le module dynamiquement
-        spec = importlib.util.spec_from_file_location("data_analyzer", analyzer_path)
-        data_analyzer = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(data_analyzer)
+        # Module chargé une seule fois par le registre d'outils
+        data_analyzer = tool_registry.get_module("data_analyzer")
         
         # Appeler la fonction
-        result = data_analyzer.analyze_data_gaps_advanced()
+        result = get_shared_analysis(data_analyzer, response)
         return result
         
     except Exception as e:
@@ -113,7 +279,7 @@ async def analyze_advanced():
 async def test_basic_functionality():
     """Test des fonctionnalités de base"""
     try:
-        from mcp_server.tools.basic import get_project_status
+        get_project_status = tool_registry.get("basic", "get_project_status")
         status = get_project_status()
         
         return {
@@ -144,11 +310,11 @@ async def project_info():
     }
 
 @app.get("/analyze-advanced")
-async def analyze_advanced():
+async def analyze_advanced(response: Response):
     """Analyse avancée avec détection précise des opportunités LinkedIn"""
     try:
-        from mcp_server.tools.data_analyzer import analyze_data_gaps_advanced
-        result = analyze_data_gaps_advanced()
+        data_analyzer = tool_registry.get_module("data_analyzer")
+        result = get_shared_analysis(data_analyzer, response)
         return result
     except ImportError as e:
         return {
@@ -161,20 +327,12 @@ async def analyze_advanced():
         }
 
 @app.get("/analyze-color", response_class=PlainTextResponse)
-async def analyze_with_colors():
+async def analyze_with_colors(response: Response):
     """Version avec codes couleur ANSI pour terminal"""
     try:
-        import os
-        import importlib.util
-        
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        analyzer_path = os.path.join(current_dir, "tools", "data_analyzer.py")
+        data_analyzer = tool_registry.get_module("data_analyzer")
         
-        spec = importlib.util.spec_from_file_location("data_analyzer", analyzer_path)
-        data_analyzer = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(data_analyzer)
-        
-        result = data_analyzer.analyze_data_gaps_advanced()
+        result = get_shared_analysis(data_analyzer, response)
         
         if "error" in result:
             return f"\033[91m❌ ERREUR: {result['error']}\033[0m"
@@ -190,22 +348,29 @@ async def analyze_with_colors():
         BOLD = '\033[1m'
         END = '\033[0m'
         
+        # Opportunités triées par gain estimé (format analyze_complete_file)
+        top_priorities = sorted(
+            ({"column": col, **data} for col, data in result['enrichment_opportunities'].items()),
+            key=lambda priority: priority['estimated_gain'],
+            reverse=True
+        )
+        
         report = f"""
 {BOLD}{CYAN}🚀 ANALYSE MARNE & GONDOIRE{END}
 {CYAN}{'='*50}{END}
 
 {BOLD}📁 FICHIER:{END}
-  {result['file_info']['name']}
-  {GREEN}{result['file_info']['total_companies']:,} entreprises{END} | {result['file_info']['total_columns']} colonnes
+  {result['file_info']['filename']}
+  {GREEN}{result['file_info']['total_rows']:,} entreprises{END} | {result['file_info']['total_columns']} colonnes
 
 {BOLD}📊 VUE D'ENSEMBLE:{END}
-  Complétion moyenne: {GREEN if result['global_stats']['average_completion_rate'] > 70 else YELLOW}{result['global_stats']['average_completion_rate']}%{END}
-  Champs manquants: {RED}{result['global_stats']['total_missing_fields']:,}{END}
+  Complétion moyenne: {GREEN if result['global_stats']['overall_completion_rate'] > 70 else YELLOW}{result['global_stats']['overall_completion_rate']}%{END}
+  Champs manquants: {RED}{result['global_stats']['missing_cells']:,}{END}
 
 {BOLD}{RED}🔥 TOP OPPORTUNITÉS LINKEDIN:{END}
 """
         
-        for i, priority in enumerate(result['top_priorities'][:3], 1):
+        for i, priority in enumerate(top_priorities[:3], 1):
             priority_color = RED if "CRITIQUE" in priority['priority'] else YELLOW if "HAUTE" in priority['priority'] else GREEN
             report += f"""
                 {BOLD}{i}. {priority['column']}{END}
@@ -214,13 +379,13 @@ async def analyze_with_colors():
             """
 
         # Sites web spécifiquement
-        site_priority = result['top_priorities'][0]
-        if 'site' in site_priority['column'].lower():
+        site_priority = top_priorities[0] if top_priorities else None
+        if site_priority and 'site' in site_priority['column'].lower():
             report += f"""
                 {BOLD}{GREEN}💰 JACKPOT SITES WEB:{END}
-                {RED}{site_priority['missing_count']:,}{END} sites manquants sur {result['file_info']['total_companies']:,}
+                {RED}{site_priority['missing_count']:,}{END} sites manquants sur {result['file_info']['total_rows']:,}
                 {GREEN}{site_priority['estimated_gain']:,}{END} sites récupérables via LinkedIn
-                {YELLOW}Temps estimé: {result['batch_strategy']['estimated_processing_time']}{END}
+                {YELLOW}Temps estimé: {max(1, site_priority['estimated_gain'] // 60)} minutes{END}
             """
 
         report += f"""
@@ -239,26 +404,13 @@ async def analyze_with_colors():
 
 
 @app.get("/analyze-complete", response_class=PlainTextResponse)
-async def analyze_complete():
+async def analyze_complete(response: Response):
     """Analyse complète de TOUTES les colonnes avec rapport détaillé"""
     try:
-        # Import direct du module
-        import os
-        import importlib.util
-        
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        analyzer_path = os.path.join(current_dir, "tools", "data_analyzer.py")
-        
-        if not os.path.exists(analyzer_path):
-            return f"❌ Fichier data_analyzer.py non trouvé"
-        
-        # Charger le module
-        spec = importlib.util.spec_from_file_location("data_analyzer", analyzer_path)
-        data_analyzer = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(data_analyzer)
+        data_analyzer = tool_registry.get_module("data_analyzer")
         
         # Lancer l'analyse complète
-        result = data_analyzer.analyze_complete_file()
+        result = get_shared_analysis(data_analyzer, response)
         
         if "error" in result:
             return f"❌ ERREUR: {result['error']}"
@@ -384,33 +536,25 @@ Vérifiez l'endpoint analyze-complete dans main.py
 # ============================================================================
 
 @app.get("/analyze-summary", response_class=PlainTextResponse)
-async def analyze_summary():
+async def analyze_summary(response: Response):
     """Analyse rapide avec résumé des colonnes les plus importantes"""
     try:
-        import os
-        import importlib.util
-        
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        analyzer_path = os.path.join(current_dir, "tools", "data_analyzer.py")
+        data_analyzer = tool_registry.get_module("data_analyzer")
         
-        spec = importlib.util.spec_from_file_location("data_analyzer", analyzer_path)
-        data_analyzer = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(data_analyzer)
-        
-        result = data_analyzer.analyze_complete_file()
+        result = get_shared_analysis(data_analyzer, response)
         
         if "error" in result:
             return f"❌ ERREUR: {result['error']}"
         
         # Rapport condensé
         report = f"""
-📊 RÉSUMÉ D'ANALYSE - {result['file_info']['name']}
+📊 RÉSUMÉ D'ANALYSE - {result['file_info']['filename']}
 {'='*60}
 
 📈 VUE D'ENSEMBLE
   Fichier: {result['file_info']['total_rows']:,} lignes × {result['file_info']['total_columns']} colonnes
-  Qualité: {result['data_quality_report']['overall_grade']}
-  Complétion: {result['data_quality_report']['average_completion']}%
+  Cellules vides: {result['global_stats']['missing_cells']:,}
+  Complétion: {result['global_stats']['overall_completion_rate']}%
 
 🎯 TOP 5 OPPORTUNITÉS D'ENRICHISSEMENT
 {'='*60}
@@ -424,13 +568,13 @@ async def analyze_summary():
                 report += f"""
 {i}. {col}
    🔴 Manquants: {data['missing_count']:,} | 🎯 Récupérables: {data['estimated_gain']:,}
-   💪 Faisabilité: {data['feasibility_score']}% | Sources: {data['sources'][0]}
+   📊 Priorité: {data['priority']} | Sources: {', '.join(data['sources']) or '-'}
 """
         else:
             report += "\n✅ Aucune opportunité majeure détectée - données bien complètes !"
         
         # Colonnes parfaites
-        perfect_columns = [col for col, data in result['complete_column_analysis'].items() 
+        perfect_columns = [col for col, data in result['all_columns_analysis'].items() 
                           if data['completion_rate'] == 100.0]
         
         report += f"""
@@ -454,20 +598,12 @@ async def analyze_summary():
 # ============================================================================
 
 @app.get("/analyze-comparison", response_class=PlainTextResponse)  
-async def analyze_comparison():
+async def analyze_comparison(response: Response):
     """Compare l'état actuel avec le potentiel après enrichissement"""
     try:
-        import os
-        import importlib.util
-        
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        analyzer_path = os.path.join(current_dir, "tools", "data_analyzer.py")
+        data_analyzer = tool_registry.get_module("data_analyzer")
         
-        spec = importlib.util.spec_from_file_location("data_analyzer", analyzer_path)
-        data_analyzer = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(data_analyzer)
-        
-        result = data_analyzer.analyze_complete_file()
+        result = get_shared_analysis(data_analyzer, response)
         
         if "error" in result:
             return f"❌ ERREUR: {result['error']}"
@@ -476,7 +612,7 @@ async def analyze_comparison():
 📊 COMPARAISON AVANT/APRÈS ENRICHISSEMENT
 {'='*70}
 
-📁 {result['file_info']['name']} - {result['file_info']['total_rows']:,} entreprises
+📁 {result['file_info']['filename']} - {result['file_info']['total_rows']:,} entreprises
 """
         
         # Analyse avant/après pour chaque colonne enrichissable
@@ -546,6 +682,132 @@ Vos données sont déjà très complètes ! Pas d'amélioration significative po
     except Exception as e:
         return f"❌ ERREUR: {str(e)}"
 
+# ============================================================================
+# REGISTRE DES DATASETS (DataFrames partagés entre endpoints)
+# ============================================================================
+
+@app.get("/datasets")
+async def list_datasets():
+    """Datasets en mémoire, occupation et budget du registre + cache d'analyse"""
+    stats = get_dataset_registry().get_stats()
+    stats["analysis_cache"] = get_analysis_cache().get_stats()
+    return stats
+
+@app.post("/datasets/reload")
+async def reload_dataset(file_path: Optional[str] = Query(None, description="Fichier Excel (auto-détection si absent)")):
+    """Force la relecture d'un fichier (et le recalcul de son analyse)"""
+    try:
+        registry = get_dataset_registry()
+        entry = registry.reload(file_path)
+        get_analysis_cache().invalidate(entry["fingerprint"])
+        return {"status": "reloaded", "dataset": registry.describe(entry)}
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@app.delete("/datasets")
+async def evict_datasets(fingerprint: Optional[str] = Query(None, description="Empreinte à retirer (toutes si absent)")):
+    """Libère la mémoire d'un ou de tous les datasets"""
+    evicted = get_dataset_registry().evict(fingerprint)
+    
+    if fingerprint and not evicted:
+        raise HTTPException(status_code=404, detail=f"Dataset {fingerprint} non chargé")
+    
+    return {"status": "evicted", "count": evicted}
+
+# ============================================================================
+# JOBS EN ARRIÈRE-PLAN
+# ============================================================================
+
+@app.get("/jobs")
+async def list_jobs(limit: int = Query(50, description="Nombre de jobs récents")):
+    """Jobs récents et état du pool de workers"""
+    return {"stats": job_manager.get_stats(), "jobs": job_manager.list_jobs(limit)}
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, include_result: bool = Query(True, description="Inclure le résultat complet")):
+    """État, progression et résultat d'un job"""
+    job = job_manager.get(job_id, include_result)
+    
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} inconnu")
+    
+    return job
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """
+    Annule un job : immédiatement s'il est en file, sinon au prochain point de contrôle
+    (entre deux entreprises ou deux requêtes de recherche)
+    """
+    job = job_manager.cancel(job_id, "Annulation demandée par l'opérateur")
+    
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} inconnu")
+    
+    if job["status"] != "cancelled" and not job["cancel_requested"]:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} déjà {job['status']}")
+    
+    return job
+
+@app.post("/jobs/{job_id}/pause")
+async def pause_job(job_id: str):
+    """Suspend un job en cours au prochain point de contrôle"""
+    job = job_manager.pause(job_id)
+    
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} inconnu")
+    
+    if job["status"] != "paused":
+        raise HTTPException(status_code=409, detail=f"Job {job_id} {job['status']} - pause impossible")
+    
+    return job
+
+@app.post("/jobs/{job_id}/resume")
+async def resume_job(job_id: str):
+    """Reprend un job en pause"""
+    job = job_manager.resume(job_id)
+    
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} inconnu")
+    
+    if job["status"] != "running":
+        raise HTTPException(status_code=409, detail=f"Job {job_id} {job['status']} - reprise impossible")
+    
+    return job
+
+# ============================================================================
+# REGISTRE DES OUTILS (modules chargés une fois, rechargement à chaud)
+# ============================================================================
+
+@app.get("/tools")
+async def list_tools():
+    """Modules outils connus et état de chargement"""
+    return tool_registry.list_tools()
+
+@app.post("/tools/reload")
+async def reload_tools(name: Optional[str] = Query(None, description="Outil à recharger (tous si absent)")):
+    """Rechargement à chaud des modules outils (développement, DEBUG=true explicite)"""
+    if os.getenv("DEBUG", "false").lower() != "true":
+        raise HTTPException(status_code=403, detail="Rechargement à chaud réservé au mode DEBUG")
+    
+    try:
+        reloaded = tool_registry.reload(name)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur rechargement: {str(e)}")
+    
+    # Registres construits avec l'ancien code : reconstruits au prochain accès
+    rebuilt = []
+    if "ai_agent" in reloaded:
+        reset_dataset_registry()
+        rebuilt.append("datasets")
+    if "data_analyzer" in reloaded:
+        get_analysis_cache().invalidate()
+        rebuilt.append("analysis_cache")
+    
+    return {"status": "reloaded", "tools": reloaded, "rebuilt": rebuilt, "registry": tool_registry.list_tools()}
+
 # ============================================================================
 # ENDPOINTS AGENT IA - À ajouter dans mcp_server/main.py
 # ============================================================================
@@ -554,10 +816,16 @@ Vos données sont déjà très complètes ! Pas d'amélioration significative po
 async def run_ai_agent_enrichment(
     sample_size: int = Query(10, description="Nombre d'entreprises à traiter"),
     quality_threshold: int = Query(85, description="Seuil de qualité minimum (%)"),
-    test_mode: bool = Query(True, description="Mode test sécurisé")
+    test_mode: bool = Query(True, description="Mode test sécurisé"),
+    resume_session: Optional[str] = Query(None, description="Session à reprendre depuis son checkpoint"),
+    incremental: bool = Query(False, description="Ne traiter que les lignes nouvelles, modifiées ou périmées")
 ):
     """
-    🤖 Lance l'Agent IA autonome d'enrichissement
+    🤖 Lance l'Agent IA autonome d'enrichissement (job en arrière-plan)
+    Retourne immédiatement un job_id à suivre via GET /jobs/{job_id}
+    Avec resume_session, les entreprises déjà enregistrées dans le checkpoint sont sautées.
+    Avec incremental, l'échantillon est pris parmi les lignes à retraiter : les SIRET déjà enrichis
+    (contenu inchangé, résultat récent) sont écartés, les échecs retentés après un délai court.
     """
     try:
         # Sécurité mode test
@@ -567,133 +835,215 @@ async def run_ai_agent_enrichment(
                 "suggestion": "Désactiver test_mode pour traitement plus large"
             }
         
-        # Import direct du fichier ai_agent.py (CORRIGÉ)
-        import os
-        import importlib.util
-        
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        agent_path = os.path.join(current_dir, "tools", "ai_agent.py")
-        
-        if not os.path.exists(agent_path):
-            return {
-                "error": "Agent IA non trouvé",
-                "solution": "Créez le fichier mcp_server/tools/ai_agent.py",
-                "path_checked": agent_path
-            }
+        ai_agent_module = tool_registry.get_module("ai_agent")
         
-        # Charger le module ai_agent dynamiquement
-        spec = importlib.util.spec_from_file_location("ai_agent", agent_path)
-        ai_agent_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(ai_agent_module)
+        # resume_session sert de nom de fichier (checkpoint, sortie Excel, journal)
+        if resume_session is not None:
+            if not ai_agent_module.CheckpointStore.is_valid_session_id(resume_session):
+                raise HTTPException(status_code=400, detail="Identifiant de session invalide")
+            checkpoint = ai_agent_module.CheckpointStore.from_config(ai_agent_module.DEFAULT_CONFIG, resume_session)
+            if checkpoint is None or not checkpoint.exists():
+                raise HTTPException(status_code=404, detail=f"Aucun checkpoint pour la session {resume_session}")
         
-        # Lancer l'enrichissement IA
-        result = ai_agent_module.run_ai_enrichment_agent(sample_size)
+        def enrichment_job(job):
+            # Jeton d'annulation / pause piloté par /jobs/{id}
+            run_control = ai_agent_module.RunControl()
+            job_manager.attach_control(job["id"], run_control)
+            
+            # Dataset partagé avec les endpoints /analyze-*
+            dataset = get_shared_dataset()
+            
+            return ai_agent_module.run_ai_enrichment_agent(
+                sample_size,
+                df=dataset["df"],
+                file_context=dataset["context"],
+                progress_callback=lambda event: job_manager.update_progress(job["id"], event),
+                run_control=run_control,
+                resume_session=resume_session,
+                incremental=incremental
+            )
+        
+        # Soumission immédiate : le client suit le job via GET /jobs/{id}
+        job = job_manager.submit(
+            "ai-agent/enrich", enrichment_job,
+            params={"sample_size": sample_size, "test_mode": test_mode, "resume_session": resume_session,
+                    "incremental": incremental}
+        )
         
-        return result
+        return JSONResponse(status_code=202, content={
+            "job_id": job["id"],
+            "status": job["status"],
+            "status_url": f"/jobs/{job['id']}",
+            "message": "Enrichissement soumis - suivre la progression via GET /jobs/{id}"
+        })
         
+    except HTTPException:
+        raise
     except Exception as e:
         return {
             "error": f"Erreur Agent IA: {str(e)}",
             "error_type": type(e).__name__,
             "current_dir": os.path.dirname(os.path.abspath(__file__)),
-            "suggestion": "Vérifiez que ai_agent.py existe dans tools/ et contient run_ai_enrichment_agent()"
+            "suggestion": "Vérifiez le package tools/ai_agent et son point d'entrée run_ai_enrichment_agent()"
         }
 
+@app.get("/ai-agent/checkpoints")
+async def list_ai_agent_checkpoints():
+    """Sessions reprenables (checkpoint présent) - à passer en resume_session"""
+    ai_agent_module = tool_registry.get_module("ai_agent")
+    checkpoint_dir = ai_agent_module.DEFAULT_CONFIG.get("checkpoint_dir", "data/checkpoints")
+    
+    return {"sessions": ai_agent_module.CheckpointStore.list_sessions(checkpoint_dir)}
+
+@app.get("/ai-agent/events/{session_id}")
+async def ai_agent_events(session_id: str):
+    """Journal d'événements JSON lines d'une session (un objet par ligne, lisible en streaming)"""
+    if not session_id.replace("_", "").replace("-", "").isalnum():
+        raise HTTPException(status_code=400, detail="Identifiant de session invalide")
+
+    ai_agent_module = tool_registry.get_module("ai_agent")
+    events = ai_agent_module.SessionEventLog.from_config(ai_agent_module.DEFAULT_CONFIG, session_id)
+
+    if events is None or not events.path.exists():
+        raise HTTPException(status_code=404, detail=f"Aucun journal d'événements pour la session {session_id}")
+
+    return FileResponse(events.path, media_type="application/x-ndjson", filename=events.path.name)
+
+@app.get("/ai-agent/store")
+async def ai_agent_store_overview(limit: int = Query(20, description="Nombre de sessions récentes")):
+    """Volumétrie du store d'enrichissement et sessions récentes"""
+    store = get_agent_store()
+    
+    if store is None:
+        raise HTTPException(status_code=503, detail="Store d'enrichissement désactivé")
+    
+    return {"stats": store.get_stats(), "sessions": store.list_sessions(limit)}
+
+@app.get("/ai-agent/companies")
+async def ai_agent_companies(
+    siret: Optional[str] = Query(None, description="SIRET exact"),
+    commune: Optional[str] = Query(None, description="Commune"),
+    naf_code: Optional[str] = Query(None, description="Code NAF"),
+    enriched_only: bool = Query(False, description="Seulement les entreprises enrichies"),
+    limit: int = Query(1000, description="Nombre maximum de lignes")
+):
+    """Entreprises du store (recherche indexée par SIRET, commune ou code NAF)"""
+    store = get_agent_store()
+    
+    if store is None:
+        raise HTTPException(status_code=503, detail="Store d'enrichissement désactivé")
+    
+    if siret:
+        key = tool_registry.get_module("ai_agent").normalize_siret(siret)
+        company = store.get_companies([key]).get(key)
+        if company is None:
+            raise HTTPException(status_code=404, detail=f"SIRET {siret} absent du store")
+        return company
+    
+    companies = store.find_companies(commune, naf_code, enriched_only, limit)
+    return {"count": len(companies), "companies": companies}
+
+@app.get("/ai-agent/export")
+async def ai_agent_export(
+    commune: Optional[str] = Query(None, description="Commune"),
+    naf_code: Optional[str] = Query(None, description="Code NAF"),
+    enriched_only: bool = Query(True, description="Seulement les entreprises enrichies"),
+    limit: int = Query(100000, description="Nombre maximum de lignes")
+):
+    """Génère un fichier Excel depuis le store d'enrichissement (sans relancer l'agent)"""
+    store = get_agent_store()
+    
+    if store is None:
+        raise HTTPException(status_code=503, detail="Store d'enrichissement désactivé")
+    
+    companies = store.find_companies(commune, naf_code, enriched_only, limit)
+    if not companies:
+        raise HTTPException(status_code=404, detail="Aucune entreprise ne correspond aux filtres")
+    
+    ai_agent_module = tool_registry.get_module("ai_agent")
+    writer = ai_agent_module.ExcelWriter(ai_agent_module.DEFAULT_CONFIG, session_id="export")
+    label = "_".join(part for part in (commune, naf_code) if part) or "all"
+    output_file = await asyncio.to_thread(writer.export_companies, companies, label.replace(" ", "-"))
+    
+    return FileResponse(output_file, filename=Path(output_file).name)
+
 @app.get("/ai-agent/report", response_class=PlainTextResponse)
 async def ai_agent_detailed_report(session_id: str = Query(None, description="ID de session spécifique")):
     """
     📊 Rapport détaillé de la dernière exécution de l'Agent IA
+    Construit depuis les métriques structurées de la session (coût constant, même en cours)
     """
     try:
-        # Si pas de session_id, prendre la plus récente
-        if not session_id:
-            # Chercher le log le plus récent
-            log_dir = Path("logs")
-            if log_dir.exists():
-                log_files = list(log_dir.glob("ai_agent_*.log"))
-                if log_files:
-                    latest_log = max(log_files, key=lambda f: f.stat().st_mtime)
-                    session_id = latest_log.stem.replace("ai_agent_", "")
-        
-        if not session_id:
-            return "❌ Aucune session Agent IA trouvée. Lancez d'abord l'enrichissement."
+        session = get_session_metrics(session_id)
         
-        # Lire le fichier de log
-        log_file = Path(f"logs/ai_agent_{session_id}.log")
+        if session is None:
+            if session_id:
+                return f"❌ Session {session_id} non trouvée (aucune métrique enregistrée)."
+            return "❌ Aucune session Agent IA trouvée. Lancez d'abord l'enrichissement."
         
-        if not log_file.exists():
-            return f"❌ Log de session {session_id} non trouvé."
+        session_id = session["session_id"]
+        counters = session["counters"]
+        timings = session["timings"]
         
-        # Générer le rapport depuis les logs
-        with open(log_file, 'r', encoding='utf-8') as f:
-            log_content = f.read()
+        processed_count = counters["processed"]
+        success_count = counters["enriched"]
+        failure_count = counters["failed"]
+        success_rate = session["success_rate"]
         
-        # Parser les informations clés du log
         report = f"""
 🤖 RAPPORT DÉTAILLÉ AGENT IA - SESSION {session_id}
 {'='*70}
 
 📊 RÉSUMÉ EXÉCUTION
-"""
-        
-        # Extraire les métriques du log
-        lines = log_content.split('\n')
-        
-        # Statistiques de base
-        processed_count = len([line for line in lines if "Traitement:" in line])
-        success_count = len([line for line in lines if "✅ Succès - Score:" in line])
-        failure_count = len([line for line in lines if "❌ Échec - Raison:" in line])
-        
-        success_rate = (success_count / processed_count * 100) if processed_count > 0 else 0
-        
-        report += f"""
+
+  Statut: {session["status"]}
   Entreprises traitées: {processed_count}
   Enrichissements réussis: {success_count}
   Échecs: {failure_count}
   Taux de succès: {success_rate:.1f}%
+  Progression: {counters["processed"]}/{counters["total"]} ({session["progress_percentage"]}%)
+  Reprises (checkpoint / incrémental): {counters["restored"]}
+  Qualité moyenne: {session["avg_quality_score"]}%
 
-🔍 DÉTAIL DES TRAITEMENTS
+🧠 DÉCISIONS IA
 {'='*70}
 """
         
-        # Extraire les détails de chaque traitement
-        current_company = ""
-        for line in lines:
-            if "Traitement:" in line:
-                company_name = line.split("Traitement: ")[1] if "Traitement: " in line else "N/A"
-                current_company = company_name
-                report += f"\n🏢 {company_name}\n"
-            elif "✅ Succès - Score:" in line:
-                score = line.split("Score: ")[1].replace("%", "") if "Score: " in line else "N/A"
-                report += f"   ✅ ENRICHI - Qualité: {score}%\n"
-            elif "❌ Échec - Raison:" in line:
-                reason = line.split("Raison: ")[1] if "Raison: " in line else "Raison inconnue"
-                report += f"   ❌ ÉCHEC - {reason}\n"
-        
-        # Chercher les erreurs spécifiques
-        error_lines = [line for line in lines if "❌" in line or "ERROR" in line]
-        
-        if error_lines:
+        for decision, count in sorted(session["decisions"].items(), key=lambda item: -item[1]):
+            report += f"  {decision}: {count}\n"
+        for source, count in sorted(session["sources"].items(), key=lambda item: -item[1]):
+            report += f"  Source {source}: {count}\n"
+        
+        if session["recent_failures"] or session["error"]:
             report += f"""
-⚠️ ERREURS DÉTECTÉES
+⚠️ DERNIERS ÉCHECS ({failure_count} au total, dont {counters["errors"]} erreurs)
 {'='*70}
 """
-            for error in error_lines[:10]:  # Limiter à 10 erreurs
-                clean_error = error.split(" - ")[-1] if " - " in error else error
-                report += f"• {clean_error}\n"
-        
-        # Informations de performance
-        start_lines = [line for line in lines if "Démarrage Agent IA" in line]
-        end_lines = [line for line in lines if "Enrichissement terminé" in line]
-        
-        if start_lines and end_lines:
-            report += f"""
+            if session["error"]:
+                report += f"• {session['error']}\n"
+            for failure in session["recent_failures"]:
+                report += f"• [{failure['row']}] {failure['company']}: {failure['reason']}\n"
+        
+        started = datetime.fromtimestamp(session["started_at"]).strftime("%Y-%m-%d %H:%M:%S")
+        finished = datetime.fromtimestamp(session["finished_at"]).strftime("%Y-%m-%d %H:%M:%S") if session["finished_at"] else "en cours"
+        phases = ", ".join(f"{phase} {seconds}s" for phase, seconds in session["phases"].items()) or "N/A"
+        report += f"""
 ⚡ PERFORMANCE
 {'='*70}
-  Début: {start_lines[0].split(' - ')[0] if ' - ' in start_lines[0] else 'N/A'}
-  Fin: {end_lines[0].split(' - ')[0] if ' - ' in end_lines[0] else 'N/A'}
+  Début: {started}
+  Fin: {finished}
+  Durée: {session["duration_seconds"]}s
+  Phases: {phases}
+  Temps par entreprise: moy {timings["avg"] or 'N/A'}s, min {timings["min"] or 'N/A'}s, max {timings["max"] or 'N/A'}s
 """
         
+        for stage, stats in session.get("stages", {}).items():
+            report += (
+                f"  {stage}: {stats['count']} x, total {stats['total']}s, "
+                f"p50 {stats['p50']}s, p95 {stats['p95']}s, p99 {stats['p99']}s"
+                + (f", {stats['bytes'] // 1024} Ko" if stats["bytes"] else "") + "\n"
+            )
+        
         # Recommandations basées sur les résultats
         report += f"""
 💡 RECOMMANDATIONS
@@ -710,7 +1060,7 @@ async def ai_agent_detailed_report(session_id: str = Query(None, description="ID
         if failure_count > 0:
             report += f"⚠️ Analyser les {failure_count} échecs pour optimiser l'algorithme.\n"
         
-        report += """
+        report += f"""
 🚀 PROCHAINES ÉTAPES
 {'='*70}
 1. Analyser les résultats dans data/processed/
@@ -719,25 +1069,14 @@ async def ai_agent_detailed_report(session_id: str = Query(None, description="ID
 4. Valider manuellement un échantillon des résultats
 
 📁 FICHIERS GÉNÉRÉS
-{'='*70}"""
-        
-        # Chercher les fichiers générés
-        processed_dir = Path("data/processed")
-        if processed_dir.exists():
-            generated_files = list(processed_dir.glob(f"*{session_id}*"))
-            if generated_files:
-                for file in generated_files:
-                    report += f"\n📄 {file.name} ({file.stat().st_size / 1024:.1f} KB)"
-            else:
-                report += "\n⚠️ Aucun fichier trouvé dans data/processed/"
-        
-        report += f"""
+{'='*70}
+📄 {session["output_file"] or "⚠️ Aucun fichier généré"}
 
 🔗 COMMANDES UTILES
 {'='*70}
   Relancer agent: curl -X POST "http://localhost:8080/ai-agent/enrich?sample_size=10"
-  Voir logs: cat logs/ai_agent_{session_id}.log
-  Analyse fichier: curl http://localhost:8080/analyze-complete
+  Entreprises enrichies: curl "http://localhost:8080/ai-agent/companies?commune=TORCY"
+  Export Excel: curl "http://localhost:8080/ai-agent/export?enriched_only=true"
 
 🎉 RAPPORT TERMINÉ
 """
@@ -752,7 +1091,7 @@ Erreur: {str(e)}
 
 Suggestions:
 - Vérifiez que l'agent IA a bien été exécuté
-- Contrôlez l'existence du dossier logs/
+- Contrôlez le store d'enrichissement (GET /ai-agent/store)
 - Relancez l'enrichissement si nécessaire
 """
 
@@ -781,21 +1120,13 @@ async def run_ai_agent_with_streaming(
             # Import de l'agent IA
             yield f"data: {json.dumps({'type': 'info', 'message': '📁 Chargement fichier de données...', 'timestamp': time.time()})}\n\n"
             
-            import os
-            import importlib.util
-            
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            agent_path = os.path.join(current_dir, "tools", "ai_agent.py")
-            
-            if not os.path.exists(agent_path):
+            # Agent IA fourni par le registre d'outils (importé une seule fois)
+            try:
+                ai_agent_module = tool_registry.get_module("ai_agent")
+            except ImportError:
                 yield f"data: {json.dumps({'type': 'error', 'message': '❌ Agent IA non trouvé', 'timestamp': time.time()})}\n\n"
                 return
             
-            # Charger l'agent IA
-            spec = importlib.util.spec_from_file_location("ai_agent", agent_path)
-            ai_agent_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(ai_agent_module)
-            
             yield f"data: {json.dumps({'type': 'info', 'message': '🤖 Agent IA initialisé', 'timestamp': time.time()})}\n\n"
             
             # Créer l'agent avec callback de progression
@@ -861,13 +1192,13 @@ async def run_real_ai_agent_with_streaming(
     import uuid
     session_id = str(uuid.uuid4())[:8]
     
-    # Créer une queue pour cette session
-    progress_queue = queue.Queue()
-    progress_updates[session_id] = progress_queue
-    
     async def real_enrichment_stream():
         """Stream qui combine le vrai Agent IA avec la progression"""
         
+        # File asyncio de la session, alimentée par les workers de l'agent
+        stream = progress_bus.open(session_id)
+        job = None
+        
         try:
             # Sécurité mode test
             if test_mode and sample_size > 50:
@@ -880,186 +1211,84 @@ async def run_real_ai_agent_with_streaming(
             # Import de l'agent IA RÉEL
             yield f"data: {json.dumps({'type': 'info', 'message': '📁 Chargement Agent IA...', 'timestamp': time.time()})}\n\n"
             
-            import os
-            import importlib.util
-            
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            agent_path = os.path.join(current_dir, "tools", "ai_agent.py")
-            
-            if not os.path.exists(agent_path):
+            # Agent IA fourni par le registre d'outils (importé une seule fois)
+            try:
+                ai_agent_module = tool_registry.get_module("ai_agent")
+            except ImportError:
                 yield f"data: {json.dumps({'type': 'error', 'message': '❌ Agent IA non trouvé', 'timestamp': time.time()})}\n\n"
                 return
             
-            # Charger l'agent IA RÉEL
-            spec = importlib.util.spec_from_file_location("ai_agent", agent_path)
-            ai_agent_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(ai_agent_module)
-            
             yield f"data: {json.dumps({'type': 'info', 'message': '🤖 Agent IA réel initialisé', 'timestamp': time.time()})}\n\n"
             
-            # Lancer l'Agent IA RÉEL dans un thread avec callback
-            loop = asyncio.get_event_loop()
-            
-            def run_real_agent_with_progress():
-                """Exécute le vrai agent IA avec callbacks de progression"""
-                
-                # Créer l'agent avec callbacks
-                agent = ai_agent_module.AIEnrichmentAgent()
-                
-                # Patcher la méthode d'enrichissement pour récupérer la progression
-                original_enrich = agent._enrich_companies_ai
+            def run_real_agent_with_progress(job):
+                """Exécute le vrai agent IA ; chaque événement part dans la file de la session"""
+                def on_progress(event):
+                    job_manager.update_progress(job["id"], event)
+                    stream.publish(event)
                 
-                def enrichment_with_callbacks(sample_df):
-                    """Version avec callbacks pour le streaming"""
+                try:
+                    run_control = ai_agent_module.RunControl()
+                    job_manager.attach_control(job["id"], run_control)
                     
-                    results = {
-                        "processed": 0,
-                        "enriched": 0,
-                        "failed": 0,
-                        "enrichment_data": {},
-                        "quality_reports": {},
-                        "ai_decisions": []
-                    }
-                    
-                    for idx, (_, company) in enumerate(sample_df.iterrows(), 1):
-                        start_time = time.time()
-                        company_name = company.get('Nom courant/Dénomination', f'Entreprise_{idx}')
-                        
-                        # Envoyer progression au stream
-                        progress_queue.put({
-                            'type': 'progress',
-                            'current': idx,
-                            'total': len(sample_df),
-                            'percentage': round((idx / len(sample_df)) * 100, 1),
-                            'message': f'🔍 Traitement: {company_name[:30]}...',
-                            'timestamp': time.time()
-                        })
-                        
-                        try:
-                            # VRAI enrichissement de l'entreprise
-                            enrichment_result = agent._enrich_single_company_ai(company, idx)
-                            
-                            processing_time = time.time() - start_time
-                            
-                            if enrichment_result["success"]:
-                                results["enriched"] += 1
-                                results["enrichment_data"][str(idx)] = enrichment_result["data"]
-                                results["quality_reports"][str(idx)] = enrichment_result["quality_report"]
-                                agent.performance_metrics["quality_scores"].append(enrichment_result["quality_score"])
-                                
-                                # Envoyer résultat succès
-                                progress_queue.put({
-                                    'type': 'result',
-                                    'current': idx,
-                                    'total': len(sample_df),
-                                    'success': True,
-                                    'message': f'✅ Enrichi - {company_name[:30]} (Score: {enrichment_result["quality_score"]}%)',
-                                    'data': {
-                                        'website': enrichment_result["data"].get("website", "N/A"),
-                                        'quality_score': enrichment_result["quality_score"]
-                                    },
-                                    'timestamp': time.time()
-                                })
-                                
-                            else:
-                                results["failed"] += 1
-                                agent.performance_metrics["error_details"].append({
-                                    "company_index": idx,
-                                    "company_name": company_name,
-                                    "error_reason": enrichment_result["error_reason"]
-                                })
-                                
-                                # Envoyer résultat échec
-                                progress_queue.put({
-                                    'type': 'result',
-                                    'current': idx,
-                                    'total': len(sample_df),
-                                    'success': False,
-                                    'message': f'❌ Échec - {company_name[:30]} ({enrichment_result["error_reason"]})',
-                                    'timestamp': time.time()
-                                })
-                            
-                            results["processed"] += 1
-                            results["ai_decisions"].append(enrichment_result["ai_decision_log"])
-                            
-                            # Rate limiting (réduit pour les tests)
-                            time.sleep(1)  # 1 seconde au lieu de 3
-                            
-                        except Exception as e:
-                            results["failed"] += 1
-                            results["processed"] += 1
-                            
-                            progress_queue.put({
-                                'type': 'result',
-                                'current': idx,
-                                'total': len(sample_df),
-                                'success': False,
-                                'message': f'❌ Erreur - {company_name[:30]} ({str(e)})',
-                                'timestamp': time.time()
-                            })
-                    
-                    return results
-                
-                # Remplacer temporairement la méthode
-                agent._enrich_companies_ai = enrichment_with_callbacks
-                
-                # Lancer l'enrichissement RÉEL
-                return agent.enrich_sample(sample_size)
+                    dataset = get_shared_dataset()
+                    agent = ai_agent_module.AIEnrichmentAgent(progress_callback=on_progress, run_control=run_control)
+                    return agent.enrich_sample(
+                        sample_size, df=dataset["df"], file_context=dataset["context"]
+                    )
+                finally:
+                    stream.close()
             
-            # Exécuter dans un thread pool
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                # Lancer l'agent en arrière-plan
-                future = loop.run_in_executor(executor, run_real_agent_with_progress)
-                
-                # Stream les updates de progression
-                while not future.done():
-                    try:
-                        # Récupérer les updates avec timeout
-                        update = progress_queue.get(timeout=0.5)
-                        yield f"data: {json.dumps(update)}\n\n"
-                    except queue.Empty:
-                        # Envoyer un heartbeat
-                        yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': time.time()})}\n\n"
-                    
-                    await asyncio.sleep(0.1)  # Petit délai
-                
-                # Récupérer le résultat final
-                final_result = await future
-                
-                # Vider la queue restante
-                while not progress_queue.empty():
-                    try:
-                        update = progress_queue.get_nowait()
-                        yield f"data: {json.dumps(update)}\n\n"
-                    except queue.Empty:
-                        break
-                
-                # Envoyer le résultat final
-                if "error" not in final_result:
-                    completion_data = {
-                        'type': 'completed',
-                        'message': '🎉 Enrichissement RÉEL terminé !',
-                        'summary': final_result["execution_summary"],
-                        'output_file': final_result.get("output_file", "N/A"),
-                        'session_id': final_result["session_id"],
-                        'timestamp': time.time()
-                    }
-                else:
-                    completion_data = {
-                        'type': 'error',
-                        'message': f'❌ Erreur finale: {final_result["error"]}',
-                        'timestamp': time.time()
-                    }
-                
-                yield f"data: {json.dumps(completion_data)}\n\n"
+            # Lancer l'agent comme job (pool borné partagé, la boucle reste libre)
+            job = job_manager.submit(
+                "ai-agent/enrich-real-stream", run_real_agent_with_progress,
+                params={"sample_size": sample_size, "session": session_id}
+            )
+            future = asyncio.wrap_future(job_manager.get_future(job["id"]))
+            future.add_done_callback(lambda _: stream.close())  # Job annulé avant démarrage
+            
+            job_info = {'type': 'info', 'message': f"📋 Job {job['id']} soumis", 'job_id': job['id'], 'timestamp': time.time()}
+            yield f"data: {json.dumps(job_info)}\n\n"
+            
+            # Relayer la progression ; heartbeat par minuterie si rien n'arrive
+            async for update in stream.events(heartbeat_interval=STREAM_HEARTBEAT_SECONDS):
+                yield f"data: {json.dumps(update)}\n\n"
+            
+            # Récupérer le résultat final
+            if future.cancelled():
+                final_result = {"error": "Job annulé avant son démarrage"}
+            else:
+                final_result = await future or {"error": job_manager.get(job["id"], include_result=False)["error"]}
+            
+            # Envoyer le résultat final
+            if "error" not in final_result:
+                cancelled = final_result.get("cancelled", False)
+                completion_data = {
+                    'type': 'cancelled' if cancelled else 'completed',
+                    'message': '⏹️ Enrichissement annulé (résultats partiels)' if cancelled else '🎉 Enrichissement RÉEL terminé !',
+                    'summary': final_result["execution_summary"],
+                    'output_file': final_result.get("output_file", "N/A"),
+                    'session_id': final_result["session_id"],
+                    'timestamp': time.time()
+                }
+            else:
+                completion_data = {
+                    'type': 'error',
+                    'message': f'❌ Erreur finale: {final_result["error"]}',
+                    'timestamp': time.time()
+                }
+            
+            yield f"data: {json.dumps(completion_data)}\n\n"
         
         except Exception as e:
             yield f"data: {json.dumps({'type': 'error', 'message': f'❌ Erreur streaming: {str(e)}', 'timestamp': time.time()})}\n\n"
         
         finally:
-            # Nettoyer la queue
-            if session_id in progress_updates:
-                del progress_updates[session_id]
+            # Client déconnecté avant la fin : libérer le worker au prochain point de contrôle
+            if job is not None:
+                job_manager.cancel(job["id"], "Stream fermé par le client")
+            
+            # Nettoyer la file de la session
+            progress_bus.remove(session_id)
     
     return StreamingResponse(
         real_enrichment_stream(),
@@ -1072,71 +1301,58 @@ async def run_real_ai_agent_with_streaming(
     )
 
 
+@app.get("/ai-agent/timings")
+async def ai_agent_stage_timings(session_id: str = Query(None, description="ID de session (dernière par défaut)")):
+    """Temps passé par étape du pipeline (count, p50 / p95 / p99, octets téléchargés)"""
+    session = get_session_metrics(session_id)
+    
+    if session is None:
+        raise HTTPException(status_code=404, detail="Aucune session Agent IA trouvée")
+    
+    return {
+        "session_id": session["session_id"],
+        "status": session["status"],
+        "phases": session["phases"],
+        "stages": session.get("stages", {})
+    }
+
 @app.get("/ai-agent/status")
 async def ai_agent_status():
     """
     📊 Statut en temps réel de l'Agent IA
+    Métriques de la dernière session (vivantes si elle tourne dans ce processus)
     """
     try:
-        # Chercher les logs récents
-        log_dir = Path("logs")
+        session = get_session_metrics()
         
-        if not log_dir.exists():
+        if session is None:
             return {
                 "status": "inactive",
-                "message": "Aucune activité Agent IA détectée",
-                "suggestion": "Lancez un enrichissement avec /ai-agent/enrich"
-            }
-        
-        # Trouver le log le plus récent
-        log_files = list(log_dir.glob("ai_agent_*.log"))
-        
-        if not log_files:
-            return {
-                "status": "inactive", 
-                "message": "Aucun log Agent IA trouvé",
+                "message": "Aucune session Agent IA enregistrée",
                 "available_commands": {
                     "start_enrichment": "POST /ai-agent/enrich",
                     "view_analysis": "GET /analyze-complete"
                 }
             }
         
-        # Analyser le log le plus récent
-        latest_log = max(log_files, key=lambda f: f.stat().st_mtime)
-        session_id = latest_log.stem.replace("ai_agent_", "")
-        
-        # Lire les dernières lignes pour déterminer le statut
-        with open(latest_log, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        lines = content.split('\n')
-        last_lines = [line for line in lines[-10:] if line.strip()]
-        
-        # Déterminer le statut
-        if any("Enrichissement terminé" in line for line in last_lines):
-            status = "completed"
-        elif any("Début enrichissement IA" in line for line in last_lines):
-            status = "running"
-        else:
-            status = "unknown"
-        
-        # Extraire les métriques
-        processed = len([line for line in lines if "Traitement:" in line])
-        success = len([line for line in lines if "✅ Succès" in line])
+        session_id = session["session_id"]
+        counters = session["counters"]
         
         return {
-            "status": status,
+            "status": session["status"],
             "latest_session": session_id,
-            "last_activity": latest_log.stat().st_mtime,
+            "last_activity": session["finished_at"] or session["started_at"] + session["duration_seconds"],
             "quick_metrics": {
-                "companies_processed": processed,
-                "successful_enrichments": success,
-                "success_rate": f"{(success/processed*100):.1f}%" if processed > 0 else "0%"
+                "companies_processed": counters["processed"],
+                "successful_enrichments": counters["enriched"],
+                "success_rate": f"{session['success_rate']:.1f}%",
+                "progress_percentage": session["progress_percentage"]
             },
+            "metrics": session,
             "available_actions": {
                 "view_detailed_report": f"GET /ai-agent/report?session_id={session_id}",
                 "start_new_enrichment": "POST /ai-agent/enrich",
-                "check_results": f"Check data/processed/ for files with {session_id}"
+                "check_results": session["output_file"] or f"Check data/processed/ for files with {session_id}"
             }
         }
         
@@ -1153,54 +1369,37 @@ async def test_ai_agent_import():
     🧪 Test simple pour vérifier que l'agent IA peut être importé
     """
     try:
-        import os
-        import importlib.util
-        
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        agent_path = os.path.join(current_dir, "tools", "ai_agent.py")
+        tools = tool_registry.list_tools()
         
         # Vérifications étape par étape
         checks = {
-            "file_exists": os.path.exists(agent_path),
-            "file_path": agent_path,
-            "tools_dir_exists": os.path.exists(os.path.join(current_dir, "tools")),
-            "tools_dir_content": []
+            "module": tools["ai_agent"]["module"],
+            "already_loaded": tools["ai_agent"]["loaded"]
         }
         
-        # Lister le contenu du dossier tools
-        tools_dir = os.path.join(current_dir, "tools")
-        if os.path.exists(tools_dir):
-            checks["tools_dir_content"] = os.listdir(tools_dir)
-        
-        # Essayer d'importer si le fichier existe
-        if checks["file_exists"]:
-            try:
-                spec = importlib.util.spec_from_file_location("ai_agent", agent_path)
-                ai_agent_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(ai_agent_module)
-                
-                # Vérifier que la fonction principale existe
-                has_main_function = hasattr(ai_agent_module, 'run_ai_enrichment_agent')
-                
-                checks.update({
-                    "import_successful": True,
-                    "has_main_function": has_main_function,
-                    "available_functions": [attr for attr in dir(ai_agent_module) if not attr.startswith('_')]
-                })
-                
-                if has_main_function:
-                    checks["status"] = "✅ Agent IA prêt"
-                else:
-                    checks["status"] = "⚠️ Agent IA importé mais fonction principale manquante"
-                
-            except Exception as import_error:
-                checks.update({
-                    "import_successful": False,
-                    "import_error": str(import_error),
-                    "status": "❌ Erreur d'import"
-                })
-        else:
-            checks["status"] = "❌ Fichier ai_agent.py non trouvé"
+        try:
+            ai_agent_module = tool_registry.get_module("ai_agent")
+            
+            # Vérifier que la fonction principale existe
+            has_main_function = hasattr(ai_agent_module, 'run_ai_enrichment_agent')
+            
+            checks.update({
+                "import_successful": True,
+                "has_main_function": has_main_function,
+                "available_functions": [attr for attr in dir(ai_agent_module) if not attr.startswith('_')]
+            })
+            
+            if has_main_function:
+                checks["status"] = "✅ Agent IA prêt"
+            else:
+                checks["status"] = "⚠️ Agent IA importé mais fonction principale manquante"
+            
+        except Exception as import_error:
+            checks.update({
+                "import_successful": False,
+                "import_error": str(import_error),
+                "status": "❌ Erreur d'import"
+            })
         
         return checks
         
@@ -0,0 +1,214 @@
+# ============================================================================
+# MÉTRIQUES PROMETHEUS - mcp_server/metrics.py
+# ============================================================================
+
+"""
+Registre de métriques du serveur, exposé au format texte Prometheus (GET /metrics)
+- Familles counter / gauge / histogram avec labels, thread-safe, sans dépendance
+- Latence HTTP par route (template FastAPI, pas l'URL brute : cardinalité bornée)
+- Collecteurs appelés à chaque scrape pour les valeurs tenues ailleurs
+  (jobs, moteurs de recherche, caches, limiteur, mémoire du processus)
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Buckets par défaut (secondes), alignés sur ceux de prometheus_client
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Import conditionnel : psutil donne la RSS sur toutes les plateformes
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricFamily:
+    """Famille de séries partageant un nom, un type et des noms de labels"""
+
+    def __init__(self, name: str, kind: str, help_text: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def inc(self, value: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def set(self, value: float, **labels):
+        """Valeur absolue (gauge, ou counter recopié depuis un compteur cumulatif existant)"""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def _labels_text(self, key: Tuple[str, ...], extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, key)]
+        if extra:
+            pairs.append(f'{extra[0]}="{extra[1]}"')
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{self._labels_text(key)} {_format_value(value)}")
+        return lines
+
+
+class HistogramFamily(MetricFamily):
+    """Histogramme cumulatif par série (buckets, _sum, _count)"""
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, "histogram", help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # Compteurs par bucket (non cumulés), puis somme et nombre
+                series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, series):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{self._labels_text(key, ('le', _format_value(bound)))} {cumulative}")
+                lines.append(f"{self.name}_bucket{self._labels_text(key, ('le', '+Inf'))} {series[-1]}")
+                lines.append(f"{self.name}_sum{self._labels_text(key)} {_format_value(series[-2])}")
+                lines.append(f"{self.name}_count{self._labels_text(key)} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ensemble des familles du processus et collecteurs rafraîchis au scrape"""
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+        self._collectors: List[Callable[["MetricsRegistry"], None]] = []
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+        self.gauge("mcp_process_start_time_seconds", "Démarrage du processus (epoch)").set(self.started_at)
+
+    def _register(self, family: MetricFamily) -> MetricFamily:
+        with self._lock:
+            return self._families.setdefault(family.name, family)
+
+    def counter(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> MetricFamily:
+        return self._register(MetricFamily(name, "counter", help_text, tuple(labelnames)))
+
+    def gauge(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> MetricFamily:
+        return self._register(MetricFamily(name, "gauge", help_text, tuple(labelnames)))
+
+    def histogram(self, name: str, help_text: str, labelnames: Iterable[str] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> HistogramFamily:
+        return self._register(HistogramFamily(name, help_text, tuple(labelnames), buckets))
+
+    def add_collector(self, collector: Callable[["MetricsRegistry"], None]):
+        """Fonction appelée avant chaque rendu pour recopier des valeurs externes"""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Exposition texte Prometheus (version 0.0.4)"""
+        with self._lock:
+            collectors = list(self._collectors)
+
+        for collector in collectors:
+            try:
+                collector(self)
+            except Exception as e:
+                # Un collecteur défaillant ne doit pas masquer les autres métriques
+                self.counter("mcp_metrics_collector_errors_total", "Erreurs des collecteurs",
+                             ("collector",)).inc(collector=getattr(collector, "__name__", type(e).__name__))
+
+        with self._lock:
+            families = [self._families[name] for name in sorted(self._families)]
+
+        lines = []
+        for family in families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+def collect_process_metrics(registry: MetricsRegistry):
+    """RSS et uptime du processus (psutil, sinon /proc, sinon pic via resource)"""
+    rss = None
+
+    if PSUTIL_AVAILABLE:
+        rss = psutil.Process().memory_info().rss
+    elif os.path.exists("/proc/self/statm"):
+        with open("/proc/self/statm") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    else:
+        try:
+            import resource
+            # ru_maxrss : Ko sous Linux, octets sous macOS (pic, à défaut de la valeur courante)
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            rss = maxrss if sys.platform == "darwin" else maxrss * 1024
+        except ImportError:
+            pass
+
+    if rss is not None:
+        registry.gauge("mcp_process_resident_memory_bytes", "Mémoire résidente du processus").set(rss)
+    registry.gauge("mcp_process_uptime_seconds", "Durée de fonctionnement du processus").set(
+        round(time.time() - registry.started_at, 1)
+    )
+    registry.gauge("mcp_process_threads", "Threads actifs du processus").set(threading.active_count())
+
+
+# Instance partagée par processus
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Retourne le registre de métriques du processus"""
+    global _registry
+
+    with _registry_lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+            _registry.add_collector(collect_process_metrics)
+
+    return _registry
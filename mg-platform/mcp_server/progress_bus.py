@@ -0,0 +1,174 @@
+# ============================================================================
+# BUS DE PROGRESSION ASYNCIO - mcp_server/progress_bus.py
+# ============================================================================
+
+"""
+Transport des événements de progression vers les streams SSE
+- Une file asyncio.Queue par session, alimentée depuis les threads de l'agent
+  via loop.call_soon_threadsafe (aucun appel bloquant dans la boucle)
+- Heartbeats pilotés par minuterie (asyncio.wait_for), pas par une boucle active
+- File bornée : en cas de client lent, les plus anciens événements "progress" sautent
+  (résultats, infos et fin de session sont toujours livrés)
+- Nombre de sessions simultanées illimité (une file par stream)
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+DEFAULT_HEARTBEAT_SECONDS = 15.0
+DEFAULT_MAX_QUEUE = 1000
+
+# Marqueur de fin de stream
+_CLOSED = object()
+
+
+class _ProgressQueue(asyncio.Queue):
+    """File asyncio dont on peut retirer le plus ancien événement de progression"""
+
+    def drop_oldest_progress(self) -> bool:
+        """Retire le plus ancien événement "progress" (False s'il n'y en a aucun)"""
+        for position, event in enumerate(self._queue):
+            if _is_progress(event):
+                del self._queue[position]
+                return True
+        return False
+
+
+def _is_progress(event: Any) -> bool:
+    return isinstance(event, dict) and event.get("type") == "progress"
+
+
+class ProgressStream:
+    """File de progression d'une session, consommée par un seul générateur SSE"""
+
+    def __init__(self, session_id: str, loop: asyncio.AbstractEventLoop, max_queue: int = DEFAULT_MAX_QUEUE):
+        self.session_id = session_id
+        self.stats = {"published": 0, "dropped": 0}
+
+        self._loop = loop
+        self._max_queue = max_queue
+        self._queue = _ProgressQueue()  # Borne appliquée par _put (seuls les "progress" sautent)
+        self._closed = False
+
+    def publish(self, event: Dict[str, Any]) -> bool:
+        """
+        Publie un événement depuis n'importe quel thread (non bloquant)
+
+        Returns:
+            False si le stream est fermé ou la boucle arrêtée
+        """
+        if self._closed or self._loop.is_closed():
+            return False
+
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+            return True
+        except RuntimeError:
+            # Boucle arrêtée entre-temps
+            return False
+
+    def close(self):
+        """Signale la fin du stream (appelable depuis n'importe quel thread)"""
+        if self._closed or self._loop.is_closed():
+            return
+
+        self._closed = True
+        try:
+            self._loop.call_soon_threadsafe(self._put, _CLOSED)
+        except RuntimeError:
+            pass
+
+    async def events(self, heartbeat_interval: float = DEFAULT_HEARTBEAT_SECONDS) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Itère les événements jusqu'à la fermeture du stream
+        Un heartbeat est émis si aucun événement n'arrive pendant heartbeat_interval.
+        """
+        while True:
+            try:
+                event = await asyncio.wait_for(self._queue.get(), timeout=heartbeat_interval)
+            except asyncio.TimeoutError:
+                yield {"type": "heartbeat", "session": self.session_id, "timestamp": time.time()}
+                continue
+
+            if event is _CLOSED:
+                return
+
+            yield event
+
+    def _put(self, event: Any):
+        """Insertion dans la file (exécutée dans la boucle asyncio)"""
+        if event is not _CLOSED and self._queue.qsize() >= self._max_queue:
+            # Client trop lent : sacrifier le plus ancien événement "progress" (ou celui-ci)
+            if self._queue.drop_oldest_progress():
+                self.stats["dropped"] += 1
+            elif _is_progress(event):
+                self.stats["dropped"] += 1
+                return
+
+        self._queue.put_nowait(event)
+        if event is not _CLOSED:
+            self.stats["published"] += 1
+
+
+class ProgressBus:
+    """Registre des streams de progression actifs"""
+
+    def __init__(self, max_queue: int = DEFAULT_MAX_QUEUE):
+        self.max_queue = max_queue
+        self._streams: Dict[str, ProgressStream] = {}
+        self._lock = threading.Lock()
+
+    def open(self, session_id: str) -> ProgressStream:
+        """Crée le stream d'une session (à appeler depuis la boucle asyncio)"""
+        stream = ProgressStream(session_id, asyncio.get_running_loop(), self.max_queue)
+
+        with self._lock:
+            self._streams[session_id] = stream
+
+        return stream
+
+    def get(self, session_id: str) -> Optional[ProgressStream]:
+        with self._lock:
+            return self._streams.get(session_id)
+
+    def publish(self, session_id: str, event: Dict[str, Any]) -> bool:
+        """Publie vers une session depuis n'importe quel thread"""
+        stream = self.get(session_id)
+        return stream.publish(event) if stream else False
+
+    def remove(self, session_id: str):
+        """Ferme et oublie le stream d'une session"""
+        with self._lock:
+            stream = self._streams.pop(session_id, None)
+
+        if stream:
+            stream.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Streams actifs et volume d'événements"""
+        with self._lock:
+            streams = list(self._streams.values())
+
+        return {
+            "active_streams": len(streams),
+            "published": sum(s.stats["published"] for s in streams),
+            "dropped": sum(s.stats["dropped"] for s in streams)
+        }
+
+
+# Instance partagée par processus
+_progress_bus: Optional[ProgressBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_progress_bus() -> ProgressBus:
+    """Retourne le bus de progression du processus"""
+    global _progress_bus
+
+    with _bus_lock:
+        if _progress_bus is None:
+            _progress_bus = ProgressBus()
+
+    return _progress_bus
@@ -0,0 +1,129 @@
+# ============================================================================
+# REGISTRE DES OUTILS - mcp_server/tool_registry.py
+# ============================================================================
+
+"""
+Registre des modules outils du serveur
+- Chaque module est importé une seule fois (au premier usage) puis mis en cache
+- Les endpoints récupèrent modules et fonctions sans coût d'import par requête
+- L'état module (caches, singletons) survit entre les requêtes
+- Rechargement à chaud explicite pour le développement (/tools/reload)
+"""
+
+import importlib
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from types import ModuleType
+
+# Nom court -> module importable
+TOOL_MODULES = {
+    "basic": "mcp_server.tools.basic",
+    "data_analyzer": "mcp_server.tools.data_analyzer",
+    "ai_agent": "mcp_server.tools.ai_agent",
+}
+
+
+class ToolRegistry:
+    """Cache thread-safe des modules outils"""
+
+    def __init__(self, modules: Dict[str, str] = None):
+        self.modules = dict(modules or TOOL_MODULES)
+
+        self._loaded: Dict[str, ModuleType] = {}
+        self._info: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    def get_module(self, name: str) -> ModuleType:
+        """
+        Module outil chargé (import au premier appel seulement)
+
+        Args:
+            name: Nom court de l'outil (voir TOOL_MODULES)
+
+        Returns:
+            Module Python
+        """
+        module = self._loaded.get(name)
+        if module is not None:
+            return module
+
+        with self._lock:
+            if name not in self._loaded:
+                self._load(name)
+            return self._loaded[name]
+
+    def get(self, name: str, attribute: str) -> Callable:
+        """Fonction (ou classe) exposée par un module outil"""
+        return getattr(self.get_module(name), attribute)
+
+    def reload(self, name: Optional[str] = None) -> List[str]:
+        """
+        Recharge à chaud un outil (tous si name absent)
+        Les sous-modules d'un package sont réimportés avec lui.
+
+        Returns:
+            Noms des outils rechargés
+        """
+        names = [name] if name else list(self.modules)
+
+        with self._lock:
+            for tool_name in names:
+                self._unload(tool_name)
+
+            for tool_name in names:
+                self._load(tool_name)
+
+        return names
+
+    def list_tools(self) -> Dict[str, Dict[str, Any]]:
+        """Outils connus et état de chargement"""
+        with self._lock:
+            return {
+                name: {"module": module_path, "loaded": name in self._loaded, **self._info.get(name, {})}
+                for name, module_path in self.modules.items()
+            }
+
+    def _load(self, name: str):
+        """Import effectif d'un outil"""
+        if name not in self.modules:
+            raise KeyError(f"Outil inconnu: {name}")
+
+        start = time.time()
+        module = importlib.import_module(self.modules[name])
+
+        previous = self._info.get(name, {})
+        self._loaded[name] = module
+        self._info[name] = {
+            "load_seconds": round(time.time() - start, 3),
+            "loaded_at": time.time(),
+            "load_count": previous.get("load_count", 0) + 1
+        }
+
+    def _unload(self, name: str):
+        """Retire un outil et ses sous-modules de sys.modules"""
+        if name not in self.modules:
+            raise KeyError(f"Outil inconnu: {name}")
+
+        module_path = self.modules[name]
+        for loaded_name in [m for m in sys.modules if m == module_path or m.startswith(module_path + ".")]:
+            del sys.modules[loaded_name]
+
+        self._loaded.pop(name, None)
+
+
+# Instance partagée par processus
+_tool_registry: Optional[ToolRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_tool_registry() -> ToolRegistry:
+    """Retourne le registre d'outils du processus"""
+    global _tool_registry
+
+    with _registry_lock:
+        if _tool_registry is None:
+            _tool_registry = ToolRegistry()
+
+    return _tool_registry
@@ -8,16 +8,37 @@ Agent IA d'enrichissement de données d'entreprises - Version Modulaire
 Point d'entrée principal avec compatibilité totale
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Callable
 from .core.agent import AIEnrichmentAgent
 from .core.config import DEFAULT_CONFIG
+from .utils.run_control import RunControl
+from .utils.session_metrics import get_session_index
+from .utils.event_log import SessionEventLog
+from .utils.search_stats import get_search_stats
+from .utils.rate_limiter import get_rate_limiter_stats
+from .utils.circuit_breaker import get_circuit_breaker_stats
+from .search.fetch_scheduler import get_fetch_scheduler_stats
+from .output.checkpoint import CheckpointStore
+from .utils.validators import normalize_siret
+from .output.enrichment_store import EnrichmentStore, get_enrichment_store
+from .output.excel_writer import ExcelWriter
 
-def run_ai_enrichment_agent(sample_size: int = 10) -> Dict[str, Any]:
+def run_ai_enrichment_agent(sample_size: int = 10, df=None, file_context: Dict[str, Any] = None,
+                            progress_callback: Callable[[Dict[str, Any]], Any] = None,
+                            run_control: RunControl = None,
+                            resume_session: str = None,
+                            incremental: bool = False) -> Dict[str, Any]:
     """
     Point d'entrée principal - COMPATIBLE avec main.py existant
     
     Args:
         sample_size: Nombre d'entreprises à traiter
+        df: DataFrame déjà chargé (registre du serveur), optionnel
+        file_context: Contexte colonnes associé à df, optionnel
+        progress_callback: Reçoit les événements de progression, optionnel
+        run_control: Jeton d'annulation / pause, optionnel
+        resume_session: Session à reprendre depuis son checkpoint, optionnel
+        incremental: Ne traiter que les lignes nouvelles, modifiées ou périmées
         
     Returns:
         Dict avec résultats d'enrichissement complets
@@ -27,7 +48,6 @@ def run_ai_enrichment_agent(sample_size: int = 10) -> Dict[str, Any]:
         # Configuration par défaut (hérite des réglages legacy)
         config = {
             "quality_threshold": 60,  # Plus permissif que 85
-            "rate_limit_delay": 3,
             "search_mode": "real",  # "real" ou "simulation"
             "max_retries": 2,
             "duckduckgo_timeout": 10,
@@ -36,8 +56,9 @@ def run_ai_enrichment_agent(sample_size: int = 10) -> Dict[str, Any]:
         }
         
         # Créer et lancer l'agent
-        agent = AIEnrichmentAgent(config)
-        result = agent.enrich_sample(sample_size)
+        agent = AIEnrichmentAgent(config, progress_callback=progress_callback, run_control=run_control)
+        result = agent.enrich_sample(sample_size, df=df, file_context=file_context,
+                                     resume_session=resume_session, incremental=incremental)
         
         return result
         
@@ -51,4 +72,7 @@ def run_ai_enrichment_agent(sample_size: int = 10) -> Dict[str, Any]:
 # Alias pour compatibilité avec legacy
 ai_agent_enrich = run_ai_enrichment_agent
 
-__all__ = ["run_ai_enrichment_agent", "ai_agent_enrich", "AIEnrichmentAgent"]
\ No newline at end of file
+__all__ = ["run_ai_enrichment_agent", "ai_agent_enrich", "AIEnrichmentAgent", "RunControl", "CheckpointStore",
+           "EnrichmentStore", "get_enrichment_store", "ExcelWriter", "get_session_index",
+           "SessionEventLog", "get_search_stats", "get_rate_limiter_stats",
+           "get_circuit_breaker_stats", "get_fetch_scheduler_stats", "normalize_siret"]
\ No newline at end of file
@@ -8,12 +8,15 @@ Module core de l'Agent IA - Classes et fonctions principales
 """
 
 from .agent import AIEnrichmentAgent
+from .engine import ConcurrentEnrichmentEngine
+from .persistence import SessionPersistence
 from .config import DEFAULT_CONFIG, get_config, validate_config
 from .exceptions import (
     AIAgentError, 
     DataLoadError, 
     DataValidationError,
     EnrichmentError, 
+    EnrichmentCancelledError,
     SearchError, 
     ValidationError,
     OutputError, 
@@ -25,6 +28,8 @@ from .exceptions import (
 __all__ = [
     # Agent principal
     "AIEnrichmentAgent",
+    "ConcurrentEnrichmentEngine",
+    "SessionPersistence",
     
     # Configuration
     "DEFAULT_CONFIG", 
@@ -36,6 +41,7 @@ __all__ = [
     "DataLoadError", 
     "DataValidationError",
     "EnrichmentError", 
+    "EnrichmentCancelledError",
     "SearchError", 
     "ValidationError",
     "OutputError", 
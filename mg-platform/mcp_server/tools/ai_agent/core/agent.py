@@ -5,21 +5,30 @@
 
 """
 Agent IA principal - Orchestration et coordination des modules spécialisés
-Maximum 300 lignes comme spécifié
+Persistance (checkpoint, store) et planification incrémentale : voir persistence.py
 """
 
-import time
 import logging
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from pathlib import Path
 
 from .config import get_config, validate_config
-from .exceptions import AIAgentError, DataLoadError, EnrichmentError
+from .exceptions import AIAgentError, DataLoadError, EnrichmentError, EnrichmentCancelledError
+from .engine import ConcurrentEnrichmentEngine
+from .persistence import SessionPersistence
 from ..data.loader import DataLoader
+from ..data.deduplicator import CompanyDeduplicator
 from ..enrichment.strategies import EnrichmentStrategy
 from ..output.excel_writer import ExcelWriter
+from ..output.checkpoint import checkpoint_key, row_content_hash, group_content_hashes
+from ..output.enrichment_store import get_enrichment_store
 from ..utils.logging import setup_session_logging
+from ..utils.run_control import RunControl
+from ..utils.session_metrics import SessionMetrics, get_session_index
+from ..utils.event_log import SessionEventLog
+from ..utils.stage_timer import StageTimer
 
 
 class AIEnrichmentAgent:
@@ -28,12 +37,16 @@ class AIEnrichmentAgent:
     Focus: Orchestration et coordination des modules spécialisés
     """
     
-    def __init__(self, config: Dict[str, Any] = None):
+    def __init__(self, config: Dict[str, Any] = None,
+                 progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                 run_control: Optional[RunControl] = None):
         """
         Initialise l'agent avec configuration
         
         Args:
             config: Configuration personnalisée (optionnelle)
+            progress_callback: Reçoit les événements de progression (appelé depuis les workers)
+            run_control: Jeton d'annulation / pause partagé avec l'appelant (optionnel)
         """
         # Configuration
         self.config = get_config(config)
@@ -42,6 +55,9 @@ class AIEnrichmentAgent:
         # Session et timing
         self.session_id = datetime.now().strftime(self.config["session_id_format"])
         self.start_time = None
+        self.progress_callback = progress_callback
+        self.run_control = run_control or RunControl()
+        self.timer = StageTimer()
         
         # Métriques de performance
         self.performance_metrics = {
@@ -56,19 +72,34 @@ class AIEnrichmentAgent:
         
         # Modules spécialisés
         self.data_loader = DataLoader(self.config)
-        self.enrichment_strategy = EnrichmentStrategy(self.config)
-        self.excel_writer = ExcelWriter(self.config, self.session_id)
+        self.deduplicator = CompanyDeduplicator(self.config)
+        self.enrichment_strategy = EnrichmentStrategy(self.config, self.run_control, self.timer)
+        self.engine = ConcurrentEnrichmentEngine(self.config)
+        self.excel_writer = ExcelWriter(self.config, self.session_id, self.timer)
+        self.store = get_enrichment_store(self.config)
+        self.session_index = get_session_index(self.store)
+        self.metrics: Optional[SessionMetrics] = None
+        self.events: Optional[SessionEventLog] = None
         
         # Logging
         self.logger = setup_session_logging(self.session_id, self.config)
+        self.persistence = SessionPersistence(self.config, self.session_id, self.logger, self.store)
         self.logger.info(f"Agent IA initialisé - Session: {self.session_id}")
     
-    def enrich_sample(self, sample_size: int = 10) -> Dict[str, Any]:
+    def enrich_sample(self, sample_size: int = 10, df=None, file_context: Dict[str, Any] = None,
+                      resume_session: Optional[str] = None, incremental: bool = False) -> Dict[str, Any]:
         """
         Enrichissement d'un échantillon avec analytics complètes
         
         Args:
             sample_size: Nombre d'entreprises à traiter
+            df: DataFrame déjà chargé et nettoyé (optionnel, sinon lecture du fichier)
+            file_context: Contexte colonnes associé à df (optionnel)
+            resume_session: Session à reprendre - les entreprises déjà présentes
+                            dans son checkpoint ne sont pas ré-enrichies (optionnel)
+            incremental: Échantillon pris parmi les lignes du fichier nouvelles, modifiées,
+                         en échec ou dont le dernier résultat (toutes sessions) dépasse
+                         incremental_ttl_days ; les autres ne sont pas retraitées
             
         Returns:
             Dict avec résultats complets
@@ -77,38 +108,88 @@ class AIEnrichmentAgent:
         self.logger.info(f"🚀 Démarrage Agent IA - Échantillon {sample_size} entreprises")
         
         try:
+            # 0. Checkpoint de la session (reprise éventuelle)
+            checkpointed = self.persistence.open_checkpoint(resume_session)
+            self.session_id = self.excel_writer.session_id = self.persistence.session_id
+            self.persistence.call("start_session", self.session_id, sample_size)
+            self.metrics = self.persistence.metrics = SessionMetrics(self.session_id, sample_size, stage_timer=self.timer)
+            self.session_index.register(self.metrics)
+            self.persistence.call("save_session_metrics", self.session_id, self.metrics.snapshot())
+            self._start_events(sample_size, resume_session, incremental)
+            
             # 1. Charger et analyser le fichier
-            df = self._load_and_analyze_data()
+            phase_start = time.monotonic()
+            df = self._load_and_analyze_data(df, file_context)
             if df is None:
                 raise DataLoadError("Impossible de charger le fichier de données")
             
-            # 2. Sélectionner l'échantillon optimal
-            sample_df = self._select_optimal_sample(df, sample_size)
+            # 2. Sélectionner l'échantillon optimal (incrémental : parmi les lignes à retraiter)
+            incremental_stats, reused = None, None
+            if incremental:
+                sample_df, incremental_stats, reused, content_hashes = self._select_incremental_sample(
+                    df, sample_size, checkpointed
+                )
+            else:
+                sample_df = self._select_optimal_sample(df, sample_size)
+                content_hashes = self._content_hashes(df, sample_df)
+            phase_start = self._record_phase("load", phase_start)
             
             # 3. Enrichir l'échantillon
-            enrichment_results = self._enrich_companies(sample_df)
+            enrichment_results = self._enrich_companies(
+                sample_df, checkpointed, incremental_stats, content_hashes, reused
+            )
+            phase_start = self._record_phase("enrich", phase_start)
             
-            # 4. Sauvegarder résultats enrichis
+            # 4. Sauvegarder résultats enrichis (partiels si annulation)
             output_file = self._save_results(sample_df, enrichment_results)
+            phase_start = self._record_phase("save", phase_start)
             
             # 5. Générer analytics
             analytics = self._generate_analytics(sample_df, enrichment_results)
+            self._record_phase("analytics", phase_start)
             
-            return self._build_final_result(
+            final_result = self._build_final_result(
                 sample_size, enrichment_results, output_file, analytics
             )
+            status = "cancelled" if final_result["cancelled"] else "completed"
+            self.persistence.call("finish_session", self.session_id, status, {
+                "processed": enrichment_results["processed"],
+                "enriched": enrichment_results["enriched"],
+                "failed": enrichment_results["failed"],
+                "skipped": enrichment_results.get("skipped", 0),
+                "avg_quality_score": analytics["average_quality_score"],
+                "duration_seconds": final_result["execution_summary"]["duration_seconds"],
+                "output_file": output_file
+            })
+            self._finish_metrics(status, output_file=output_file, skipped=enrichment_results.get("skipped", 0))
+            self._emit_event("session_end", status, duration=final_result["execution_summary"]["duration_seconds"],
+                             processed=enrichment_results["processed"], enriched=enrichment_results["enriched"],
+                             output_file=output_file)
+            return final_result
             
         except Exception as e:
             self.logger.error(f"❌ Erreur critique Agent IA: {str(e)}")
+            self.persistence.call("finish_session", self.session_id, "failed", {"error": str(e)})
+            self._finish_metrics("failed", error=str(e))
+            self._emit_event("session_end", "failed", level=logging.ERROR, error=str(e))
             return self._build_error_result(e)
+        
+        finally:
+            self.enrichment_strategy.close()
+            if self.events is not None:
+                self.events.stop()
     
-    def _load_and_analyze_data(self):
-        """Délègue le chargement au module spécialisé"""
+    def _load_and_analyze_data(self, df=None, file_context: Dict[str, Any] = None):
+        """Délègue le chargement au module spécialisé (ou réutilise un dataset partagé)"""
         try:
-            df = self.data_loader.load_excel_file()
+            if df is None:
+                df = self.data_loader.load_excel_file()
+            else:
+                self.logger.info("♻️ Dataset partagé réutilisé (pas de relecture Excel)")
             
             if df is not None:
-                context = self.data_loader.analyze_file_context(df)
+                context = file_context or self.data_loader.analyze_file_context(df)
+                self.data_loader.file_context = context
                 self.logger.info(f"📊 Contexte fichier: {context['total_companies']} entreprises")
                 
             return df
@@ -129,9 +210,58 @@ class AIEnrichmentAgent:
         
         return sample_df
     
-    def _enrich_companies(self, sample_df):
-        """Délègue l'enrichissement au module spécialisé"""
+    def _content_hashes(self, df, sample_df) -> Dict[str, str]:
+        """Empreintes des SIRET de l'échantillon, calculées sur toutes leurs lignes du fichier"""
+        candidates = self.data_loader.select_sample(df, len(df))
+        keys = {
+            checkpoint_key(company.get('SIRET', ''), idx)
+            for idx, (_, company) in enumerate(sample_df.iterrows(), 1)
+        }
+        return group_content_hashes((company for _, company in candidates.iterrows()), keys)
+    
+    def _select_incremental_sample(self, df, sample_size: int, checkpointed: Dict[str, Dict[str, Any]] = None):
+        """
+        Mode incrémental : planification sur tout le fichier, puis échantillon composé
+        des sample_size premières lignes à enrichir et des lignes réutilisées (ordre original)
+        
+        Returns:
+            (échantillon, statistiques new/changed/failed/stale/reused du fichier,
+             enregistrements réutilisés par SIRET, empreintes par SIRET)
+        """
+        candidates = self.data_loader.select_sample(df, len(df))
+        rows = [company for _, company in candidates.iterrows()]
+        keys = [checkpoint_key(company.get('SIRET', ''), idx) for idx, company in enumerate(rows, 1)]
+        # Un SIRET en doublon est comparé sur l'empreinte de tout son groupe (celle enregistrée)
+        content_hashes = group_content_hashes(rows)
+        hashes = [content_hashes.get(key) or row_content_hash(company) for key, company in zip(keys, rows)]
+        
+        todo, stats, reused = self.persistence.plan_incremental(keys, hashes, checkpointed)
+        
+        # Les lignes réutilisées restent dans la sortie, les autres dans la limite de sample_size
+        keep, remaining = [], sample_size
+        for needed in todo:
+            keep.append(not needed or remaining > 0)
+            remaining -= needed
+        sample_df = candidates[keep]
+        stats["selected"] = sum(1 for needed, kept in zip(todo, keep) if needed and kept)
+        
+        self.logger.info(
+            f"Sélection échantillon incrémental ({stats['selected']}/{sum(todo)} entreprises à enrichir, "
+            f"{stats['reused']} réutilisée(s))"
+        )
+        self._log_sample_selection(sample_df)
+        self._emit_progress({
+            'type': 'info',
+            'message': f"📦 Incrémental: {stats['reused']} réutilisée(s), {stats['selected']} à enrichir"
+        })
+        return sample_df, stats, reused, content_hashes
+    
+    def _enrich_companies(self, sample_df, checkpointed: Dict[str, Dict[str, Any]] = None,
+                          incremental_stats: Dict[str, int] = None, content_hashes: Dict[str, str] = None,
+                          reused: Dict[str, Dict[str, Any]] = None):
+        """Délègue l'enrichissement au moteur concurrent puis agrège par index"""
         self.logger.info(f"🤖 Début enrichissement IA - Seuil qualité: {self.config['quality_threshold']}%")
+        self.logger.info(f"⚙️ Workers concurrents: {self.engine.max_workers}")
         
         results = {
             "processed": 0,
@@ -142,57 +272,273 @@ class AIEnrichmentAgent:
             "ai_decisions": []
         }
         
-        for idx, (_, company) in enumerate(sample_df.iterrows(), 1):
-            start_time = time.time()
+        companies = {idx: company for idx, (_, company) in enumerate(sample_df.iterrows(), 1)}
+        total = len(companies)
+        
+        # Déduplication : une seule recherche par SIRET (ou SIREN)
+        dedup_groups = self.deduplicator.group_rows(sample_df)
+        results["dedup_groups"] = {
+            str(rep): [str(member) for member in members]
+            for rep, members in dedup_groups.items() if len(members) > 1
+        }
+        results["deduplication"] = self.deduplicator.summarize(dedup_groups)
+        self.logger.info(
+            f"♻️ Déduplication: {results['deduplication']['total_rows']} lignes → "
+            f"{results['deduplication']['network_lookups']} recherches "
+            f"({results['deduplication']['lookups_saved']} économisées)"
+        )
+        self.metrics.set_total(len(dedup_groups))
+        
+        tasks = [(idx, companies[idx]) for idx in dedup_groups]
+        keys = {idx: checkpoint_key(company.get('SIRET', ''), idx) for idx, company in tasks}
+        hashes = {idx: (content_hashes or {}).get(keys[idx]) or row_content_hash(company) for idx, company in tasks}
+        
+        # Reprise : les entreprises du checkpoint ne repassent pas par le réseau
+        restored = {idx: checkpointed[keys[idx]] for idx, _ in tasks if keys[idx] in (checkpointed or {})}
+        if restored:
+            results["resumed"] = len(restored)
+            tasks = [(idx, company) for idx, company in tasks if idx not in restored]
+            self.logger.info(f"♻️ {len(restored)} entreprise(s) reprises du checkpoint, {len(tasks)} restante(s)")
+            self._emit_progress({
+                'type': 'info',
+                'message': f'♻️ {len(restored)} entreprise(s) reprises du checkpoint'
+            })
+            # Le dernier lot avant l'interruption a pu ne jamais atteindre le store (upsert idempotent)
+            for idx, outcome in restored.items():
+                self.persistence.record(keys[idx], idx, companies[idx], outcome, hashes[idx], checkpoint=False)
+        
+        if incremental_stats is not None:
+            results["incremental"] = incremental_stats
+        
+        # Incrémental : dernier résultat connu (store / historique), sans repasser par le réseau
+        reused_records = {
+            idx: reused[keys[idx]] for idx, _ in tasks
+            if idx not in restored and keys[idx] in (reused or {})
+        }
+        if reused_records:
+            results["reused"] = len(reused_records)
+            tasks = [(idx, company) for idx, company in tasks if idx not in reused_records]
+            self.logger.info(f"♻️ {len(reused_records)} entreprise(s) réutilisées, {len(tasks)} à enrichir")
+            # Checkpoint et store de la session, avec la date de l'enrichissement réel
+            for idx, record in reused_records.items():
+                self.persistence.record(keys[idx], idx, companies[idx], record["outcome"], hashes[idx],
+                                        record.get("enriched_at"))
+        
+        def enrich_task(company, idx):
+            # Point de contrôle entre entreprises (pause / annulation)
+            self.run_control.checkpoint()
             
-            try:
-                company_name = company.get('Nom courant/Dénomination', 'N/A')
-                self.logger.info(f"🔍 [{idx}/{len(sample_df)}] Traitement: {company_name}")
-                
-                # Déléguer l'enrichissement
-                enrichment_result = self.enrichment_strategy.enrich_single_company(
-                    company, idx, self.logger
-                )
-                
-                # Traçabilité
-                processing_time = time.time() - start_time
-                self.performance_metrics["processing_times"].append(processing_time)
-                
-                if enrichment_result["success"]:
-                    results["enriched"] += 1
-                    results["enrichment_data"][str(idx)] = enrichment_result["data"]
-                    results["quality_reports"][str(idx)] = enrichment_result["quality_report"]
-                    
-                    self.performance_metrics["quality_scores"].append(
-                        enrichment_result["quality_score"]
-                    )
-                    
-                    self.logger.info(f"✅ Succès - Score: {enrichment_result['quality_score']}%")
-                else:
-                    results["failed"] += 1
-                    self.performance_metrics["error_details"].append({
-                        "company_index": idx,
-                        "company_name": company_name,
-                        "error_reason": enrichment_result["error_reason"]
-                    })
-                    
-                    self.logger.warning(f"❌ Échec - Raison: {enrichment_result['error_reason']}")
-                
-                # Log décision IA
-                results["ai_decisions"].append(enrichment_result.get("ai_decision_log", {}))
-                results["processed"] += 1
-                
-                # Rate limiting
-                time.sleep(self.config["rate_limit_delay"])
-                
-            except Exception as e:
-                self.logger.error(f"❌ Erreur traitement entreprise {idx}: {str(e)}")
-                results["failed"] += 1
-                results["processed"] += 1
+            company_name = company.get('Nom courant/Dénomination', 'N/A')
+            self.logger.info(f"🔍 [{idx}/{total}] Traitement: {company_name}")
+            self._emit_progress({
+                'type': 'progress',
+                'current': idx,
+                'total': total,
+                'message': f'🔍 Traitement: {str(company_name)[:30]}...'
+            })
+            
+            # Déléguer l'enrichissement
+            return self.enrichment_strategy.enrich_single_company(
+                company, idx, self.logger
+            )
+        
+        completed = {"count": 0}
+        
+        def on_complete(idx, outcome):
+            self._emit_company_event("enrich", keys[idx], idx, outcome)
+            if outcome.get("cancelled"):
+                return
+            self.timer.record("company", outcome.get("processing_time", 0.0), error=outcome.get("error") is not None)
+            # Échec transitoire (moteurs suspendus) : ni checkpoint ni store, retenté à la reprise
+            self.metrics.record_outcome(idx, companies[idx].get('Nom courant/Dénomination', 'N/A'), outcome)
+            if not (outcome.get("result") or {}).get("transient", False):
+                self.persistence.record(keys[idx], idx, companies[idx], outcome, hashes[idx])
+            completed["count"] += 1
+            self._emit_progress(self._build_result_event(
+                idx, companies[idx], outcome, completed["count"], len(tasks)
+            ))
+        
+        for idx, outcome in restored.items():
+            self.metrics.record_outcome(idx, companies[idx].get('Nom courant/Dénomination', 'N/A'), outcome, restored=True)
+            self._emit_company_event("restore", keys[idx], idx, outcome)
+        
+        for idx, record in reused_records.items():
+            restored[idx] = record["outcome"]
+            self.metrics.record_outcome(idx, companies[idx].get('Nom courant/Dénomination', 'N/A'), record["outcome"],
+                                        restored=True)
+            self._emit_company_event("reuse", keys[idx], idx, record["outcome"])
+        
+        outcomes = dict(sorted({**restored, **self.engine.run(tasks, enrich_task, on_complete)}.items()))
+        self.persistence.flush()
+        
+        # Agrégation déterministe dans l'ordre des lignes
+        for idx, outcome in outcomes.items():
+            self._record_outcome(results, idx, companies[idx], outcome)
+        
+        if self.run_control.is_cancelled:
+            results["cancelled"] = True
+            results["skipped"] = sum(1 for outcome in outcomes.values() if outcome.get("cancelled"))
+            self.logger.warning(
+                f"⏹️ Enrichissement annulé ({self.run_control.cancel_reason}) - "
+                f"{results['skipped']} entreprise(s) non traitée(s)"
+            )
+            self._emit_progress({
+                'type': 'cancelled',
+                'message': f"⏹️ Annulé - {results['processed']} traitée(s), {results['skipped']} ignorée(s)"
+            })
         
         self.logger.info(f"🎯 Enrichissement terminé: {results['enriched']}/{results['processed']} succès")
         return results
     
+    def _record_phase(self, phase: str, phase_start: float) -> float:
+        """Enregistre la durée d'une phase, retourne le début de la suivante"""
+        now = time.monotonic()
+        self.metrics.record_phase(phase, now - phase_start)
+        self._emit_event("phase", "completed", duration=now - phase_start, phase=phase)
+        return now
+    
+    def _start_events(self, sample_size: int, resume_session: Optional[str], incremental: bool):
+        """Ouvre le journal JSON lines de la session (une erreur disque n'arrête pas l'agent)"""
+        self.events = SessionEventLog.from_config(self.config, self.session_id)
+        if self.events is None:
+            return
+        
+        try:
+            self.events.start()
+        except OSError as e:
+            self.logger.warning(f"⚠️ Journal d'événements désactivé: {e}")
+            self.events = None
+            return
+        
+        self._emit_event("session_start", "started", sample_size=sample_size,
+                         resumed_from=resume_session, incremental=incremental)
+    
+    def _emit_event(self, stage: str, outcome: Optional[str] = None, **fields):
+        """Publie un événement structuré (mise en file, écriture par le thread du journal)"""
+        if self.events is not None:
+            self.events.emit(stage, outcome, **fields)
+    
+    def _emit_company_event(self, stage: str, key: str, idx: int, outcome: Dict[str, Any]):
+        """Événement d'une entreprise : SIRET, décision IA, durée et résultat"""
+        if self.events is None:
+            return
+        
+        result = outcome.get("result") or {}
+        decision = result.get("ai_decision_log", {})
+        
+        if outcome.get("cancelled"):
+            status = "cancelled"
+        elif outcome.get("error") is not None:
+            status = "error"
+        else:
+            status = "enriched" if result.get("success") else "failed"
+        
+        self.events.emit(
+            stage, status,
+            siret=None if key.startswith("row-") else key,
+            row=idx,
+            duration=outcome.get("processing_time"),
+            level=logging.WARNING if status == "error" else logging.INFO,
+            decision=decision.get("decision"),
+            quality_score=result.get("quality_score"),
+            source=result.get("data", {}).get("search_source"),
+            website=result.get("data", {}).get("website"),
+            reason=outcome.get("error") or result.get("error_reason")
+        )
+    
+    def _finish_metrics(self, status: str, **kwargs):
+        """Clôture les métriques de session et persiste le snapshot final"""
+        if self.metrics is None:
+            return
+        
+        self.metrics.finish(status, **kwargs)
+        self.persistence.call("save_session_metrics", self.session_id, self.metrics.snapshot())
+    
+    def _record_outcome(self, results, idx, company, outcome):
+        """Intègre le résultat d'une entreprise dans les résultats et métriques"""
+        company_name = company.get('Nom courant/Dénomination', 'N/A')
+        
+        if outcome.get("cancelled"):
+            # Interrompue par l'annulation : ni succès ni échec
+            return
+        
+        if outcome["error"] is not None:
+            self.logger.error(f"❌ Erreur traitement entreprise {idx}: {outcome['error']}")
+            results["failed"] += 1
+            results["processed"] += 1
+            return
+        
+        enrichment_result = outcome["result"]
+        
+        # Traçabilité
+        self.performance_metrics["processing_times"].append(outcome["processing_time"])
+        
+        if enrichment_result["success"]:
+            results["enriched"] += 1
+            results["enrichment_data"][str(idx)] = enrichment_result["data"]
+            results["quality_reports"][str(idx)] = enrichment_result["quality_report"]
+            
+            self.performance_metrics["quality_scores"].append(
+                enrichment_result["quality_score"]
+            )
+            
+            self.logger.info(f"✅ Succès - Score: {enrichment_result['quality_score']}%")
+        else:
+            results["failed"] += 1
+            self.performance_metrics["error_details"].append({
+                "company_index": idx,
+                "company_name": company_name,
+                "error_reason": enrichment_result["error_reason"]
+            })
+            
+            self.logger.warning(f"❌ Échec - Raison: {enrichment_result['error_reason']}")
+        
+        # Log décision IA
+        results["ai_decisions"].append(enrichment_result.get("ai_decision_log", {}))
+        results["processed"] += 1
+    
+    def _emit_progress(self, event: Dict[str, Any]):
+        """Transmet un événement de progression (une erreur du callback n'arrête pas l'agent)"""
+        if self.progress_callback is None:
+            return
+        
+        try:
+            self.progress_callback({**event, 'session_id': self.session_id, 'timestamp': time.time()})
+        except Exception as e:
+            self.logger.debug(f"Callback de progression en erreur: {e}")
+    
+    def _build_result_event(self, idx, company, outcome, completed, total):
+        """Événement 'result' à la fin d'une entreprise"""
+        company_name = str(company.get('Nom courant/Dénomination', f'Entreprise_{idx}'))[:30]
+        event = {
+            'type': 'result',
+            'current': idx,
+            'completed': completed,
+            'total': total,
+            'percentage': round(completed / total * 100, 1) if total else 100.0
+        }
+        
+        enrichment_result = outcome["result"]
+        
+        if outcome["error"] is not None:
+            event.update({'success': False, 'message': f'❌ Erreur - {company_name} ({outcome["error"]})'})
+        elif enrichment_result["success"]:
+            event.update({
+                'success': True,
+                'message': f'✅ Enrichi - {company_name} (Score: {enrichment_result["quality_score"]}%)',
+                'data': {
+                    'website': enrichment_result["data"].get("website", "N/A"),
+                    'quality_score': enrichment_result["quality_score"]
+                }
+            })
+        else:
+            event.update({
+                'success': False,
+                'message': f'❌ Échec - {company_name} ({enrichment_result["error_reason"]})'
+            })
+        
+        return event
+    
     def _save_results(self, sample_df, enrichment_results):
         """Délègue la sauvegarde au module spécialisé"""
         try:
@@ -217,20 +563,43 @@ class AIEnrichmentAgent:
         if self.performance_metrics["quality_scores"]:
             avg_quality = sum(self.performance_metrics["quality_scores"]) / len(self.performance_metrics["quality_scores"])
         
-        return {
+        analytics = {
             "success_rate": round(success_rate, 1),
             "average_quality_score": round(avg_quality, 1),
             "total_processing_time": sum(self.performance_metrics["processing_times"]),
             "errors_summary": len(self.performance_metrics["error_details"])
         }
+        
+        if "deduplication" in enrichment_results:
+            dedup_stats = dict(enrichment_results["deduplication"])
+            dedup_stats["rows_enriched"] = sum(
+                len(enrichment_results["dedup_groups"].get(idx_str, [idx_str]))
+                for idx_str in enrichment_results["enrichment_data"]
+            )
+            analytics["deduplication"] = dedup_stats
+        
+        if "incremental" in enrichment_results:
+            analytics["incremental"] = enrichment_results["incremental"]
+        
+        web_search = self.enrichment_strategy.web_search
+        if web_search.result_cache is not None:
+            analytics["search_cache"] = web_search.result_cache.get_stats()
+        if web_search.page_cache is not None:
+            analytics["page_cache"] = web_search.page_cache.get_stats()
+        
+        return analytics
     
     def _build_final_result(self, sample_size, enrichment_results, output_file, analytics):
         """Construit le résultat final"""
         end_time = datetime.now()
         total_duration = (end_time - self.start_time).total_seconds()
         
+        cancelled = enrichment_results.get("cancelled", False)
+        
         return {
-            "status": "✅ ENRICHISSEMENT IA TERMINÉ",
+            "status": "⏹️ ENRICHISSEMENT IA ANNULÉ" if cancelled else "✅ ENRICHISSEMENT IA TERMINÉ",
+            "cancelled": cancelled,
+            "run_control": self.run_control.get_state(),
             "session_id": self.session_id,
             "execution_summary": {
                 "sample_size": sample_size,
@@ -241,6 +610,8 @@ class AIEnrichmentAgent:
             },
             "advanced_analytics": analytics,
             "output_file": output_file,
+            "checkpoint_file": str(self.persistence.checkpoint.path) if self.persistence.checkpoint is not None else None,
+            "stage_timings": self.timer.summary(),
             "detailed_results": enrichment_results
         }
     
@@ -258,6 +629,11 @@ class AIEnrichmentAgent:
     
     def _log_sample_selection(self, sample_df):
         """Log des entreprises sélectionnées"""
+        if sample_df.empty:
+            # Incrémental : tout le fichier est à jour
+            self.logger.info("Échantillon final: 0 entreprise (rien à enrichir)")
+            return
+        
         missing_names = sample_df[
             sample_df['Nom courant/Dénomination'].astype(str).str.strip().isin([
                 '', 'INFORMATION NON-DIFFUSIBLE', 'nan', 'NaN'
@@ -43,13 +43,68 @@ class OutputConfig:
 DEFAULT_CONFIG: Dict[str, Any] = {
     # Qualité et validation
     "quality_threshold": 60,  # Plus permissif que 85
-    "rate_limit_delay": 3,
     "search_mode": "real",  # "real" ou "simulation"
     "max_retries": 2,
     "duckduckgo_timeout": 10,
     "validation_timeout": 8,
     "fallback_enabled": True,
     
+    # Concurrence et débit
+    "max_workers": 4,  # Entreprises enrichies en parallèle
+    "rate_limits": {  # Intervalle minimum (s) entre requêtes, par source (remplace rate_limit_delay)
+        "duckduckgo": 2.0,
+        "google": 5.0
+    },
+    "rate_limit_bursts": {  # Capacité du seau : requêtes émises sans attente après une pause
+        "duckduckgo": 2,
+        "google": 1
+    },
+    "rate_limit_host_interval": 1.0,  # Intervalle minimum (s) entre deux pages d'un même site
+    "rate_limit_backoff_max": 8.0,  # Multiplicateur maximum après HTTP 202 / 429
+    "rate_limit_backoff_recovery": 0.8,  # Retour progressif au débit nominal
+    "circuit_breaker_threshold": 3,  # Échecs (202 / 429, page non reconnue) ouvrant le disjoncteur d'un moteur
+    "circuit_breaker_window": 60.0,  # Fenêtre de comptage des échecs (s)
+    "circuit_breaker_cooldown": 30.0,  # Ouverture avant la requête sonde (s)
+    "circuit_breaker_max_cooldown": 300.0,  # Plafond après sondes en échec (s)
+    "circuit_breaker_max_park": 30.0,  # Attente max d'une requête quand tous les moteurs sont ouverts (s)
+    "fetch_max_in_flight": 16,  # Pages candidates téléchargées simultanément, tous sites confondus
+    "fetch_max_per_host": 2,  # Téléchargements simultanés sur un même site
+    "fetch_respect_robots": True,  # robots.txt consulté avant de télécharger une page
+    "fetch_robots_ttl_hours": 24,
+    "fetch_max_crawl_delay": 30.0,  # Plafond du Crawl-delay annoncé par un site (s)
+    "page_max_bytes": 256 * 1024,  # Octets lus au plus par page candidate (corps décompressé)
+    "serp_parser": "auto",  # Parsing des résultats : auto, selectolax, lxml, targeted, bs4
+    "search_backend": "sync",  # "sync" (requests) ou "async" (httpx, boucle partagée par les workers)
+    "async_max_connections": 100,  # Pool HTTP du backend asyncio
+    "async_max_connections_per_host": 4,
+    
+    # Cache persistant des résultats de recherche
+    "search_cache_enabled": True,
+    "search_cache_path": "data/cache/search_results.sqlite3",
+    "search_cache_ttl_hours": 72,
+    "search_cache_negative_ttl_hours": 12,  # Résultats vides
+    "search_cache_max_entries": 50000,
+    
+    # Cache partagé des pages candidates (validation)
+    "page_cache_enabled": True,
+    "page_cache_ttl_minutes": 60,  # Au-delà : revalidation ETag / Last-Modified
+    "page_cache_max_entries": 2000,
+    
+    # Déduplication avant enrichissement
+    "dedup_enabled": True,
+    "dedup_by_siren": False,  # True : établissements d'une même entreprise partagent la recherche
+    
+    # Checkpoints incrémentaux (reprise après crash)
+    "checkpoint_enabled": True,
+    "checkpoint_dir": "data/checkpoints",
+    "incremental_ttl_days": 30,  # Mode incrémental : au-delà, l'entreprise est ré-enrichie
+    "incremental_failure_ttl_hours": 24,  # Entreprise non trouvée : retentée au-delà de ce délai
+    
+    # Store SQLite des enrichissements (rapports, statut, exports, incrémental)
+    "enrichment_store_enabled": True,
+    "enrichment_store_path": "data/store/enrichment.sqlite3",
+    "enrichment_store_batch_size": 50,  # Entreprises par upsert groupé
+    
     # Paths et fichiers
     "raw_data_dir": "data/raw",
     "processed_data_dir": "data/processed", 
@@ -58,6 +113,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     # Session et logging
     "log_level": "INFO",
     "detailed_logging": True,
+    "event_log_enabled": True,  # Journal JSON lines logs/ai_agent_<session>.events.jsonl
     "session_id_format": "%Y%m%d_%H%M%S",
     
     # Sources et priorités
@@ -119,7 +175,7 @@ def validate_config(config: Dict[str, Any]) -> bool:
     """Valide que la configuration est cohérente"""
     
     required_keys = [
-        "quality_threshold", "rate_limit_delay", "search_mode",
+        "quality_threshold", "search_mode",
         "raw_data_dir", "processed_data_dir", "logs_dir"
     ]
     
@@ -132,8 +188,32 @@ def validate_config(config: Dict[str, Any]) -> bool:
     if not 0 <= config["quality_threshold"] <= 100:
         raise ValueError("quality_threshold doit être entre 0 et 100")
     
-    if config["rate_limit_delay"] < 0:
-        raise ValueError("rate_limit_delay doit être positif")
+    if config.get("max_workers", 1) < 1:
+        raise ValueError("max_workers doit être supérieur ou égal à 1")
+    
+    if any(interval < 0 for interval in config.get("rate_limits", {}).values()):
+        raise ValueError("rate_limits doit contenir des intervalles positifs")
+    
+    if any(burst < 1 for burst in config.get("rate_limit_bursts", {}).values()):
+        raise ValueError("rate_limit_bursts doit contenir des capacités supérieures ou égales à 1")
+    
+    if config.get("rate_limit_backoff_max", 8.0) < 1:
+        raise ValueError("rate_limit_backoff_max doit être supérieur ou égal à 1")
+    
+    if config.get("incremental_ttl_days", 30) < 0 or config.get("incremental_failure_ttl_hours", 24) < 0:
+        raise ValueError("incremental_ttl_days et incremental_failure_ttl_hours doivent être positifs")
+    
+    if config.get("circuit_breaker_threshold", 3) < 1:
+        raise ValueError("circuit_breaker_threshold doit être supérieur ou égal à 1")
+    
+    if config.get("fetch_max_in_flight", 1) < 1 or config.get("fetch_max_per_host", 1) < 1:
+        raise ValueError("fetch_max_in_flight et fetch_max_per_host doivent être supérieurs ou égaux à 1")
+    
+    if config.get("serp_parser", "auto") not in ["auto", "selectolax", "lxml", "targeted", "bs4"]:
+        raise ValueError("serp_parser doit être 'auto', 'selectolax', 'lxml', 'targeted' ou 'bs4'")
+    
+    if config.get("search_backend", "sync") not in ["sync", "async"]:
+        raise ValueError("search_backend doit être 'sync' ou 'async'")
     
     if config["search_mode"] not in ["real", "simulation"]:
         raise ValueError("search_mode doit être 'real' ou 'simulation'")
@@ -0,0 +1,95 @@
+# ============================================================================
+# MOTEUR D'ENRICHISSEMENT CONCURRENT
+# mg-platform/mcp_server/tools/ai_agent/core/engine.py
+# ============================================================================
+
+"""
+Moteur d'exécution concurrente des enrichissements
+Responsabilités:
+- Pool de workers borné (max_workers configurable)
+- Plusieurs entreprises en vol simultanément
+- Collecte des résultats indexés par ligne (agrégation déterministe)
+- Aucune temporisation ici : le débit est géré par le RateLimiter des sources
+- Tâches interrompues par annulation marquées "cancelled" (ni succès ni échec)
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Tuple, Callable, Optional
+
+import pandas as pd
+
+from .exceptions import EnrichmentCancelledError
+
+
+# Tâche = (index 1-based de la ligne dans l'échantillon, données entreprise)
+EnrichmentTask = Tuple[int, pd.Series]
+
+
+class ConcurrentEnrichmentEngine:
+    """Exécute une fonction d'enrichissement sur N entreprises en parallèle"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.max_workers = max(1, int(config.get("max_workers", 1)))
+
+    def run(self, tasks: List[EnrichmentTask],
+            worker: Callable[[pd.Series, int], Dict[str, Any]],
+            on_complete: Optional[Callable[[int, Dict[str, Any]], None]] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Lance les enrichissements et collecte les résultats
+
+        Args:
+            tasks: Liste de (index, entreprise)
+            worker: Fonction d'enrichissement d'une entreprise
+            on_complete: Callback appelé à chaque fin de tâche (ordre d'arrivée)
+
+        Returns:
+            Dict index -> résultat, trié par index de ligne
+        """
+        outcomes: Dict[int, Dict[str, Any]] = {}
+
+        if not tasks:
+            return outcomes
+
+        workers = min(self.max_workers, len(tasks))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich") as executor:
+            futures = {
+                executor.submit(self._run_task, worker, company, idx): idx
+                for idx, company in tasks
+            }
+
+            for future in as_completed(futures):
+                idx = futures[future]
+                outcome = future.result()
+                outcomes[idx] = outcome
+
+                if on_complete:
+                    on_complete(idx, outcome)
+
+        return dict(sorted(outcomes.items()))
+
+    def _run_task(self, worker: Callable, company: pd.Series, idx: int) -> Dict[str, Any]:
+        """Exécute une tâche et capture durée + exception éventuelle"""
+        start_time = time.time()
+
+        cancelled = False
+
+        try:
+            result = worker(company, idx)
+            error = None
+        except EnrichmentCancelledError as e:
+            result = None
+            error = str(e)
+            cancelled = True
+        except Exception as e:
+            result = None
+            error = str(e)
+
+        return {
+            "result": result,
+            "error": error,
+            "cancelled": cancelled,
+            "processing_time": time.time() - start_time
+        }
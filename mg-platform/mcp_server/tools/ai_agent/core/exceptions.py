@@ -23,6 +23,10 @@ class EnrichmentError(AIAgentError):
     """Erreur lors de l'enrichissement"""
     pass
 
+class EnrichmentCancelledError(EnrichmentError):
+    """Enrichissement interrompu par une annulation coopérative"""
+    pass
+
 class SearchError(AIAgentError):
     """Erreur lors des recherches web/LinkedIn"""
     pass
@@ -0,0 +1,186 @@
+# ============================================================================
+# PERSISTANCE DE SESSION - Checkpoint, store et planification incrémentale
+# mg-platform/mcp_server/tools/ai_agent/core/persistence.py
+# ============================================================================
+
+"""
+Persistance des résultats d'une session d'enrichissement
+Responsabilités:
+- Checkpoint de la session (création, reprise, une ligne par entreprise terminée)
+- Store SQLite : upserts groupés, une erreur SQLite n'arrête pas l'agent
+- Mode incrémental : comparaison de chaque SIRET à son dernier enrichissement connu
+"""
+
+import sqlite3
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from .exceptions import EnrichmentError
+from ..output.checkpoint import CheckpointStore
+from ..utils.session_metrics import SessionMetrics
+
+
+class SessionPersistence:
+    """Checkpoint et store d'enrichissement d'une session"""
+
+    def __init__(self, config: Dict[str, Any], session_id: str, logger, store=None):
+        """
+        Args:
+            config: Configuration de l'agent
+            session_id: Session courante (remplacée par la session reprise)
+            logger: Logger de la session
+            store: Store d'enrichissement partagé (None si désactivé)
+        """
+        self.config = config
+        self.session_id = session_id
+        self.logger = logger
+        self.store = store
+        self.checkpoint: Optional[CheckpointStore] = None
+        self.metrics: Optional[SessionMetrics] = None  # Snapshot persisté à chaque lot
+
+        self._buffer: List[Dict[str, Any]] = []
+
+    def open_checkpoint(self, resume_session: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Ouvre le checkpoint de la session (celui de resume_session en reprise)
+
+        Returns:
+            Résultats déjà enregistrés, par clé SIRET
+        """
+        if resume_session and not CheckpointStore.is_valid_session_id(resume_session):
+            raise EnrichmentError(f"Identifiant de session invalide: {resume_session!r}")
+
+        if resume_session:
+            # La reprise prolonge la session d'origine (checkpoint et fichier de sortie)
+            self.logger.info(f"♻️ Reprise de la session {resume_session} (session courante {self.session_id})")
+            self.session_id = resume_session
+
+        self.checkpoint = CheckpointStore.from_config(self.config, self.session_id)
+
+        if self.checkpoint is None or not resume_session:
+            return {}
+
+        if not self.checkpoint.exists():
+            raise EnrichmentError(f"Aucun checkpoint pour la session {resume_session}")
+
+        checkpointed = self.checkpoint.load()
+        self.logger.info(f"♻️ Checkpoint: {len(checkpointed)} entreprise(s) déjà enrichie(s)")
+        return checkpointed
+
+    def record(self, key: str, idx: int, company, outcome: Dict[str, Any], content_hash: Optional[str] = None,
+               enriched_at: Optional[float] = None, checkpoint: bool = True):
+        """
+        Enregistre le résultat d'une entreprise : checkpoint puis lot du store
+
+        Args:
+            checkpoint: False pour un résultat déjà présent dans le checkpoint (reprise)
+        """
+        if checkpoint and self.checkpoint is not None:
+            self._append_checkpoint(key, idx, outcome, content_hash, enriched_at)
+
+        if self.store is None:
+            return
+
+        self._buffer.append({
+            "siret": self._store_key(key),
+            "row_idx": idx,
+            "company": company,
+            "outcome": outcome,
+            "content_hash": content_hash,
+            "enriched_at": enriched_at
+        })
+
+        if len(self._buffer) >= self.config.get("enrichment_store_batch_size", 50):
+            self.flush()
+
+    def flush(self):
+        """Écrit le lot en attente dans le store"""
+        if not self._buffer:
+            return
+
+        batch, self._buffer = self._buffer, []
+        self.call("upsert_results", self.session_id, batch)
+        if self.metrics is not None:
+            self.call("save_session_metrics", self.session_id, self.metrics.snapshot())
+
+    def call(self, method: str, *args):
+        """Appel du store d'enrichissement (une erreur SQLite n'arrête pas l'agent)"""
+        if self.store is None:
+            return
+
+        try:
+            getattr(self.store, method)(*args)
+        except sqlite3.Error as e:
+            self.logger.warning(f"⚠️ Store d'enrichissement ({method}): {e}")
+
+    def plan_incremental(self, keys: List[str], hashes: List[str],
+                         checkpointed: Dict[str, Dict[str, Any]] = None) -> Tuple[List[bool], Dict[str, int], Dict[str, Any]]:
+        """
+        Compare chaque ligne au dernier enrichissement connu de son SIRET
+
+        Args:
+            keys: Clé de checkpoint de chaque ligne
+            hashes: Empreinte du contenu de chaque ligne (celle du groupe pour un SIRET en doublon)
+            checkpointed: Résultats du checkpoint repris (lignes conservées dans l'échantillon)
+
+        Returns:
+            (masque des lignes à enrichir, statistiques new/changed/failed/stale/reused,
+             enregistrements réutilisés par clé)
+        """
+        # Store SQLite (lookup indexé par SIRET), journaux de checkpoint à défaut
+        if self.store is not None:
+            history = self.store.get_companies(sorted({key for key in keys if not key.startswith("row-")}))
+        else:
+            history = CheckpointStore.load_history(self.config.get("checkpoint_dir", "data/checkpoints"))
+        max_age = self.config.get("incremental_ttl_days", 30) * 86400
+        failure_max_age = self.config.get("incremental_failure_ttl_hours", 24) * 3600
+        now = time.time()
+
+        todo, reused = [], {}
+        stats = {"new": 0, "changed": 0, "failed": 0, "stale": 0, "reused": 0}
+
+        for key, content_hash in zip(keys, hashes):
+            # Reprise : la ligne reste dans l'échantillon, son résultat vient du checkpoint
+            if key in (checkpointed or {}):
+                todo.append(True)
+                continue
+
+            record = history.get(key)
+            outcome = (record or {}).get("outcome") or {}
+            age = now - (record or {}).get("enriched_at", 0)
+
+            # Sans SIRET, la clé (index de ligne) n'est pas stable d'un fichier à l'autre
+            if record is None or key.startswith("row-") or not outcome:
+                status = "new"
+            elif record.get("content_hash") != content_hash:
+                status = "changed"
+            elif not (outcome.get("result") or {}).get("success") and (
+                    outcome.get("error") is not None or (outcome.get("result") or {}).get("transient")
+                    or age > failure_max_age):
+                # Échec : retenté après un délai court (erreur technique, moteurs suspendus : toujours)
+                status = "failed"
+            elif age > max_age:
+                status = "stale"
+            else:
+                status = "reused"
+                reused[key] = record
+
+            stats[status] += 1
+            todo.append(status != "reused")
+
+        self.logger.info(
+            f"📦 Incrémental: {stats['reused']} réutilisée(s), {stats['new']} nouvelle(s), "
+            f"{stats['changed']} modifiée(s), {stats['failed']} en échec, {stats['stale']} périmée(s)"
+        )
+        return todo, stats, reused
+
+    def _store_key(self, key: str) -> str:
+        """Clé du store : le SIRET, ou la clé de ligne préfixée par la session (sans SIRET)"""
+        return f"{self.session_id}:{key}" if key.startswith("row-") else key
+
+    def _append_checkpoint(self, key, idx, outcome, content_hash=None, enriched_at=None):
+        """Enregistre une entreprise terminée (une erreur disque n'arrête pas l'agent)"""
+        try:
+            self.checkpoint.append(key, idx, outcome, content_hash, enriched_at)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"⚠️ Checkpoint non écrit pour l'entreprise {idx}: {e}")
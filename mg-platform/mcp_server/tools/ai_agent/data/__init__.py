@@ -8,6 +8,7 @@ Module data de l'Agent IA - Chargement et traitement des données
 """
 
 from .loader import DataLoader
+from .deduplicator import CompanyDeduplicator
 
 # Imports futurs quand les modules seront créés
 # from .analyzer import DataAnalyzer
@@ -16,6 +17,7 @@ from .loader import DataLoader
 __all__ = [
     # Actuellement disponible
     "DataLoader",
+    "CompanyDeduplicator",
     
     # À venir
     # "DataAnalyzer",
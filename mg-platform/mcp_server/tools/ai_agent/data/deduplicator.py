@@ -0,0 +1,76 @@
+# ============================================================================
+# DÉDUPLICATION SIRET / SIREN
+# mg-platform/mcp_server/tools/ai_agent/data/deduplicator.py
+# ============================================================================
+
+"""
+Module de déduplication des lignes avant enrichissement
+Responsabilités:
+- Regroupement des lignes par SIRET (ou par SIREN en option)
+- Une seule recherche réseau par groupe (ligne représentante)
+- Statistiques des recherches économisées
+"""
+
+import pandas as pd
+from typing import Dict, Any, List
+
+from ..utils.validators import normalize_siret
+
+
+class CompanyDeduplicator:
+    """Regroupe les lignes d'un échantillon partageant le même établissement"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.enabled = config.get("dedup_enabled", True)
+        self.by_siren = config.get("dedup_by_siren", False)
+
+    def group_rows(self, sample_df: pd.DataFrame) -> Dict[int, List[int]]:
+        """
+        Regroupe les lignes de l'échantillon
+
+        Args:
+            sample_df: DataFrame échantillon
+
+        Returns:
+            Dict index représentant -> index des lignes membres
+            (index 1-based dans l'ordre de l'échantillon, représentant = 1ère occurrence)
+        """
+        groups: Dict[int, List[int]] = {}
+        representative_by_key: Dict[str, int] = {}
+
+        sirets = sample_df["SIRET"] if "SIRET" in sample_df.columns else [""] * len(sample_df)
+
+        for idx, siret in enumerate(sirets, 1):
+            key = self._group_key(siret) if self.enabled else ""
+
+            # Sans clé exploitable, la ligne reste isolée
+            if not key:
+                groups[idx] = [idx]
+                continue
+
+            if key in representative_by_key:
+                groups[representative_by_key[key]].append(idx)
+            else:
+                representative_by_key[key] = idx
+                groups[idx] = [idx]
+
+        return groups
+
+    def _group_key(self, siret: Any) -> str:
+        """Clé de regroupement : SIRET normalisé (14 chiffres) ou SIREN (9 chiffres)"""
+        siret_clean = normalize_siret(siret)
+        return siret_clean[:9] if self.by_siren else siret_clean
+
+    def summarize(self, groups: Dict[int, List[int]]) -> Dict[str, Any]:
+        """Statistiques de déduplication pour les analytics"""
+        total_rows = sum(len(members) for members in groups.values())
+        lookups = len(groups)
+
+        return {
+            "group_key": "SIREN" if self.by_siren else "SIRET",
+            "total_rows": total_rows,
+            "network_lookups": lookups,
+            "lookups_saved": total_rows - lookups,
+            "duplicate_groups": sum(1 for members in groups.values() if len(members) > 1)
+        }
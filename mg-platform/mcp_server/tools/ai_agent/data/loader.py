@@ -7,7 +7,7 @@
 Module de chargement et analyse des fichiers Excel
 Responsabilités:
 - Auto-détection fichier Excel dans data/raw/
-- Lecture sécurisée avec pandas
+- Lecture sécurisée avec pandas (cache colonnaire Feather entre deux lectures)
 - Analyse contexte (colonnes, données manquantes)
 - Sélection échantillon (ordre original respecté)
 """
@@ -19,6 +19,7 @@ from typing import Dict, Any, Optional
 
 from ..core.exceptions import DataLoadError, DataValidationError
 from ..core.config import COLUMN_MAPPING
+from ...excel_cache import read_excel_cached
 
 
 class DataLoader:
@@ -28,25 +29,26 @@ class DataLoader:
         self.config = config
         self.file_context = {}
     
-    def load_excel_file(self, file_path: str = None) -> Optional[pd.DataFrame]:
+    def load_excel_file(self, file_path: str = None, fingerprint: str = None) -> Optional[pd.DataFrame]:
         """
         Charge un fichier Excel depuis data/raw/ avec auto-détection
         
         Args:
             file_path: Chemin spécifique (optionnel)
+            fingerprint: Empreinte du fichier déjà calculée (optionnel)
             
         Returns:
             DataFrame ou None si échec
         """
         try:
             if file_path is None:
-                file_path = self._find_excel_file()
+                file_path = self.find_excel_file()
             
             if not file_path:
                 raise DataLoadError("Aucun fichier Excel trouvé dans data/raw/")
             
             # Lecture avec gestion d'erreurs
-            df = self._read_excel_safe(file_path)
+            df = self._read_excel_safe(file_path, fingerprint)
             
             # Nettoyage basique
             df = self._clean_dataframe(df)
@@ -59,7 +61,7 @@ class DataLoader:
         except Exception as e:
             raise DataLoadError(f"Erreur chargement fichier: {str(e)}")
     
-    def _find_excel_file(self) -> Optional[str]:
+    def find_excel_file(self) -> Optional[str]:
         """Auto-détection du fichier Excel"""
         try:
             # Construire le chemin depuis la racine du projet
@@ -77,8 +79,12 @@ class DataLoader:
         except Exception:
             return None
     
-    def _read_excel_safe(self, file_path: str) -> pd.DataFrame:
-        """Lecture sécurisée avec fallbacks"""
+    def _read_excel_safe(self, file_path: str, fingerprint: str = None) -> pd.DataFrame:
+        """Lecture sécurisée via le cache colonnaire (invalidé si l'Excel change)"""
+        return read_excel_cached(file_path, reader=self._read_excel_uncached, fingerprint=fingerprint)
+    
+    def _read_excel_uncached(self, file_path: str) -> pd.DataFrame:
+        """Lecture Excel directe avec fallbacks"""
         try:
             # Essayer avec openpyxl d'abord
             df = pd.read_excel(file_path, engine='openpyxl')
@@ -16,19 +16,33 @@ import pandas as pd
 from typing import Dict, Any, Optional
 
 from ..search.web_search import WebSearchEngine
+from ..search.async_web_search import AsyncSearchRunner
 from ..search.fallback import IntelligentFallbackGenerator
 from ..enrichment.validation import QualityValidator
-from ..core.exceptions import EnrichmentError
+from ..core.exceptions import EnrichmentError, EnrichmentCancelledError
+from ..utils.run_control import RunControl
+from ..utils.stage_timer import StageTimer
 
 
 class EnrichmentStrategy:
     """Orchestrateur des stratégies d'enrichissement"""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], run_control: Optional[RunControl] = None,
+                 timer: Optional[StageTimer] = None):
         self.config = config
-        self.web_search = WebSearchEngine(config)
+        self.timer = timer or StageTimer()
+        # Backend asyncio sur option : client HTTP mutualisé par toute la session
+        if config.get("search_backend", "sync") == "async":
+            self.web_search = AsyncSearchRunner(config, run_control, self.timer)
+        else:
+            self.web_search = WebSearchEngine(config, run_control, self.timer)
         self.fallback_generator = IntelligentFallbackGenerator(config)
-        self.quality_validator = QualityValidator(config)
+        self.quality_validator = QualityValidator(config, self.timer)
+    
+    def close(self):
+        """Libère les ressources du backend de recherche (boucle et client asyncio)"""
+        if isinstance(self.web_search, AsyncSearchRunner):
+            self.web_search.close()
     
     def enrich_single_company(self, company: pd.Series, company_idx: int, logger) -> Dict[str, Any]:
         """
@@ -62,7 +76,9 @@ class EnrichmentStrategy:
                 return {
                     "success": False,
                     "error_reason": strategy_result["error_reason"],
+                    "transient": strategy_result.get("transient", False),
                     "attempted_searches": strategy_result.get("attempted_queries", []),
+                    "candidates": strategy_result.get("candidates", []),
                     "ai_decision_log": {
                         "decision": "NO_RESULTS",
                         "search_strategy": company_data["search_strategy"],
@@ -80,6 +96,7 @@ class EnrichmentStrategy:
                     "success": False,
                     "error_reason": validation_result["error_reason"],
                     "attempted_searches": strategy_result.get("attempted_queries", []),
+                    "candidates": strategy_result.get("candidates", []),
                     "ai_decision_log": {
                         "decision": "QUALITY_REJECTED",
                         "quality_score": validation_result["quality_score"],
@@ -94,6 +111,8 @@ class EnrichmentStrategy:
                 "data": strategy_result["data"],
                 "quality_score": validation_result["quality_score"],
                 "quality_report": validation_result,
+                "attempted_searches": strategy_result.get("attempted_queries", []),
+                "candidates": strategy_result.get("candidates", []),
                 "ai_decision_log": {
                     "decision": "ACCEPTED",
                     "quality_score": validation_result["quality_score"],
@@ -103,6 +122,8 @@ class EnrichmentStrategy:
                 }
             }
             
+        except EnrichmentCancelledError:
+            raise
         except Exception as e:
             return {
                 "success": False,
@@ -172,6 +193,9 @@ class EnrichmentStrategy:
             company_data["commune"]
         )
         
+        if web_result.get("transient"):
+            return self._transient_failure(web_result, logger)
+        
         if web_result["found"]:
             logger.info(f"✅ Site web trouvé: {web_result['website']}")
             
@@ -185,26 +209,30 @@ class EnrichmentStrategy:
                     "ai_validation_score": web_result["confidence"]
                 },
                 "source": "WEB_SEARCH_REAL",
-                "attempted_queries": web_result.get("attempted_queries", [])
+                "attempted_queries": web_result.get("attempted_queries", []),
+                "candidates": web_result.get("candidates", [])
             }
         
         # 2. Fallback intelligent si échec
         if self.config.get("fallback_enabled", True):
             logger.info("🔄 Fallback vers génération intelligente")
             
-            fallback_result = self.fallback_generator.generate_company_data(company_data)
+            with self.timer.span("fallback_generation"):
+                fallback_result = self.fallback_generator.generate_company_data(company_data)
             
             if fallback_result["found"]:
                 # Marquer clairement comme fallback
                 fallback_result["data"]["ai_validation_score"] = fallback_result["confidence"]
                 fallback_result["attempted_queries"] = web_result.get("attempted_queries", [])
+                fallback_result["candidates"] = web_result.get("candidates", [])
                 
                 return fallback_result
         
         return {
             "found": False,
             "error_reason": "Aucune donnée fiable trouvée (web + fallback)",
-            "attempted_queries": web_result.get("attempted_queries", [])
+            "attempted_queries": web_result.get("attempted_queries", []),
+            "candidates": web_result.get("candidates", [])
         }
     
     def _execute_alternative_strategy(self, company_data: Dict, logger) -> Dict[str, Any]:
@@ -218,6 +246,9 @@ class EnrichmentStrategy:
             company_data["commune"]
         )
         
+        if web_result.get("transient"):
+            return self._transient_failure(web_result, logger)
+        
         if web_result["found"]:
             logger.info(f"✅ Site web trouvé via recherche alternative: {web_result['website']}")
             
@@ -232,24 +263,40 @@ class EnrichmentStrategy:
                     "ai_validation_score": web_result["confidence"]
                 },
                 "source": "WEB_SEARCH_ALTERNATIVE",
-                "attempted_queries": web_result.get("attempted_queries", [])
+                "attempted_queries": web_result.get("attempted_queries", []),
+                "candidates": web_result.get("candidates", [])
             }
         
         # 2. Génération intelligente (prioritaire pour NON-DIFFUSIBLE)
         logger.info("🤖 Génération intelligente pour entreprise anonyme")
         
-        fallback_result = self.fallback_generator.generate_company_data(company_data)
+        with self.timer.span("fallback_generation"):
+            fallback_result = self.fallback_generator.generate_company_data(company_data)
         
         if fallback_result["found"]:
             fallback_result["data"]["ai_validation_score"] = fallback_result["confidence"]
             fallback_result["attempted_queries"] = web_result.get("attempted_queries", [])
+            fallback_result["candidates"] = web_result.get("candidates", [])
             
             return fallback_result
         
         return {
             "found": False,
             "error_reason": "Échec recherche alternative + génération",
-            "attempted_queries": web_result.get("attempted_queries", [])
+            "attempted_queries": web_result.get("attempted_queries", []),
+            "candidates": web_result.get("candidates", [])
+        }
+    
+    def _transient_failure(self, web_result: Dict, logger) -> Dict[str, Any]:
+        """Moteurs indisponibles : pas de fallback, l'entreprise sera retentée plus tard"""
+        logger.warning(f"⏸️ {web_result['error_reason']} - entreprise à retenter")
+        
+        return {
+            "found": False,
+            "transient": True,
+            "error_reason": web_result["error_reason"],
+            "attempted_queries": web_result.get("attempted_queries", []),
+            "candidates": web_result.get("candidates", [])
         }
     
     def _validate_enrichment_quality(self, strategy_result: Dict, company_data: Dict, logger) -> Dict[str, Any]:
@@ -13,14 +13,17 @@ Responsabilités:
 """
 
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from ..utils.stage_timer import StageTimer
 
 
 class QualityValidator:
     """Validateur de qualité avec scoring adaptatif"""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], timer: Optional[StageTimer] = None):
         self.config = config
+        self.timer = timer or StageTimer()
     
     def validate_enrichment_result(self, strategy_result: Dict, company_data: Dict, threshold: int) -> Dict[str, Any]:
         """
@@ -35,6 +38,12 @@ class QualityValidator:
             Dict avec validation et score
         """
         
+        with self.timer.span("quality_validation"):
+            return self._validate(strategy_result, company_data, threshold)
+    
+    def _validate(self, strategy_result: Dict, company_data: Dict, threshold: int) -> Dict[str, Any]:
+        """Calcul du score et décision (chronométré par validate_enrichment_result)"""
+        
         # Récupérer le score de confiance de la stratégie
         ai_confidence = strategy_result["data"].get("ai_validation_score", 0)
         
@@ -8,6 +8,8 @@ Module output de l'Agent IA - Sauvegarde et génération de rapports
 """
 
 from .excel_writer import ExcelWriter
+from .checkpoint import CheckpointStore, checkpoint_key, row_content_hash, group_content_hashes
+from .enrichment_store import EnrichmentStore, get_enrichment_store
 
 # Imports futurs
 # from .colorizer import ExcelColorizer
@@ -16,6 +18,12 @@ from .excel_writer import ExcelWriter
 __all__ = [
     # Actuellement disponible
     "ExcelWriter",
+    "CheckpointStore",
+    "checkpoint_key",
+    "row_content_hash",
+    "group_content_hashes",
+    "EnrichmentStore",
+    "get_enrichment_store",
     
     # À venir
     # "ExcelColorizer",
@@ -0,0 +1,192 @@
+# ============================================================================
+# CHECKPOINTS D'ENRICHISSEMENT
+# mg-platform/mcp_server/tools/ai_agent/output/checkpoint.py
+# ============================================================================
+
+"""
+Persistance incrémentale des résultats d'enrichissement
+Responsabilités:
+- Journal append-only par session (JSON lines), une ligne par entreprise terminée
+- Clé = SIRET normalisé (ligne de l'échantillon à défaut de SIRET)
+- Écriture synchronisée sur disque à chaque entreprise (survit à un crash)
+- Relecture tolérante : une dernière ligne tronquée est ignorée
+- Historique toutes sessions (mode incrémental) : dernier résultat par SIRET + hash du contenu
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Set
+
+from ..utils.validators import normalize_siret
+
+# Identifiant de session utilisable dans un nom de fichier (checkpoint, sortie Excel, journal)
+SESSION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_]+$')
+
+
+def checkpoint_key(siret: Any, row_idx: int) -> str:
+    """Clé de checkpoint d'une entreprise : SIRET 14 chiffres, sinon index de ligne"""
+    return normalize_siret(siret) or f"row-{row_idx}"
+
+
+def row_content_hash(company: Any) -> str:
+    """Empreinte du contenu source d'une ligne (colonnes triées, valeurs en texte)"""
+    content = "\x1f".join(f"{column}={company[column]}" for column in sorted(company.index))
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def group_content_hashes(companies: Iterable[Any], keys: Optional[Set[str]] = None) -> Dict[str, str]:
+    """
+    Empreinte du contenu par SIRET, sur toutes les lignes du fichier qui le partagent
+
+    Un SIRET présent sur plusieurs lignes n'est enrichi qu'une fois (déduplication) :
+    l'empreinte enregistrée couvre donc le groupe entier, dans l'ordre du fichier.
+    Une ligne seule garde l'empreinte de row_content_hash.
+
+    Args:
+        companies: Lignes du fichier (Series pandas)
+        keys: SIRET normalisés à calculer (tous si None)
+    """
+    grouped: Dict[str, List[str]] = {}
+    for company in companies:
+        key = normalize_siret(company.get('SIRET', ''))
+        if key and (keys is None or key in keys):
+            grouped.setdefault(key, []).append(row_content_hash(company))
+
+    return {
+        key: hashes[0] if len(hashes) == 1 else hashlib.sha1("\x1e".join(hashes).encode("utf-8")).hexdigest()
+        for key, hashes in grouped.items()
+    }
+
+
+class CheckpointStore:
+    """Journal append-only des entreprises enrichies d'une session"""
+
+    def __init__(self, checkpoint_dir: str, session_id: str):
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.session_id = session_id
+        self.path = self.checkpoint_dir / f"{session_id}.jsonl"
+
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], session_id: str) -> Optional["CheckpointStore"]:
+        """Construit le store depuis la configuration (None si désactivé)"""
+        if not config.get("checkpoint_enabled", True):
+            return None
+
+        return cls(config.get("checkpoint_dir", "data/checkpoints"), session_id)
+
+    @staticmethod
+    def is_valid_session_id(session_id: Any) -> bool:
+        """Identifiant sans séparateur de chemin ni '..' (lettres, chiffres, '_')"""
+        return isinstance(session_id, str) and SESSION_ID_PATTERN.match(session_id) is not None
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def append(self, key: str, row_idx: int, outcome: Dict[str, Any],
+               content_hash: Optional[str] = None, enriched_at: Optional[float] = None):
+        """
+        Ajoute le résultat d'une entreprise au journal
+
+        Args:
+            key: Clé de l'entreprise (voir checkpoint_key)
+            row_idx: Index 1-based de la ligne dans l'échantillon
+            outcome: Résultat du moteur (result, error, processing_time)
+            content_hash: Empreinte de la ligne source (voir row_content_hash)
+            enriched_at: Date de l'enrichissement réel (conservée pour un résultat réutilisé)
+        """
+        now = time.time()
+        line = json.dumps({
+            "key": key,
+            "row": row_idx,
+            "outcome": outcome,
+            "content_hash": content_hash,
+            "enriched_at": enriched_at or now,
+            "recorded_at": now
+        }, ensure_ascii=False, default=str)
+
+        with self._lock:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Relit le journal de la session
+
+        Returns:
+            Dict clé -> résultat (la dernière écriture d'une clé l'emporte)
+        """
+        with self._lock:
+            records = self._read_records(self.path)
+
+        return {key: record["outcome"] for key, record in records.items()}
+
+    @classmethod
+    def load_history(cls, checkpoint_dir: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Dernier enrichissement connu de chaque entreprise, toutes sessions confondues
+
+        Returns:
+            Dict clé -> enregistrement (outcome, content_hash, enriched_at, session_id)
+        """
+        history: Dict[str, Dict[str, Any]] = {}
+        directory = Path(checkpoint_dir)
+
+        if not directory.exists():
+            return history
+
+        for path in directory.glob("*.jsonl"):
+            for key, record in cls._read_records(path).items():
+                record["session_id"] = path.stem
+                previous = history.get(key)
+                if previous is None or record.get("enriched_at", 0) >= previous.get("enriched_at", 0):
+                    history[key] = record
+
+        return history
+
+    @staticmethod
+    def _read_records(path: Path) -> Dict[str, Dict[str, Any]]:
+        """Enregistrements d'un journal par clé (tolère une ligne tronquée)"""
+        records: Dict[str, Dict[str, Any]] = {}
+
+        if not path.exists():
+            return records
+
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Ligne tronquée par un arrêt brutal
+                    continue
+                records[record["key"]] = record
+
+        return records
+
+    @staticmethod
+    def list_sessions(checkpoint_dir: str) -> List[Dict[str, Any]]:
+        """Sessions disposant d'un checkpoint (plus récentes d'abord)"""
+        directory = Path(checkpoint_dir)
+        if not directory.exists():
+            return []
+
+        sessions = []
+        for path in sorted(directory.glob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True):
+            with open(path, 'r', encoding='utf-8') as f:
+                companies = sum(1 for line in f if line.strip())
+            sessions.append({
+                "session_id": path.stem,
+                "companies": companies,
+                "updated_at": path.stat().st_mtime
+            })
+
+        return sessions
@@ -0,0 +1,392 @@
+# ============================================================================
+# STORE SQLITE DES ENRICHISSEMENTS
+# mg-platform/mcp_server/tools/ai_agent/output/enrichment_store.py
+# ============================================================================
+
+"""
+Base locale des résultats d'enrichissement
+Responsabilités:
+- Tables sessions, companies, search_attempts, candidate_urls, validations
+- Upserts groupés depuis l'agent (une transaction par lot d'entreprises)
+- Recherches indexées par SIRET, commune et code NAF
+- Source unique pour les exports Excel, snapshots de métriques par session (rapports, statut)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    sample_size INTEGER,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    processed INTEGER DEFAULT 0,
+    enriched INTEGER DEFAULT 0,
+    failed INTEGER DEFAULT 0,
+    skipped INTEGER DEFAULT 0,
+    avg_quality_score REAL,
+    duration_seconds REAL,
+    output_file TEXT,
+    error TEXT,
+    metrics TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_started ON sessions (started_at);
+
+CREATE TABLE IF NOT EXISTS companies (
+    siret TEXT PRIMARY KEY,  -- SIRET, ou "<session_id>:row-<n>" pour une ligne sans SIRET
+    name TEXT,
+    commune TEXT,
+    naf_code TEXT,
+    naf_label TEXT,
+    website TEXT,
+    enriched INTEGER NOT NULL DEFAULT 0,
+    quality_score REAL,
+    source TEXT,
+    error_reason TEXT,
+    content_hash TEXT,
+    outcome TEXT,
+    last_session_id TEXT,
+    enriched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_companies_commune ON companies (commune);
+CREATE INDEX IF NOT EXISTS idx_companies_naf ON companies (naf_code);
+CREATE INDEX IF NOT EXISTS idx_companies_session ON companies (last_session_id);
+
+CREATE TABLE IF NOT EXISTS search_attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    siret TEXT NOT NULL,
+    query TEXT NOT NULL,
+    attempted_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_search_attempts_siret ON search_attempts (siret);
+CREATE INDEX IF NOT EXISTS idx_search_attempts_session ON search_attempts (session_id);
+
+CREATE TABLE IF NOT EXISTS candidate_urls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    siret TEXT NOT NULL,
+    url TEXT NOT NULL,
+    source TEXT,
+    confidence REAL,
+    is_valid INTEGER,
+    selected INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_candidate_urls_siret ON candidate_urls (siret);
+CREATE INDEX IF NOT EXISTS idx_candidate_urls_session ON candidate_urls (session_id);
+
+CREATE TABLE IF NOT EXISTS validations (
+    session_id TEXT NOT NULL,
+    siret TEXT NOT NULL,
+    row_idx INTEGER,
+    company_name TEXT,
+    decision TEXT,
+    success INTEGER NOT NULL,
+    quality_score REAL,
+    threshold REAL,
+    reason TEXT,
+    processing_time REAL,
+    validated_at REAL NOT NULL,
+    PRIMARY KEY (session_id, siret)
+);
+CREATE INDEX IF NOT EXISTS idx_validations_siret ON validations (siret);
+"""
+
+COMPANY_COLUMNS = [
+    "siret", "name", "commune", "naf_code", "naf_label", "website", "enriched", "quality_score",
+    "source", "error_reason", "content_hash", "outcome", "last_session_id", "enriched_at"
+]
+
+
+class EnrichmentStore:
+    """Base SQLite des entreprises enrichies et de l'historique des sessions"""
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["EnrichmentStore"]:
+        """Construit le store depuis la configuration (None si désactivé ou indisponible)"""
+        if not config.get("enrichment_store_enabled", True):
+            return None
+
+        try:
+            return cls(config.get("enrichment_store_path", "data/store/enrichment.sqlite3"))
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Store d'enrichissement désactivé: {e}")
+            return None
+
+    def _init_schema(self):
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # Bases créées avant l'ajout des métriques : colonne ajoutée avant les index
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(sessions)")}
+            if columns and "metrics" not in columns:
+                self._conn.execute("ALTER TABLE sessions ADD COLUMN metrics TEXT")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Écritures (agent)
+    # ------------------------------------------------------------------
+
+    def start_session(self, session_id: str, sample_size: int):
+        """Déclare une session en cours (une reprise repasse la session à running)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sessions (session_id, status, sample_size, started_at) VALUES (?, 'running', ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET status = 'running', finished_at = NULL, error = NULL",
+                (session_id, sample_size, time.time())
+            )
+            self._conn.commit()
+
+    def finish_session(self, session_id: str, status: str, summary: Dict[str, Any]):
+        """Enregistre le bilan d'une session (completed, cancelled, failed)"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE sessions SET status = ?, finished_at = ?, processed = ?, enriched = ?, failed = ?, "
+                "skipped = ?, avg_quality_score = ?, duration_seconds = ?, output_file = ?, error = ? "
+                "WHERE session_id = ?",
+                (
+                    status, time.time(),
+                    summary.get("processed", 0), summary.get("enriched", 0), summary.get("failed", 0),
+                    summary.get("skipped", 0), summary.get("avg_quality_score"),
+                    summary.get("duration_seconds"), summary.get("output_file"), summary.get("error"),
+                    session_id
+                )
+            )
+            self._conn.commit()
+
+    def save_session_metrics(self, session_id: str, metrics: Dict[str, Any]):
+        """Persiste le snapshot de métriques d'une session (voir SessionMetrics.snapshot)"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE sessions SET metrics = ? WHERE session_id = ?",
+                (json.dumps(metrics, ensure_ascii=False, default=str), session_id)
+            )
+            self._conn.commit()
+
+    def upsert_results(self, session_id: str, records: Iterable[Dict[str, Any]]):
+        """
+        Upsert groupé des résultats d'entreprises (une seule transaction)
+
+        Args:
+            session_id: Session qui a produit les résultats
+            records: Dicts avec siret, row_idx, company (données source), outcome (résultat moteur),
+                     content_hash et enriched_at (optionnel, conservé pour un résultat réutilisé)
+        """
+        now = time.time()
+        companies, attempts, candidates, validations = [], [], [], []
+        sirets = []
+
+        for record in records:
+            siret = record["siret"]
+            outcome = record["outcome"]
+            result = outcome.get("result") or {}
+            data = result.get("data", {})
+            decision = result.get("ai_decision_log", {})
+            source = record.get("company", {})
+
+            sirets.append(siret)
+            companies.append((
+                siret,
+                str(source.get("Nom courant/Dénomination", "")),
+                str(source.get("Commune", "")),
+                str(source.get("Code NAF", "")),
+                str(source.get("Libellé NAF", "")),
+                data.get("website"),
+                1 if result.get("success") else 0,
+                result.get("quality_score"),
+                data.get("search_source"),
+                outcome.get("error") or result.get("error_reason"),
+                record.get("content_hash"),
+                json.dumps(outcome, ensure_ascii=False, default=str),
+                session_id,
+                record.get("enriched_at") or now
+            ))
+
+            attempts.extend((session_id, siret, query, now) for query in result.get("attempted_searches", []))
+
+            for candidate in result.get("candidates", []):
+                candidates.append((
+                    session_id, siret, candidate["url"], candidate.get("source"), candidate.get("confidence"),
+                    1 if candidate.get("is_valid") else 0, 1 if candidate["url"] == data.get("website") else 0
+                ))
+
+            validations.append((
+                session_id, siret, record.get("row_idx"), str(source.get("Nom courant/Dénomination", "")),
+                decision.get("decision", "ERROR" if outcome.get("error") else None),
+                1 if result.get("success") else 0,
+                result.get("quality_score", decision.get("quality_score")),
+                decision.get("threshold_used", decision.get("threshold")),
+                outcome.get("error") or result.get("error_reason"),
+                outcome.get("processing_time"),
+                now
+            ))
+
+        if not sirets:
+            return
+
+        placeholders = ", ".join("?" for _ in COMPANY_COLUMNS)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in COMPANY_COLUMNS[1:])
+
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT INTO companies ({', '.join(COMPANY_COLUMNS)}) VALUES ({placeholders}) "
+                    f"ON CONFLICT(siret) DO UPDATE SET {updates}",
+                    companies
+                )
+                # Traces de recherche : remplacées si la session ré-enrichit l'entreprise
+                for table in ("search_attempts", "candidate_urls"):
+                    self._conn.executemany(
+                        f"DELETE FROM {table} WHERE session_id = ? AND siret = ?",
+                        [(session_id, siret) for siret in sirets]
+                    )
+                self._conn.executemany(
+                    "INSERT INTO search_attempts (session_id, siret, query, attempted_at) VALUES (?, ?, ?, ?)",
+                    attempts
+                )
+                self._conn.executemany(
+                    "INSERT INTO candidate_urls (session_id, siret, url, source, confidence, is_valid, selected) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    candidates
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO validations (session_id, siret, row_idx, company_name, decision, success, "
+                    "quality_score, threshold, reason, processing_time, validated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    validations
+                )
+
+    # ------------------------------------------------------------------
+    # Lectures (serveur, mode incrémental)
+    # ------------------------------------------------------------------
+
+    def get_companies(self, sirets: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Dernier résultat connu par SIRET (lookup indexé par clé primaire)"""
+        found: Dict[str, Dict[str, Any]] = {}
+
+        with self._lock:
+            # Par paquets : limite SQLite du nombre de paramètres
+            for start in range(0, len(sirets), 500):
+                chunk = sirets[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT * FROM companies WHERE siret IN ({', '.join('?' for _ in chunk)})", chunk
+                ).fetchall()
+                for row in rows:
+                    company = dict(row)
+                    company["outcome"] = json.loads(company["outcome"]) if company["outcome"] else None
+                    found[company["siret"]] = company
+
+        return found
+
+    def find_companies(self, commune: Optional[str] = None, naf_code: Optional[str] = None,
+                       enriched_only: bool = False, limit: int = 1000) -> List[Dict[str, Any]]:
+        """Entreprises filtrées par commune et / ou code NAF (index dédiés)"""
+        clauses, params = [], []
+
+        if commune:
+            clauses.append("commune = ?")
+            params.append(commune)
+        if naf_code:
+            clauses.append("naf_code = ?")
+            params.append(naf_code)
+        if enriched_only:
+            clauses.append("enriched = 1")
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT siret, name, commune, naf_code, naf_label, website, enriched, quality_score, source, "
+                f"error_reason, last_session_id, enriched_at FROM companies {where} ORDER BY siret LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+
+        return [dict(row) for row in rows]
+
+    def get_session(self, session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Session demandée (la plus récente si session_id absent)"""
+        with self._lock:
+            if session_id:
+                row = self._conn.execute("SELECT * FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+            else:
+                row = self._conn.execute("SELECT * FROM sessions ORDER BY started_at DESC LIMIT 1").fetchone()
+
+        return self._session_row(row) if row else None
+
+    def list_sessions(self, limit: int = 20) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM sessions ORDER BY started_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+
+        return [self._session_row(row) for row in rows]
+
+    @staticmethod
+    def _session_row(row: sqlite3.Row) -> Dict[str, Any]:
+        session = dict(row)
+        session["metrics"] = json.loads(session["metrics"]) if session.get("metrics") else None
+        return session
+
+    def get_session_validations(self, session_id: str) -> List[Dict[str, Any]]:
+        """Décisions de validation d'une session, dans l'ordre des lignes"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT v.*, c.website FROM validations v LEFT JOIN companies c ON c.siret = v.siret "
+                "WHERE v.session_id = ? ORDER BY v.row_idx",
+                (session_id,)
+            ).fetchall()
+
+        return [dict(row) for row in rows]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Volumétrie du store"""
+        with self._lock:
+            counts = {
+                table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("sessions", "companies", "search_attempts", "candidate_urls", "validations")
+            }
+            counts["enriched_companies"] = self._conn.execute(
+                "SELECT COUNT(*) FROM companies WHERE enriched = 1"
+            ).fetchone()[0]
+
+        counts["db_path"] = str(self.db_path)
+        return counts
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self._lock:
+            self._conn.close()
+
+
+# Instance partagée par processus (agent et endpoints)
+_shared_store: Optional[EnrichmentStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_enrichment_store(config: Dict[str, Any]) -> Optional[EnrichmentStore]:
+    """Retourne le store d'enrichissement du processus (None si désactivé)"""
+    global _shared_store
+
+    if not config.get("enrichment_store_enabled", True):
+        return None
+
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = EnrichmentStore.from_config(config)
+
+    return _shared_store
@@ -9,25 +9,29 @@ Responsabilités:
 - Format SIRET forcé en texte (zéros de tête)
 - Colonnes métadonnées IA ajoutées
 - Colorisation rouge pour données IA
+- Report des enrichissements dédupliqués sur toutes les lignes du groupe
 - Path : data/processed/AI_ENRICHED_Sample_{session_id}.xlsx
+- Export du store d'enrichissement (sans relancer l'agent ni relire d'Excel)
 """
 
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from openpyxl import load_workbook
 from openpyxl.styles import PatternFill, Font, Border, Side, NamedStyle
 from ..core.exceptions import OutputError
+from ..utils.stage_timer import StageTimer
 
 
 class ExcelWriter:
     """Gestionnaire de sauvegarde Excel avec formatage avancé"""
     
-    def __init__(self, config: Dict[str, Any], session_id: str):
+    def __init__(self, config: Dict[str, Any], session_id: str, timer: Optional[StageTimer] = None):
         self.config = config
         self.session_id = session_id
+        self.timer = timer or StageTimer()
         self.output_dir = Path(config.get("processed_data_dir", "data/processed"))
         
         # Styles de colorisation
@@ -61,13 +65,14 @@ class ExcelWriter:
             output_path = self.output_dir / output_filename
             
             # Sauvegarder avec formatage SIRET
-            self._save_with_siret_formatting(enriched_df, output_path)
+            with self.timer.span("excel_write"):
+                self._save_with_siret_formatting(enriched_df, output_path)
             
             # Colorisation si activée
             if self.config.get("excel_colorization", True):
-                colorized_path = self._apply_colorization(
-                    output_path, enrichment_results["enrichment_data"]
-                )
+                enrichment_data, _ = self._expand_dedup_groups(enrichment_results)
+                with self.timer.span("excel_colorize"):
+                    colorized_path = self._apply_colorization(output_path, enrichment_data)
                 return str(colorized_path)
             
             return str(output_path)
@@ -75,6 +80,50 @@ class ExcelWriter:
         except Exception as e:
             raise OutputError(f"Erreur sauvegarde Excel: {str(e)}")
     
+    def export_companies(self, companies: List[Dict[str, Any]], label: str = "store") -> str:
+        """
+        Exporte des entreprises lues dans le store d'enrichissement
+        
+        Args:
+            companies: Lignes du store (EnrichmentStore.find_companies)
+            label: Suffixe du nom de fichier (ex: filtre appliqué)
+            
+        Returns:
+            Chemin du fichier sauvegardé
+        """
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            
+            export_df = pd.DataFrame(companies, columns=[
+                "siret", "name", "commune", "naf_code", "naf_label", "website",
+                "enriched", "quality_score", "source", "error_reason", "last_session_id", "enriched_at"
+            ]).rename(columns={
+                "siret": "SIRET",
+                "name": "Nom courant/Dénomination",
+                "commune": "Commune",
+                "naf_code": "Code NAF",
+                "naf_label": "Libellé NAF",
+                "website": "Site Web établissement",
+                "enriched": "IA_Enriched",
+                "quality_score": "IA_Confidence_Score",
+                "source": "IA_Source",
+                "error_reason": "IA_Error_Reason",
+                "last_session_id": "IA_Session_ID",
+                "enriched_at": "IA_Processing_Date"
+            })
+            export_df["IA_Enriched"] = export_df["IA_Enriched"].astype(bool)
+            export_df["IA_Processing_Date"] = pd.to_datetime(
+                export_df["IA_Processing_Date"], unit="s"
+            ).dt.strftime("%Y-%m-%d %H:%M:%S")
+            
+            output_path = self.output_dir / f"AI_ENRICHED_Export_{label}_{datetime.now():%Y%m%d_%H%M%S}.xlsx"
+            self._save_with_siret_formatting(export_df, output_path)
+            
+            return str(output_path)
+            
+        except Exception as e:
+            raise OutputError(f"Erreur export Excel: {str(e)}")
+    
     def _prepare_enriched_dataframe(self, sample_df: pd.DataFrame, enrichment_results: Dict) -> pd.DataFrame:
         """Prépare le DataFrame avec données enrichies et métadonnées"""
         
@@ -90,8 +139,10 @@ class ExcelWriter:
         enriched_df["IA_Processing_Date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         enriched_df["IA_Session_ID"] = self.session_id
         
-        # Appliquer les enrichissements
-        for idx_str, enrichment_data in enrichment_results["enrichment_data"].items():
+        # Appliquer les enrichissements (représentants + lignes dupliquées)
+        all_enrichment_data, quality_reports = self._expand_dedup_groups(enrichment_results)
+        
+        for idx_str, enrichment_data in all_enrichment_data.items():
             idx = int(idx_str) - 1  # Convertir index (1-based vers 0-based)
             
             if idx < len(enriched_df):
@@ -104,8 +155,8 @@ class ExcelWriter:
                 enriched_df.iloc[idx, enriched_df.columns.get_loc("IA_Enriched")] = True
                 
                 # Score de confiance
-                if idx_str in enrichment_results["quality_reports"]:
-                    score = enrichment_results["quality_reports"][idx_str]["quality_score"]
+                if idx_str in quality_reports:
+                    score = quality_reports[idx_str]["quality_score"]
                     enriched_df.iloc[idx, enriched_df.columns.get_loc("IA_Confidence_Score")] = score
                 
                 # Source
@@ -114,6 +165,23 @@ class ExcelWriter:
         
         return enriched_df
     
+    def _expand_dedup_groups(self, enrichment_results: Dict):
+        """Recopie le résultat de chaque représentant sur les lignes de son groupe"""
+        
+        enrichment_data = dict(enrichment_results["enrichment_data"])
+        quality_reports = dict(enrichment_results.get("quality_reports", {}))
+        
+        for rep_str, members in enrichment_results.get("dedup_groups", {}).items():
+            if rep_str not in enrichment_data:
+                continue
+            
+            for member_str in members:
+                enrichment_data[member_str] = enrichment_data[rep_str]
+                if rep_str in quality_reports:
+                    quality_reports[member_str] = quality_reports[rep_str]
+        
+        return enrichment_data, quality_reports
+    
     def _fix_siret_format(self, df: pd.DataFrame):
         """Corrige le format SIRET pour préserver les zéros de tête"""
         
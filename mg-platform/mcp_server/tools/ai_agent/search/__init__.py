@@ -9,6 +9,9 @@ Module search de l'Agent IA - Moteurs de recherche et fallback
 
 from .web_search import WebSearchEngine
 from .fallback import IntelligentFallbackGenerator
+from .async_web_search import AsyncWebSearchEngine, AsyncSearchRunner
+from .fetch_scheduler import FetchScheduler, get_shared_fetch_scheduler, get_fetch_scheduler_stats
+from .serp_parser import SerpParser
 
 # Import futur
 # from .linkedin_search import LinkedInSearchEngine
@@ -17,6 +20,12 @@ __all__ = [
     # Actuellement disponible
     "WebSearchEngine",
     "IntelligentFallbackGenerator",
+    "AsyncWebSearchEngine",
+    "AsyncSearchRunner",
+    "FetchScheduler",
+    "get_shared_fetch_scheduler",
+    "get_fetch_scheduler_stats",
+    "SerpParser",
     
     # À venir
     # "LinkedInSearchEngine"
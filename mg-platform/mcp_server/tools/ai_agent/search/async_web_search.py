@@ -0,0 +1,471 @@
+# ============================================================================
+# RECHERCHE WEB ASYNCHRONE
+# mg-platform/mcp_server/tools/ai_agent/search/async_web_search.py
+# ============================================================================
+
+"""
+Backend de recherche web asyncio pour le serveur
+Responsabilités:
+- Client HTTP unique partagé (pool de connexions, keep-alive, HTTP/2 si dispo)
+- Limite de connexions simultanées par hôte, robots.txt et Crawl-delay respectés
+- Même limiteur de débit partagé, même backoff 202 / 429 et mêmes disjoncteurs que le moteur synchrone
+- Même contrat que WebSearchEngine.search_company_website, en coroutine
+- Réutilise requêtes, parsing, scoring et chronométrage du moteur synchrone
+- Cache SQLite des résultats consulté hors de la boucle d'événements (thread)
+- Façade synchrone pour l'agent (search_backend = "async") : boucle d'événements dédiée
+"""
+
+import asyncio
+import threading
+import urllib.parse
+from typing import List, Dict, Any, Optional, Tuple
+
+from .web_search import WebSearchEngine, PROVIDER_LABELS
+from .fetch_scheduler import robots_url
+from .page_reader import BoundedBody, is_html_content_type
+from ..core.exceptions import SearchError, WebSearchTimeoutError, EnrichmentCancelledError
+from ..utils.rate_limiter import RateLimiter
+from ..utils.run_control import RunControl
+from ..utils.stage_timer import StageTimer
+
+# Import conditionnel : httpx est requis, h2 seulement pour HTTP/2
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class AsyncWebSearchEngine(WebSearchEngine):
+    """Moteur de recherche web asynchrone avec client HTTP mutualisé"""
+
+    def __init__(self, config: Dict[str, Any], run_control: Optional[RunControl] = None,
+                 timer: Optional[StageTimer] = None):
+        if not HTTPX_AVAILABLE:
+            raise SearchError("httpx non installé - backend asynchrone indisponible")
+
+        super().__init__(config, run_control, timer)
+        self.max_connections = config.get("async_max_connections", 100)
+        self.max_connections_per_host = config.get("async_max_connections_per_host", 4)
+
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "AsyncWebSearchEngine":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Ferme le client HTTP partagé (les sémaphores sont liés à la boucle courante)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._host_semaphores.clear()
+
+    async def search_company_website(self, company_name: str, commune: str) -> Dict[str, Any]:
+        """
+        Recherche asynchrone du site web d'une entreprise
+
+        Args:
+            company_name: Nom de l'entreprise
+            commune: Commune de l'entreprise
+
+        Returns:
+            Dict avec résultats de recherche (même format que WebSearchEngine)
+        """
+
+        result = {
+            "found": False,
+            "website": "",
+            "source": "",
+            "confidence": 0,
+            "attempted_queries": [],
+            "candidates": [],
+            "error_reason": "",
+            "transient": False
+        }
+
+        try:
+            search_queries = self._generate_search_queries(company_name, commune)
+            result["attempted_queries"] = search_queries
+
+            for i, query in enumerate(search_queries, 1):
+                await self.run_control.acheckpoint()
+
+                # DuckDuckGo en priorité, moteur suivant si son disjoncteur est ouvert
+                engine = await self._route_query_async("duckduckgo")
+
+                if engine is None:
+                    result["error_reason"] = "Moteurs de recherche suspendus (disjoncteurs ouverts)"
+                    result["transient"] = True
+                    return result
+
+                if await self._search_with_async(engine, query, company_name, commune, result):
+                    return result
+
+                # Google en fallback sur la dernière requête (circuit fermé)
+                if i == len(search_queries) and engine != "google" and self.circuit_breaker.available("google"):
+                    await self.run_control.acheckpoint()
+                    if await self._search_with_async("google", query, company_name, commune, result):
+                        return result
+
+            result["error_reason"] = "Aucun site web valide trouvé"
+            return result
+
+        except EnrichmentCancelledError:
+            raise
+        except Exception as e:
+            result["error_reason"] = f"Erreur recherche web: {str(e)}"
+            return result
+
+    async def _search_with_async(self, engine: str, query: str, company_name: str, commune: str,
+                                 result: Dict[str, Any]) -> bool:
+        """Interroge un moteur et valide ses résultats ; True si un site valide a été retenu"""
+        if engine == "duckduckgo":
+            websites = await self._search_duckduckgo_async(query)
+        else:
+            websites = await self._search_google_async(query)
+
+        source = PROVIDER_LABELS[engine]
+        match = await self._first_valid_website(websites, company_name, commune, source, result["candidates"])
+
+        if match is None:
+            return False
+
+        result.update({"found": True, "source": source, **match})
+        return True
+
+    async def _route_query_async(self, preferred: str) -> Optional[str]:
+        """Routage entre moteurs selon les disjoncteurs (attente sans bloquer la boucle)"""
+        providers = self._candidate_providers(preferred)
+        parked = 0.0
+
+        while True:
+            for provider in providers:
+                if self.circuit_breaker.available(provider):
+                    return provider
+
+            delay = min(self.circuit_breaker.retry_in(provider) for provider in providers)
+            if parked + delay > self.max_park:
+                return None
+
+            with self.timer.span("circuit_park"):
+                await asyncio.sleep(delay)
+            parked += delay
+
+    async def _first_valid_website(self, websites: List[str], company_name: str, commune: str, source: str,
+                                   candidates: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Valide les candidats en parallèle et retourne le mieux classé des sites validés
+
+        Les validations sont lues dans l'ordre du moteur (même choix que le moteur
+        synchrone) et tracées dans candidates. Dès qu'un candidat est retenu, seules
+        les validations des candidats moins bien classés sont encore en cours : elles
+        sont annulées, leurs pages ne sont pas lues pour rien.
+        """
+
+        tasks = [
+            asyncio.ensure_future(self._validate_website_async(website, company_name, commune))
+            for website in websites
+        ]
+
+        try:
+            for website, task in zip(websites, tasks):
+                validation = await task
+                candidates.append(self._candidate(website, source, validation))
+                if validation["is_valid"] and validation["confidence"] >= 50:
+                    return {"website": website, "confidence": validation["confidence"]}
+            return None
+
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _search_duckduckgo_async(self, query: str, max_results: int = 5) -> List[str]:
+        """Recherche DuckDuckGo asynchrone avec gestion HTTP 202"""
+
+        cached = await asyncio.to_thread(self._get_cached_results, "duckduckgo", query)
+        if cached is not None:
+            return cached[:max_results]
+
+        ddg_url, headers = self._build_duckduckgo_request(query)
+        headers.pop('Connection', None)  # Keep-alive géré par le pool
+
+        if not self.circuit_breaker.allow("duckduckgo"):
+            return []
+
+        try:
+            await self._wait_for_slot_async("duckduckgo")
+
+            with self.timer.span("duckduckgo") as span:
+                response = await self._get(ddg_url, headers, self.timeout, engine="duckduckgo")
+                span["bytes"] = len(response.content)
+
+            if self._is_throttled("duckduckgo", response):
+                # HTTP 202 / 429 = DuckDuckGo nous demande d'attendre : backoff puis retry une fois
+                # (sauf si ce ralentissement vient d'ouvrir le disjoncteur)
+                self._record_response("duckduckgo", response)
+                if not self.circuit_breaker.allow("duckduckgo"):
+                    return []
+                await self._wait_for_slot_async("duckduckgo")
+                with self.timer.span("duckduckgo") as span:
+                    response = await self._get(ddg_url, headers, self.timeout, engine="duckduckgo")
+                    span["bytes"] = len(response.content)
+                self._is_throttled("duckduckgo", response)
+
+            if response.status_code != 200:
+                self._record_response("duckduckgo", response)
+                return []
+
+            websites = self._parse_duckduckgo_results(response.content, max_results)
+            recognized = self._record_serp("duckduckgo", websites, response.content)
+            await asyncio.to_thread(self._store_results, "duckduckgo", query, websites, recognized)
+            return websites
+
+        except httpx.TimeoutException:
+            raise WebSearchTimeoutError(f"Timeout DuckDuckGo pour: {query}")
+        except httpx.HTTPError as e:
+            raise SearchError(f"Erreur DuckDuckGo: {str(e)}")
+
+    async def _search_google_async(self, query: str, max_results: int = 3) -> List[str]:
+        """Recherche Google asynchrone (utilisation limitée)"""
+
+        cached = await asyncio.to_thread(self._get_cached_results, "google", query)
+        if cached is not None:
+            return cached[:max_results]
+
+        if not self.circuit_breaker.allow("google"):
+            return []
+
+        try:
+            google_url, headers = self._build_google_request(query, max_results)
+
+            await self._wait_for_slot_async("google")
+
+            with self.timer.span("google") as span:
+                response = await self._get(google_url, headers, self.timeout, engine="google")
+                span["bytes"] = len(response.content)
+
+            self._is_throttled("google", response)
+
+            if response.status_code != 200:
+                self._record_response("google", response)
+                return []
+
+            websites = self._parse_google_results(response.content, max_results)
+            recognized = self._record_serp("google", websites, response.content)
+            await asyncio.to_thread(self._store_results, "google", query, websites, recognized)
+            return websites
+
+        except Exception:
+            return []
+
+    async def _validate_website_async(self, website: str, company_name: str, commune: str) -> Dict[str, Any]:
+        """Valide qu'un site web correspond à l'entreprise"""
+
+        with self.timer.span("page_validation"):
+            try:
+                page_text = await self._fetch_page_text_async(website)
+
+                if page_text is None:
+                    return self._empty_validation()
+
+                return self._score_page_text(page_text, company_name, commune)
+
+            except EnrichmentCancelledError:
+                raise
+            except Exception:
+                return self._empty_validation()
+
+    async def _fetch_page_text_async(self, website: str) -> Optional[str]:
+        """Texte d'une page via le cache partagé, sinon téléchargement conditionnel"""
+
+        entry = self._lookup_page(website)
+
+        if entry and entry["fresh"]:
+            return entry["text"]
+
+        headers = self._build_page_headers()
+        if self.page_cache:
+            headers.update(self.page_cache.conditional_headers(entry))
+
+        if not await self._robots_allowed_async(website):
+            return None
+
+        host = RateLimiter.host_source(website)
+        await self._wait_for_slot_async(host, engine="page")
+
+        with self.timer.span("page_fetch") as span:
+            response, content = await self._stream_page(website, headers, self.validation_timeout)
+            span["bytes"] = len(content or b"")
+
+        self._is_throttled(host, response)
+
+        return self._handle_page_response(
+            website, entry, response.status_code, content, response.headers
+        )
+
+    async def _robots_allowed_async(self, website: str) -> bool:
+        """Consulte robots.txt (téléchargé une fois par hôte, cache partagé avec le moteur synchrone)"""
+        if self.fetch_scheduler.robots_pending(website):
+            await self._wait_for_slot_async(RateLimiter.host_source(website), engine="page")
+
+            try:
+                response = await self._get(robots_url(website), self._build_page_headers(),
+                                           self.validation_timeout, engine="robots")
+                status, text = response.status_code, response.text
+            except httpx.HTTPError:
+                status, text = None, ""
+
+            self._apply_crawl_delay(website, self.fetch_scheduler.store_robots(website, status, text))
+
+        return self.fetch_scheduler.can_fetch(website)
+
+    async def _wait_for_slot_async(self, source: str, engine: Optional[str] = None):
+        """Attend le créneau réservé auprès du limiteur (sans bloquer la boucle)"""
+        delay = self.rate_limiter.reserve(source)
+        self.search_stats.record_wait(engine or source, delay)
+
+        with self.timer.span("rate_limit_wait"):
+            await asyncio.sleep(delay)
+
+    async def _get(self, url: str, headers: Dict[str, str], timeout: float,
+                   engine: str = "page") -> "httpx.Response":
+        """GET via le client partagé, borné par le sémaphore de l'hôte, compté par moteur et statut"""
+
+        host = urllib.parse.urlsplit(url).netloc.lower()
+
+        async with self._get_host_semaphore(host):
+            try:
+                response = await self._get_client().get(url, headers=headers, timeout=timeout)
+            except httpx.TimeoutException:
+                self._record_status(engine, "timeout")
+                raise
+            except httpx.HTTPError:
+                self._record_status(engine, "error")
+                raise
+
+        self._record_status(engine, response.status_code)
+        return response
+
+    async def _stream_page(self, url: str, headers: Dict[str, str],
+                           timeout: float) -> Tuple["httpx.Response", Optional[bytes]]:
+        """Téléchargement en flux plafonné d'une page (contenu None si non HTML)"""
+
+        host = urllib.parse.urlsplit(url).netloc.lower()
+
+        async with self._get_host_semaphore(host):
+            try:
+                async with self._get_client().stream("GET", url, headers=headers, timeout=timeout) as response:
+                    content = await self._read_page_body_async(response)
+            except httpx.TimeoutException:
+                self._record_status("page", "timeout")
+                raise
+            except httpx.HTTPError:
+                self._record_status("page", "error")
+                raise
+
+        self._record_status("page", response.status_code)
+        return response, content
+
+    async def _read_page_body_async(self, response: "httpx.Response") -> Optional[bytes]:
+        """Corps plafonné ; aiter_bytes décompresse au fil de l'eau, la sortie du flux ferme la connexion"""
+        if response.status_code != 200:
+            return b""
+
+        if not is_html_content_type(response.headers.get("Content-Type")):
+            self._account_download(response.headers, None, False, 0)
+            return None
+
+        body = BoundedBody(self.page_max_bytes)
+        async for chunk in response.aiter_bytes():
+            if not body.feed(chunk):
+                break
+
+        self._account_download(response.headers, body.content, body.truncated, response.num_bytes_downloaded)
+        return body.content
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Client HTTP paresseux : un seul pool pour toutes les requêtes"""
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                follow_redirects=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=30.0
+                )
+            )
+
+        return self._client
+
+    def _get_host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Sémaphore de connexions simultanées pour un hôte"""
+
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+
+        return self._host_semaphores[host]
+
+
+class AsyncSearchRunner:
+    """
+    Façade synchrone du backend asyncio pour les workers de l'agent
+
+    Les recherches des threads workers sont soumises à une boucle d'événements
+    dédiée (thread daemon) : toute la session partage le client HTTP mutualisé.
+    Même interface que WebSearchEngine pour EnrichmentStrategy et l'agent.
+    """
+
+    def __init__(self, config: Dict[str, Any], run_control: Optional[RunControl] = None,
+                 timer: Optional[StageTimer] = None):
+        self.engine = AsyncWebSearchEngine(config, run_control, timer)
+        self.result_cache = self.engine.result_cache
+        self.page_cache = self.engine.page_cache
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def search_company_website(self, company_name: str, commune: str) -> Dict[str, Any]:
+        """Recherche exécutée sur la boucle partagée (bloque le worker appelant)"""
+        future = asyncio.run_coroutine_threadsafe(
+            self.engine.search_company_website(company_name, commune), self._get_loop()
+        )
+        return future.result()
+
+    def close(self):
+        """Ferme le client HTTP et arrête la boucle (relancée à la prochaine recherche)"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self.engine.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Boucle d'événements dédiée, démarrée à la première recherche"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="async-search", daemon=True)
+                self._thread.start()
+            return self._loop
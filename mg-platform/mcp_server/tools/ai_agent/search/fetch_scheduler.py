@@ -0,0 +1,258 @@
+# ============================================================================
+# ORDONNANCEUR DES TÉLÉCHARGEMENTS DE PAGES
+# mg-platform/mcp_server/tools/ai_agent/search/fetch_scheduler.py
+# ============================================================================
+
+"""
+Ordonnanceur partagé des téléchargements de sites candidats
+Responsabilités:
+- Téléchargements simultanés bornés au global et par hôte
+  (forte concurrence entre hôtes distincts, politesse envers chaque site)
+- File d'attente par priorité : les entreprises les plus proches de la fin
+  de leur recherche passent en premier
+- robots.txt : cache par hôte, pages interdites ignorées, Crawl-delay transmis
+  au limiteur de débit
+- Statistiques : attentes, profondeur de file, pages interdites
+"""
+
+import heapq
+import itertools
+import threading
+import time
+import urllib.parse
+import urllib.robotparser
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+# Intervalle (s) entre deux vérifications d'annulation pendant l'attente d'un créneau
+WAIT_POLL_INTERVAL = 0.5
+
+
+def host_of(url: str) -> str:
+    return urllib.parse.urlsplit(url).netloc.lower()
+
+
+def robots_url(url: str) -> str:
+    parts = urllib.parse.urlsplit(url)
+    return urllib.parse.urlunsplit((parts.scheme or "https", parts.netloc, "/robots.txt", "", ""))
+
+
+class FetchScheduler:
+    """Créneaux de téléchargement par hôte attribués par priorité"""
+
+    def __init__(self, max_in_flight: int = 16, max_per_host: int = 2, respect_robots: bool = True,
+                 robots_ttl_seconds: float = 86400, max_crawl_delay: float = 30.0,
+                 robots_user_agent: str = "*"):
+        """
+        Args:
+            max_in_flight: Téléchargements simultanés, tous hôtes confondus
+            max_per_host: Téléchargements simultanés sur un même hôte
+            respect_robots: Consulter robots.txt avant de télécharger une page
+            robots_ttl_seconds: Durée de validité d'un robots.txt en cache
+            max_crawl_delay: Plafond appliqué au Crawl-delay annoncé par un site
+            robots_user_agent: User-agent utilisé pour interpréter robots.txt
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_per_host = max(1, max_per_host)
+        self.respect_robots = respect_robots
+        self.robots_ttl_seconds = robots_ttl_seconds
+        self.max_crawl_delay = max_crawl_delay
+        self.robots_user_agent = robots_user_agent
+
+        self._in_flight = 0
+        self._host_in_flight: Dict[str, int] = {}
+        # File unique (priorité, ordre d'arrivée, hôte) : les plus prioritaires d'abord
+        self._waiters: List[Tuple[Tuple, int, str]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+        self._robots: Dict[str, Tuple[Optional[urllib.robotparser.RobotFileParser], float]] = {}
+        self._robots_lock = threading.Lock()
+
+        self.stats = {"granted": 0, "waited": 0, "wait_seconds": 0.0, "max_queue": 0, "robots_disallowed": 0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "FetchScheduler":
+        """Construit l'ordonnanceur depuis la configuration de l'agent"""
+        return cls(
+            max_in_flight=config.get("fetch_max_in_flight", 16),
+            max_per_host=config.get("fetch_max_per_host", 2),
+            respect_robots=config.get("fetch_respect_robots", True),
+            robots_ttl_seconds=config.get("fetch_robots_ttl_hours", 24) * 3600,
+            max_crawl_delay=config.get("fetch_max_crawl_delay", 30.0)
+        )
+
+    # ------------------------------------------------------------------
+    # Créneaux
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def slot(self, url: str, priority: Tuple = (), run_control=None) -> Iterator[None]:
+        """
+        Réserve un créneau de téléchargement pour l'hôte d'une URL
+
+        Args:
+            url: Page à télécharger
+            priority: Clé de priorité (la plus petite passe en premier)
+            run_control: Contrôle d'exécution, consulté pendant l'attente (annulation)
+        """
+        host = host_of(url)
+        self.acquire(host, priority, run_control)
+        try:
+            yield
+        finally:
+            self.release(host)
+
+    def acquire(self, host: str, priority: Tuple = (), run_control=None):
+        """Attend un créneau libre pour l'hôte (bloquant, annulable)"""
+        start = time.monotonic()
+        waiter = (tuple(priority), next(self._sequence), host)
+
+        with self._condition:
+            heapq.heappush(self._waiters, waiter)
+            self.stats["max_queue"] = max(self.stats["max_queue"], len(self._waiters))
+
+            try:
+                while self._next_eligible() != waiter:
+                    if run_control is not None:
+                        # Lève EnrichmentCancelledError si l'enrichissement est annulé
+                        self._condition.release()
+                        try:
+                            run_control.checkpoint()
+                        finally:
+                            self._condition.acquire()
+                    self._condition.wait(WAIT_POLL_INTERVAL)
+            except BaseException:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+                raise
+
+            self._waiters.remove(waiter)
+            heapq.heapify(self._waiters)
+            self._in_flight += 1
+            self._host_in_flight[host] = self._host_in_flight.get(host, 0) + 1
+
+            waited = time.monotonic() - start
+            self.stats["granted"] += 1
+            if waited > 0.001:
+                self.stats["waited"] += 1
+                self.stats["wait_seconds"] += waited
+
+    def release(self, host: str):
+        with self._condition:
+            self._in_flight -= 1
+            remaining = self._host_in_flight.get(host, 1) - 1
+            if remaining > 0:
+                self._host_in_flight[host] = remaining
+            else:
+                self._host_in_flight.pop(host, None)
+            self._condition.notify_all()
+
+    def _next_eligible(self) -> Optional[Tuple[Tuple, int, str]]:
+        """Attente la plus prioritaire dont l'hôte a un créneau libre"""
+        if self._in_flight >= self.max_in_flight:
+            return None
+
+        for waiter in sorted(self._waiters):
+            if self._host_in_flight.get(waiter[2], 0) < self.max_per_host:
+                return waiter
+
+        return None
+
+    # ------------------------------------------------------------------
+    # robots.txt
+    # ------------------------------------------------------------------
+
+    def robots_pending(self, url: str) -> bool:
+        """robots.txt de l'hôte à (re)télécharger ?"""
+        if not self.respect_robots:
+            return False
+
+        with self._robots_lock:
+            cached = self._robots.get(host_of(url))
+        return cached is None or time.monotonic() - cached[1] > self.robots_ttl_seconds
+
+    def store_robots(self, url: str, status: Optional[int], text: str = "") -> Optional[float]:
+        """
+        Enregistre le robots.txt d'un hôte
+
+        Args:
+            url: Une page de l'hôte
+            status: Code HTTP du robots.txt (None si le téléchargement a échoué)
+            text: Contenu du robots.txt
+
+        Returns:
+            Crawl-delay annoncé (plafonné), ou None
+        """
+        parser = None
+
+        if status == 200:
+            parser = urllib.robotparser.RobotFileParser()
+            parser.parse(text.splitlines())
+        elif status in (401, 403):
+            # Convention robots : accès refusé au fichier = site entier interdit
+            parser = urllib.robotparser.RobotFileParser()
+            parser.disallow_all = True
+
+        with self._robots_lock:
+            self._robots[host_of(url)] = (parser, time.monotonic())
+
+        if parser is None:
+            return None
+
+        delay = parser.crawl_delay(self.robots_user_agent)
+        return min(float(delay), self.max_crawl_delay) if delay else None
+
+    def can_fetch(self, url: str, user_agent: Optional[str] = None) -> bool:
+        """La page est-elle autorisée par le robots.txt connu de l'hôte ?"""
+        if not self.respect_robots:
+            return True
+
+        with self._robots_lock:
+            cached = self._robots.get(host_of(url))
+
+        if cached is None or cached[0] is None:
+            return True
+
+        allowed = cached[0].can_fetch(user_agent or self.robots_user_agent, url)
+        if not allowed:
+            with self._condition:
+                self.stats["robots_disallowed"] += 1
+        return allowed
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._condition:
+            stats = dict(self.stats)
+            stats["in_flight"] = self._in_flight
+            stats["queued"] = len(self._waiters)
+            stats["hosts_in_flight"] = len(self._host_in_flight)
+        stats["wait_seconds"] = round(stats["wait_seconds"], 3)
+
+        with self._robots_lock:
+            stats["robots_cached"] = len(self._robots)
+
+        return stats
+
+
+# Instance partagée par processus
+_shared_scheduler: Optional[FetchScheduler] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_fetch_scheduler(config: Dict[str, Any]) -> FetchScheduler:
+    """Retourne l'ordonnanceur de téléchargements du processus"""
+    global _shared_scheduler
+
+    with _shared_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = FetchScheduler.from_config(config)
+
+    return _shared_scheduler
+
+
+def get_fetch_scheduler_stats() -> Optional[Dict[str, Any]]:
+    """Statistiques de l'ordonnanceur du processus (None s'il n'a pas encore servi)"""
+    with _shared_lock:
+        scheduler = _shared_scheduler
+    return scheduler.get_stats() if scheduler else None
@@ -0,0 +1,159 @@
+# ============================================================================
+# CACHE DES PAGES VALIDÉES
+# mg-platform/mcp_server/tools/ai_agent/search/page_cache.py
+# ============================================================================
+
+"""
+Cache mémoire partagé des pages candidates téléchargées
+Responsabilités:
+- Clé = URL normalisée (schéma/hôte en minuscules, sans fragment ni utm_*)
+- Stocke le texte extrait en minuscules + ETag / Last-Modified
+- Revalidation conditionnelle (If-None-Match / If-Modified-Since) après TTL
+- Partagé par tous les moteurs du processus (annuaires, franchises, holdings)
+"""
+
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+def normalize_url(url: str) -> str:
+    """Normalise une URL pour servir de clé de cache"""
+
+    parts = urllib.parse.urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+
+    # Port explicite seulement s'il n'est pas celui par défaut
+    if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path.rstrip("/") or "/"
+
+    # Retirer les paramètres de tracking
+    query_params = [
+        (key, value) for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+    ]
+    query = urllib.parse.urlencode(sorted(query_params))
+
+    return urllib.parse.urlunsplit((scheme, host, path, query, ""))
+
+
+class PageCache:
+    """Cache LRU thread-safe des textes de pages avec validateurs HTTP"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "revalidated": 0, "refreshed": 0, "evictions": 0}
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Cherche une page en cache
+
+        Returns:
+            Entrée (copie) avec clé "fresh" indiquant si la revalidation est inutile,
+            ou None si la page n'a jamais été téléchargée
+        """
+        key = normalize_url(url)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            fresh = time.time() - entry["fetched_at"] <= self.ttl_seconds
+
+            self.stats["hits" if fresh else "stale"] += 1
+
+            return {**entry, "fresh": fresh}
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Headers de revalidation conditionnelle pour une entrée périmée"""
+        headers = {}
+
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        return headers
+
+    def mark_revalidated(self, url: str):
+        """Réponse 304 : la page en cache reste valable"""
+        key = normalize_url(url)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["fetched_at"] = time.time()
+                self.stats["revalidated"] += 1
+
+    def store(self, url: str, text: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Enregistre le texte extrait d'une page téléchargée (HTTP 200)"""
+        key = normalize_url(url)
+
+        with self._lock:
+            if key in self._entries:
+                self.stats["refreshed"] += 1
+
+            self._entries[key] = {
+                "url": key,
+                "text": text,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time()
+            }
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Compteurs et ratio de réutilisation"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+
+        lookups = stats["hits"] + stats["misses"] + stats["stale"]
+        reused = stats["hits"] + stats["revalidated"]
+        stats["hit_ratio"] = round(reused / lookups, 3) if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Vide le cache"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Instance partagée par processus
+_shared_page_cache: Optional[PageCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_page_cache(config: Dict[str, Any]) -> Optional[PageCache]:
+    """Retourne le cache de pages du processus (None si désactivé)"""
+    global _shared_page_cache
+
+    if not config.get("page_cache_enabled", True):
+        return None
+
+    with _shared_lock:
+        if _shared_page_cache is None:
+            _shared_page_cache = PageCache(
+                ttl_seconds=config.get("page_cache_ttl_minutes", 60) * 60,
+                max_entries=config.get("page_cache_max_entries", 2000)
+            )
+
+    return _shared_page_cache
@@ -0,0 +1,114 @@
+# ============================================================================
+# LECTURE BORNÉE DES PAGES CANDIDATES
+# mg-platform/mcp_server/tools/ai_agent/search/page_reader.py
+# ============================================================================
+
+"""
+Lecture en flux des pages candidates et extraction rapide du texte
+Responsabilités:
+- Contenus non HTML (PDF, images, archives...) écartés sur l'en-tête Content-Type
+- Corps lu par morceaux décompressés au fil de l'eau, arrêt au plafond d'octets
+- Extraction du texte visible sans arbre DOM (scripts, styles, balises retirés)
+- Détection de l'encodage : en-tête HTTP, puis balise meta, puis UTF-8
+"""
+
+import html
+import re
+from typing import Iterable, Optional, Tuple
+
+# Plafond par défaut du corps lu (octets décompressés)
+DEFAULT_MAX_BYTES = 256 * 1024
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+_CHARSET_HEADER = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_CHARSET_META = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_INVISIBLE_BLOCKS = re.compile(
+    r"<!--.*?-->|<(script|style|template|svg)\b[^>]*>.*?</\1\s*>",
+    re.IGNORECASE | re.DOTALL
+)
+# Bloc ouvert mais coupé par le plafond de lecture
+_TRUNCATED_BLOCK = re.compile(r"<(?:script|style|template|svg)\b.*\Z", re.IGNORECASE | re.DOTALL)
+_TAGS = re.compile(r"<[^>]*>")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def is_html_content_type(content_type: Optional[str]) -> bool:
+    """Content-Type HTML ? (absent : accepté, beaucoup de petits sites l'omettent)"""
+    if not content_type:
+        return True
+    return content_type.split(";", 1)[0].strip().lower() in HTML_CONTENT_TYPES
+
+
+class BoundedBody:
+    """Tampon de corps de page plafonné, alimenté morceau par morceau (sync ou async)"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.truncated = False
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Ajoute un morceau ; False quand le plafond est dépassé (arrêter la lecture)
+
+        Un corps qui s'arrête pile au plafond n'est pas tronqué : seule une donnée
+        au-delà du plafond marque la troncature.
+        """
+        remaining = self.max_bytes - len(self._buffer)
+        if len(chunk) > remaining:
+            self._buffer.extend(chunk[:remaining])
+            self.truncated = True
+            return False
+        self._buffer.extend(chunk)
+        return True
+
+    @property
+    def content(self) -> bytes:
+        return bytes(self._buffer)
+
+
+def read_bounded(chunks: Iterable[bytes], max_bytes: int = DEFAULT_MAX_BYTES) -> Tuple[bytes, bool]:
+    """
+    Lit un flux de morceaux jusqu'au plafond
+
+    Args:
+        chunks: Morceaux du corps (déjà décompressés)
+        max_bytes: Nombre maximum d'octets conservés
+
+    Returns:
+        (corps lu, True si la lecture a été interrompue au plafond)
+    """
+    body = BoundedBody(max_bytes)
+
+    for chunk in chunks:
+        if not body.feed(chunk):
+            break
+
+    return body.content, body.truncated
+
+
+def detect_charset(content: bytes, content_type: Optional[str] = None) -> str:
+    """Encodage d'une page : en-tête HTTP, balise meta des premiers octets, sinon UTF-8"""
+    for match in (
+        _CHARSET_HEADER.search(content_type or ""),
+        _CHARSET_META.search(content[:2048])
+    ):
+        if match:
+            charset = match.group(1)
+            charset = charset.decode("ascii", "ignore") if isinstance(charset, bytes) else charset
+            try:
+                "".encode(charset)
+                return charset
+            except LookupError:
+                continue
+
+    return "utf-8"
+
+
+def extract_text(content: bytes, content_type: Optional[str] = None) -> str:
+    """Texte visible en minuscules, espaces normalisés (page éventuellement tronquée)"""
+    markup = content.decode(detect_charset(content, content_type), errors="replace")
+    markup = _TRUNCATED_BLOCK.sub(" ", _INVISIBLE_BLOCKS.sub(" ", markup))
+    text = html.unescape(_TAGS.sub(" ", markup))
+    return _WHITESPACE.sub(" ", text).strip().lower()
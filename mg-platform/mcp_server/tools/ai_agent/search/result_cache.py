@@ -0,0 +1,166 @@
+# ============================================================================
+# CACHE PERSISTANT DES RÉSULTATS DE RECHERCHE
+# mg-platform/mcp_server/tools/ai_agent/search/result_cache.py
+# ============================================================================
+
+"""
+Cache disque requête -> URLs résultats des moteurs de recherche
+Responsabilités:
+- Stockage SQLite local (survit aux redémarrages et aux sessions)
+- TTL configurable, TTL réduit pour les résultats vides (cache négatif)
+- Éviction LRU bornée en nombre d'entrées
+- Compteurs hits / misses pour les analytics
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+
+class SearchResultCache:
+    """Cache SQLite des pages de résultats DuckDuckGo / Google"""
+
+    def __init__(self, db_path: str, ttl_seconds: float, negative_ttl_seconds: float, max_entries: int):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+
+        self.stats = {"hits": 0, "negative_hits": 0, "misses": 0, "expired": 0, "stores": 0, "evictions": 0}
+
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_schema()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["SearchResultCache"]:
+        """Construit le cache depuis la configuration (None si désactivé ou indisponible)"""
+        if not config.get("search_cache_enabled", True):
+            return None
+
+        try:
+            return cls(
+                config.get("search_cache_path", "data/cache/search_results.sqlite3"),
+                ttl_seconds=config.get("search_cache_ttl_hours", 72) * 3600,
+                negative_ttl_seconds=config.get("search_cache_negative_ttl_hours", 12) * 3600,
+                max_entries=config.get("search_cache_max_entries", 50000)
+            )
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Cache de recherche désactivé: {e}")
+            return None
+
+    def _init_schema(self):
+        """Crée la table et l'index LRU si nécessaire"""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_results (
+                    engine TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    urls TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (engine, query)
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_results_lru ON search_results (last_access)"
+            )
+            self._conn.commit()
+
+    def get(self, engine: str, query: str) -> Optional[List[str]]:
+        """
+        Cherche une requête en cache
+
+        Args:
+            engine: Moteur ("duckduckgo", "google")
+            query: Requête exacte
+
+        Returns:
+            Liste d'URLs (éventuellement vide = cache négatif) ou None si absent/expiré
+        """
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT urls, created_at FROM search_results WHERE engine = ? AND query = ?",
+                (engine, query)
+            ).fetchone()
+
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+
+            urls = json.loads(row[0])
+            ttl = self.ttl_seconds if urls else self.negative_ttl_seconds
+
+            if now - row[1] > ttl:
+                self._conn.execute(
+                    "DELETE FROM search_results WHERE engine = ? AND query = ?", (engine, query)
+                )
+                self._conn.commit()
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE search_results SET last_access = ? WHERE engine = ? AND query = ?",
+                (now, engine, query)
+            )
+            self._conn.commit()
+
+            self.stats["hits" if urls else "negative_hits"] += 1
+            return urls
+
+    def put(self, engine: str, query: str, urls: List[str]):
+        """Enregistre le résultat d'une requête (liste vide acceptée)"""
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_results (engine, query, urls, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (engine, query, json.dumps(urls), now, now)
+            )
+            self.stats["stores"] += 1
+            self._evict_if_needed()
+            self._conn.commit()
+
+    def _evict_if_needed(self):
+        """Supprime les entrées les moins récemment utilisées au-delà de max_entries"""
+        count = self._conn.execute("SELECT COUNT(*) FROM search_results").fetchone()[0]
+        overflow = count - self.max_entries
+
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM search_results WHERE rowid IN ("
+                "SELECT rowid FROM search_results ORDER BY last_access ASC LIMIT ?)",
+                (overflow,)
+            )
+            self.stats["evictions"] += overflow
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Compteurs et ratio de succès du cache"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM search_results").fetchone()[0]
+            stats = dict(self.stats)
+
+        lookups = stats["hits"] + stats["negative_hits"] + stats["misses"]
+        stats["entries"] = entries
+        stats["hit_ratio"] = round((stats["hits"] + stats["negative_hits"]) / lookups, 3) if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Vide complètement le cache"""
+        with self._lock:
+            self._conn.execute("DELETE FROM search_results")
+            self._conn.commit()
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self._lock:
+            self._conn.close()
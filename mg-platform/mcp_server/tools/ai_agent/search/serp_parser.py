@@ -0,0 +1,217 @@
+# ============================================================================
+# PARSING DES PAGES DE RÉSULTATS
+# mg-platform/mcp_server/tools/ai_agent/search/serp_parser.py
+# ============================================================================
+
+"""
+Extraction des liens de résultats DuckDuckGo / Google, backend interchangeable
+Responsabilités:
+- Backends : selectolax (C, lexbor), lxml (C, libxml2), extracteur ciblé
+  (expressions régulières, sans arbre), BeautifulSoup html.parser (historique)
+- "auto" : premier backend C disponible, sinon extracteur ciblé
+- Seuls les conteneurs de résultats sont parcourus, arrêt dès max_results liens retenus
+- Repli sur BeautifulSoup si le backend rapide échoue
+- Nettoyage des liens de redirection (uddg DuckDuckGo, /url?q= Google)
+- Reconnaissance d'une vraie page de résultats (vs CAPTCHA, page de consentement)
+"""
+
+import html
+import re
+import urllib.parse
+from typing import Callable, Iterator, List, Optional
+
+# Imports conditionnels : parseurs C optionnels, BeautifulSoup pour le repli
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+# Classes CSS des conteneurs de résultats, par moteur
+RESULT_CLASSES = {
+    "duckduckgo": ("result", "web-result"),
+    "google": ("g",)
+}
+
+# Marqueurs d'une page de résultats vide (requête sans résultat), en minuscules
+NO_RESULTS_MARKERS = {
+    "duckduckgo": ("no-results", "result--no-result"),
+    "google": ("did not match any documents", "aucun document ne correspond")
+}
+
+BACKENDS = ("selectolax", "lxml", "targeted", "bs4")
+
+_DIV_CLASS = re.compile(r"""<div\b[^>]*?\sclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+_ANCHOR_HREF = re.compile(r"""<a\b[^>]*?\shref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+
+
+def _attribute_value(match: "re.Match") -> str:
+    """Valeur d'attribut capturée (guillemets doubles, simples ou sans guillemets)"""
+    return next(group for group in match.groups() if group is not None)
+
+
+def clean_result_url(engine: str, url: str) -> Optional[str]:
+    """URL cible d'un lien de résultat (None si la redirection est illisible)"""
+    if engine == "duckduckgo" and '/l/?uddg=' in url:
+        try:
+            return urllib.parse.unquote(url.split('/l/?uddg=')[1].split('&')[0])
+        except Exception:
+            return None
+
+    if engine == "google" and url.startswith('/url?q='):
+        return urllib.parse.unquote(url.split('/url?q=')[1].split('&')[0])
+
+    return url
+
+
+def resolve_backend(backend: str = "auto") -> str:
+    """Backend effectif : celui demandé s'il est installé, sinon le meilleur disponible"""
+    available = {
+        "selectolax": SELECTOLAX_AVAILABLE,
+        "lxml": LXML_AVAILABLE,
+        "targeted": True,
+        "bs4": BS4_AVAILABLE
+    }
+
+    if backend in available and available[backend]:
+        return backend
+
+    for candidate in ("selectolax", "lxml", "targeted"):
+        if available[candidate]:
+            return candidate
+
+    return "targeted"
+
+
+class SerpParser:
+    """Extraction des liens de résultats avec le backend choisi"""
+
+    def __init__(self, backend: str = "auto"):
+        self.backend = resolve_backend(backend)
+
+    def parse_results(self, engine: str, content: bytes, max_results: int,
+                      accept: Callable[[str], bool] = lambda url: True) -> List[str]:
+        """
+        Liens de résultats d'une page de moteur
+
+        Args:
+            engine: "duckduckgo" ou "google"
+            content: Page de résultats brute
+            max_results: Nombre de liens retenus au plus
+            accept: Filtre appliqué aux URL nettoyées (ex: is_valid_business_website)
+
+        Returns:
+            URL retenues, dans l'ordre de la page
+        """
+        try:
+            return self._collect(self.backend, engine, content, max_results, accept)
+        except Exception:
+            if self.backend == "bs4" or not BS4_AVAILABLE:
+                return []
+            # Backend rapide en échec sur une page atypique : parseur historique
+            try:
+                return self._collect("bs4", engine, content, max_results, accept)
+            except Exception:
+                return []
+
+    def is_results_page(self, engine: str, content: bytes) -> bool:
+        """
+        La page est-elle une page de résultats du moteur ?
+
+        Vrai si elle contient au moins un conteneur de résultat ou le marqueur
+        « aucun résultat » ; faux pour un CAPTCHA, une page de consentement ou un
+        gabarit inconnu, où une liste de liens vide ne signifie pas « aucun résultat ».
+        """
+        markup = content.decode("utf-8", errors="replace") if isinstance(content, bytes) else content
+        classes = set(RESULT_CLASSES[engine])
+
+        for match in _DIV_CLASS.finditer(markup):
+            if classes.intersection(html.unescape(_attribute_value(match)).split()):
+                return True
+
+        lowered = markup.lower()
+        return any(marker in lowered for marker in NO_RESULTS_MARKERS[engine])
+
+    def _collect(self, backend: str, engine: str, content: bytes, max_results: int,
+                 accept: Callable[[str], bool]) -> List[str]:
+        websites = []
+
+        for href in getattr(self, f"_hrefs_{backend}")(engine, content):
+            url = clean_result_url(engine, href)
+
+            if url is not None and accept(url):
+                websites.append(url)
+
+                if len(websites) >= max_results:
+                    break
+
+        return websites
+
+    # ------------------------------------------------------------------
+    # Backends : premier lien (href) de chaque conteneur de résultat, dans l'ordre
+    # ------------------------------------------------------------------
+
+    def _hrefs_selectolax(self, engine: str, content: bytes) -> Iterator[str]:
+        selector = ", ".join(f"div.{name}" for name in RESULT_CLASSES[engine])
+        for node in SelectolaxParser(content).css(selector):
+            link = node.css_first("a[href]")
+            if link is not None:
+                yield link.attributes.get("href") or ""
+
+    def _hrefs_lxml(self, engine: str, content: bytes) -> Iterator[str]:
+        condition = " or ".join(
+            f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+            for name in RESULT_CLASSES[engine]
+        )
+        for node in lxml.html.fromstring(content).xpath(f"//div[{condition}]"):
+            links = node.xpath("(.//a[@href])[1]")
+            if links:
+                yield links[0].get("href")
+
+    def _hrefs_targeted(self, engine: str, content: bytes) -> Iterator[str]:
+        """
+        Sans arbre : repère les <div> dont une classe est celle d'un résultat, puis
+        le premier <a href> situé avant le conteneur suivant
+        """
+        markup = content.decode("utf-8", errors="replace") if isinstance(content, bytes) else content
+        classes = set(RESULT_CLASSES[engine])
+        previous = None
+
+        # Parcours paresseux : la lecture s'arrête dès que l'appelant a assez de liens
+        for match in _DIV_CLASS.finditer(markup):
+            if not classes.intersection(html.unescape(_attribute_value(match)).split()):
+                continue
+            if previous is not None:
+                href = self._first_href(markup, previous, match.start())
+                if href is not None:
+                    yield href
+            previous = match.end()
+
+        if previous is not None:
+            href = self._first_href(markup, previous, len(markup))
+            if href is not None:
+                yield href
+
+    @staticmethod
+    def _first_href(markup: str, start: int, end: int) -> Optional[str]:
+        match = _ANCHOR_HREF.search(markup, start, end)
+        return html.unescape(_attribute_value(match)) if match else None
+
+    def _hrefs_bs4(self, engine: str, content: bytes) -> Iterator[str]:
+        soup = BeautifulSoup(content, 'html.parser')
+        for result in soup.find_all('div', class_=list(RESULT_CLASSES[engine])):
+            link_tag = result.find('a', href=True)
+            if link_tag:
+                yield link_tag.get('href', '')
@@ -8,28 +8,64 @@ Module de recherche web réelle avec DuckDuckGo et Google
 Responsabilités:
 - Recherche DuckDuckGo avec gestion HTTP 202
 - Validation sites trouvés (scoring 50%+)
-- Rate limiting (2 sec entre requêtes)
+- Rate limiting centralisé par moteur et par hôte (RateLimiter partagé par le processus)
+- Backoff adaptatif sur HTTP 202 / 429 signalé au limiteur
+- Disjoncteur par moteur : moteur bloqué contourné, requêtes routées vers le suivant
+- Pages candidates via l'ordonnanceur partagé (créneaux par hôte, robots.txt, keep-alive)
+- Téléchargement en flux plafonné (contenus non HTML écartés) et extraction rapide du texte
+- Pages de résultats analysées par un backend interchangeable (serp_parser)
+- Cache disque des pages de résultats (requêtes déjà résolues)
+- Cache partagé des pages candidates (revalidation conditionnelle)
 - Headers rotatifs anti-détection
+- Points de contrôle d'annulation / pause entre requêtes (RunControl)
+- Chronométrage par étape : moteurs, attente limiteur, téléchargement et validation de page
+- Compteurs processus : requêtes par moteur et statut, attentes limiteur, caches (GET /metrics)
 """
 
 import requests
-import time
 import random
+import threading
 import urllib.parse
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
-from ..core.exceptions import SearchError, WebSearchTimeoutError, RateLimitError
+from ..core.exceptions import SearchError, WebSearchTimeoutError, RateLimitError, EnrichmentCancelledError
 from ..utils.validators import is_valid_business_website
+from ..utils.rate_limiter import RateLimiter, get_shared_rate_limiter, parse_retry_after
+from ..utils.run_control import RunControl
+from ..utils.stage_timer import StageTimer
+from ..utils.search_stats import get_search_stats
+from ..utils.circuit_breaker import get_shared_circuit_breaker
+from .result_cache import SearchResultCache
+from .page_cache import get_shared_page_cache
+from .fetch_scheduler import get_shared_fetch_scheduler, robots_url
+from .page_reader import DEFAULT_MAX_BYTES, extract_text, is_html_content_type, read_bounded
+from .serp_parser import SerpParser
+
+# Moteurs par ordre de préférence (routage quand un disjoncteur est ouvert)
+SEARCH_PROVIDERS = ("duckduckgo", "google")
+PROVIDER_LABELS = {"duckduckgo": "DuckDuckGo", "google": "Google"}
 
 
 class WebSearchEngine:
     """Moteur de recherche web avec multiple sources"""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], run_control: Optional[RunControl] = None,
+                 timer: Optional[StageTimer] = None):
         self.config = config
+        self.run_control = run_control or RunControl()
+        self.timer = timer or StageTimer()
+        self.search_stats = get_search_stats()
         self.timeout = config.get("duckduckgo_timeout", 10)
-        self.rate_limit = config.get("rate_limit_delay", 2)
+        self.rate_limiter = get_shared_rate_limiter(config)
+        self.circuit_breaker = get_shared_circuit_breaker(config)
+        self.max_park = config.get("circuit_breaker_max_park", 30.0)
+        self.result_cache = SearchResultCache.from_config(config)
+        self.page_cache = get_shared_page_cache(config)
+        self.fetch_scheduler = get_shared_fetch_scheduler(config)
+        self._local = threading.local()
+        self.validation_timeout = config.get("validation_timeout", 8)
+        self.page_max_bytes = config.get("page_max_bytes", DEFAULT_MAX_BYTES)
+        self.serp_parser = SerpParser(config.get("serp_parser", "auto"))
         self.user_agents = config.get("user_agents", [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         ])
@@ -44,6 +80,9 @@ class WebSearchEngine:
             
         Returns:
             Dict avec résultats de recherche
+            
+        Raises:
+            EnrichmentCancelledError: annulation demandée entre deux requêtes
         """
         
         result = {
@@ -52,7 +91,9 @@ class WebSearchEngine:
             "source": "",
             "confidence": 0,
             "attempted_queries": [],
-            "error_reason": ""
+            "candidates": [],
+            "error_reason": "",
+            "transient": False  # Échec dû à l'indisponibilité des moteurs : ni conservé ni réutilisé
         }
         
         try:
@@ -62,50 +103,99 @@ class WebSearchEngine:
             
             # Essayer chaque requête
             for i, query in enumerate(search_queries, 1):
+                self.run_control.checkpoint()
                 
-                # DuckDuckGo en priorité
-                websites = self._search_duckduckgo(query)
+                # DuckDuckGo en priorité, moteur suivant si son disjoncteur est ouvert
+                engine = self._route_query("duckduckgo")
                 
-                if websites:
-                    # Valider les résultats
-                    for website in websites:
-                        validation = self._validate_website(website, company_name, commune)
-                        
-                        if validation["is_valid"] and validation["confidence"] >= 50:
-                            result.update({
-                                "found": True,
-                                "website": website,
-                                "source": "DuckDuckGo",
-                                "confidence": validation["confidence"]
-                            })
-                            return result
+                if engine is None:
+                    result["error_reason"] = "Moteurs de recherche suspendus (disjoncteurs ouverts)"
+                    result["transient"] = True
+                    return result
                 
-                # Google en fallback si DuckDuckGo échoue
-                if i == len(search_queries):  # Dernière tentative
-                    google_results = self._search_google(query)
-                    
-                    for website in google_results:
-                        validation = self._validate_website(website, company_name, commune)
-                        
-                        if validation["is_valid"] and validation["confidence"] >= 50:
-                            result.update({
-                                "found": True,
-                                "website": website,
-                                "source": "Google",
-                                "confidence": validation["confidence"]
-                            })
-                            return result
+                if self._search_with(engine, query, company_name, commune, result, stage=i):
+                    return result
                 
-                # Rate limiting entre requêtes
-                time.sleep(self.rate_limit)
+                # Google en fallback si DuckDuckGo échoue (dernière tentative, circuit fermé)
+                if i == len(search_queries) and engine != "google" and self.circuit_breaker.available("google"):
+                    self.run_control.checkpoint()
+                    if self._search_with("google", query, company_name, commune, result, stage=i + 1):
+                        return result
             
             result["error_reason"] = "Aucun site web valide trouvé"
             return result
             
+        except EnrichmentCancelledError:
+            raise
         except Exception as e:
             result["error_reason"] = f"Erreur recherche web: {str(e)}"
             return result
     
+    def _search_with(self, engine: str, query: str, company_name: str, commune: str,
+                     result: Dict[str, Any], stage: int = 1) -> bool:
+        """
+        Interroge un moteur et valide ses résultats ; True si un site valide a été retenu
+        
+        stage : avancement de la recherche de l'entreprise (requête en cours), les
+        téléchargements des recherches les plus avancées sont servis en premier.
+        """
+        websites = self._search_duckduckgo(query) if engine == "duckduckgo" else self._search_google(query)
+        source = PROVIDER_LABELS[engine]
+        
+        for rank, website in enumerate(websites):
+            validation = self._validate_website(website, company_name, commune, priority=(-stage, rank))
+            result["candidates"].append(self._candidate(website, source, validation))
+            
+            if validation["is_valid"] and validation["confidence"] >= 50:
+                result.update({
+                    "found": True,
+                    "website": website,
+                    "source": source,
+                    "confidence": validation["confidence"]
+                })
+                return True
+        
+        return False
+    
+    def _route_query(self, preferred: str) -> Optional[str]:
+        """
+        Moteur à interroger : le préféré, sinon le suivant dont le disjoncteur est fermé
+        
+        Si aucun n'est disponible (circuit ouvert ou sonde en cours), la requête est
+        mise en attente de la prochaine sonde ou de l'issue de la sonde en cours
+        (au plus circuit_breaker_max_park secondes au total, interruptible).
+        
+        Returns:
+            Nom du moteur, ou None si aucun moteur ne sera disponible à temps
+        """
+        providers = self._candidate_providers(preferred)
+        parked = 0.0
+        
+        while True:
+            for provider in providers:
+                if self.circuit_breaker.available(provider):
+                    return provider
+            
+            delay = min(self.circuit_breaker.retry_in(provider) for provider in providers)
+            if parked + delay > self.max_park:
+                return None
+            
+            with self.timer.span("circuit_park"):
+                self.run_control.sleep(delay)
+            parked += delay
+    
+    def _candidate_providers(self, preferred: str) -> Tuple[str, ...]:
+        return SEARCH_PROVIDERS[SEARCH_PROVIDERS.index(preferred):]
+    
+    def _candidate(self, website: str, source: str, validation: Dict[str, Any]) -> Dict[str, Any]:
+        """Trace d'un site candidat évalué (pour le store d'enrichissement)"""
+        return {
+            "url": website,
+            "source": source,
+            "confidence": validation["confidence"],
+            "is_valid": validation["is_valid"]
+        }
+    
     def _generate_search_queries(self, company_name: str, commune: str) -> List[str]:
         """Génère des requêtes de recherche optimisées"""
         
@@ -126,169 +216,396 @@ class WebSearchEngine:
     def _search_duckduckgo(self, query: str, max_results: int = 5) -> List[str]:
         """Recherche DuckDuckGo avec gestion HTTP 202"""
         
+        cached = self._get_cached_results("duckduckgo", query)
+        if cached is not None:
+            return cached[:max_results]
+        
+        # Disjoncteur ouvert (ou sonde déjà en cours) : pas de requête
+        if not self.circuit_breaker.allow("duckduckgo"):
+            return []
+        
         try:
-            headers = {
-                'User-Agent': random.choice(self.user_agents),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
-                'DNT': '1',
-                'Connection': 'close'
-            }
+            ddg_url, headers = self._build_duckduckgo_request(query)
             
-            # URL DuckDuckGo
-            encoded_query = urllib.parse.quote(query)
-            ddg_url = f"https://html.duckduckgo.com/html/?q={encoded_query}"
+            # Créneau réservé auprès du limiteur partagé (attente interruptible)
+            self._wait_for_slot("duckduckgo")
             
-            response = requests.get(ddg_url, headers=headers, timeout=self.timeout)
+            with self.timer.span("duckduckgo") as span:
+                response = self._http_get("duckduckgo", ddg_url, headers, self.timeout)
+                span["bytes"] = len(response.content)
             
-            if response.status_code == 202:
-                # HTTP 202 = DuckDuckGo nous demande d'attendre
-                time.sleep(2)
-                # Retry une fois
-                response = requests.get(ddg_url, headers=headers, timeout=self.timeout)
+            if self._is_throttled("duckduckgo", response):
+                # HTTP 202 / 429 = DuckDuckGo nous demande d'attendre : backoff puis retry une fois
+                # (sauf si ce ralentissement vient d'ouvrir le disjoncteur)
+                self._record_response("duckduckgo", response)
+                if not self.circuit_breaker.allow("duckduckgo"):
+                    return []
+                self._wait_for_slot("duckduckgo")
+                with self.timer.span("duckduckgo") as span:
+                    response = self._http_get("duckduckgo", ddg_url, headers, self.timeout)
+                    span["bytes"] = len(response.content)
+                self._is_throttled("duckduckgo", response)
             
             if response.status_code != 200:
+                self._record_response("duckduckgo", response)
                 return []
             
-            # Parser les résultats
-            return self._parse_duckduckgo_results(response.content, max_results)
+            # Parser les résultats (cache négatif si la page de résultats est vide)
+            websites = self._parse_duckduckgo_results(response.content, max_results)
+            recognized = self._record_serp("duckduckgo", websites, response.content)
+            self._store_results("duckduckgo", query, websites, recognized)
+            return websites
             
         except requests.exceptions.Timeout:
             raise WebSearchTimeoutError(f"Timeout DuckDuckGo pour: {query}")
         except requests.exceptions.RequestException as e:
             raise SearchError(f"Erreur DuckDuckGo: {str(e)}")
     
-    def _parse_duckduckgo_results(self, content: bytes, max_results: int) -> List[str]:
-        """Parse les résultats DuckDuckGo"""
+    def _build_duckduckgo_request(self, query: str) -> Tuple[str, Dict[str, str]]:
+        """Construit l'URL et les headers d'une recherche DuckDuckGo"""
+        
+        headers = {
+            'User-Agent': random.choice(self.user_agents),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
+            'DNT': '1',
+            'Connection': 'close'
+        }
         
+        # URL DuckDuckGo
+        encoded_query = urllib.parse.quote(query)
+        ddg_url = f"https://html.duckduckgo.com/html/?q={encoded_query}"
+        
+        return ddg_url, headers
+    
+    def _wait_for_slot(self, source: str, engine: Optional[str] = None):
+        """Attend le créneau réservé auprès du limiteur (interruptible, chronométré)"""
+        delay = self.rate_limiter.reserve(source)
+        self.search_stats.record_wait(engine or source, delay)
+        
+        with self.timer.span("rate_limit_wait"):
+            self.run_control.sleep(delay)
+    
+    def _is_throttled(self, source: str, response) -> bool:
+        """Signale au limiteur la réponse obtenue (202 / 429 : backoff, 200 : retour au débit nominal)"""
+        if response.status_code in (202, 429):
+            self.rate_limiter.penalize(source, parse_retry_after(response.headers.get("Retry-After")))
+            return True
+        
+        if response.status_code == 200:
+            self.rate_limiter.reward(source)
+        return False
+    
+    def _http_get(self, engine: str, url: str, headers: Dict[str, str], timeout: float,
+                  session: Optional[requests.Session] = None, **kwargs):
+        """GET HTTP compté par moteur et code de statut (session keep-alive si fournie)"""
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            websites = []
-            
-            # Extraire les liens de résultats
-            for result in soup.find_all('div', class_=['result', 'web-result']):
-                link_tag = result.find('a', href=True)
-                if not link_tag:
-                    continue
-                
-                url = link_tag.get('href', '')
-                
-                # Nettoyer l'URL DuckDuckGo
-                if '/l/?uddg=' in url:
-                    try:
-                        clean_url = urllib.parse.unquote(url.split('/l/?uddg=')[1].split('&')[0])
-                        url = clean_url
-                    except:
-                        continue
-                
-                # Valider l'URL
-                if is_valid_business_website(url):
-                    websites.append(url)
-                    
-                    if len(websites) >= max_results:
-                        break
-            
-            return websites
-            
-        except Exception:
-            return []
+            response = (session or requests).get(url, headers=headers, timeout=timeout, **kwargs)
+        except requests.exceptions.Timeout:
+            self._record_status(engine, "timeout")
+            raise
+        except requests.exceptions.RequestException:
+            self._record_status(engine, "error")
+            raise
+        
+        self._record_status(engine, response.status_code)
+        return response
+    
+    def _record_status(self, engine: str, status: Any):
+        """Compte le statut d'une requête (sans réponse : la sonde éventuelle du moteur est libérée)"""
+        self.search_stats.record_request(engine, status)
+        
+        if engine in SEARCH_PROVIDERS and not isinstance(status, int):
+            self.circuit_breaker.release(engine)
+    
+    def _record_response(self, engine: str, response):
+        """
+        Réponse non exploitable d'un moteur, pour son disjoncteur
+        
+        202 / 429 (ralentissement) : échec. Autre statut (404, 5xx) : sans rapport
+        avec un blocage, la sonde éventuelle est libérée sans verdict.
+        """
+        if response.status_code in (202, 429):
+            self.circuit_breaker.record_failure(engine)
+        else:
+            self.circuit_breaker.release(engine)
+    
+    def _record_serp(self, engine: str, websites: List[str], content: bytes) -> bool:
+        """
+        Page HTTP 200 d'un moteur, pour son disjoncteur : succès si c'est une page de
+        résultats reconnue, échec sinon (CAPTCHA, page de consentement)
+        
+        Returns:
+            True si la page est une page de résultats
+        """
+        recognized = bool(websites) or self.serp_parser.is_results_page(engine, content)
+        
+        if recognized:
+            self.circuit_breaker.record_success(engine)
+        else:
+            self.circuit_breaker.record_failure(engine)
+        return recognized
+    
+    def _get_cached_results(self, engine: str, query: str) -> Optional[List[str]]:
+        """Résultats en cache pour une requête (None si absent ou cache désactivé)"""
+        if self.result_cache is None:
+            return None
+        
+        cached = self.result_cache.get(engine, query)
+        self.search_stats.record_cache("search_results", "hit" if cached is not None else "miss")
+        return cached
+    
+    def _store_results(self, engine: str, query: str, websites: List[str], recognized: bool):
+        """
+        Enregistre les résultats d'une réponse HTTP 200 dans le cache
+        
+        Une liste vide n'est mise en cache (négatif) que si la page est bien une page de
+        résultats (voir _record_serp) : un CAPTCHA ou une page de consentement sera redemandé.
+        """
+        if self.result_cache is None:
+            return
+        
+        if recognized:
+            self.result_cache.put(engine, query, websites)
+    
+    def _parse_duckduckgo_results(self, content: bytes, max_results: int) -> List[str]:
+        """Parse les résultats DuckDuckGo"""
+        with self.timer.span("serp_parse"):
+            return self.serp_parser.parse_results("duckduckgo", content, max_results, is_valid_business_website)
     
     def _search_google(self, query: str, max_results: int = 3) -> List[str]:
         """Recherche Google (utilisation limitée)"""
         
+        cached = self._get_cached_results("google", query)
+        if cached is not None:
+            return cached[:max_results]
+        
+        if not self.circuit_breaker.allow("google"):
+            return []
+        
         try:
-            headers = {
-                'User-Agent': random.choice(self.user_agents),
-                'Accept-Language': 'fr-FR,fr;q=0.9'
-            }
+            google_url, headers = self._build_google_request(query, max_results)
+            
+            self._wait_for_slot("google")
             
-            # URL Google Search
-            encoded_query = urllib.parse.quote(query)
-            google_url = f"https://www.google.com/search?q={encoded_query}&num={max_results}"
+            with self.timer.span("google") as span:
+                response = self._http_get("google", google_url, headers, self.timeout)
+                span["bytes"] = len(response.content)
             
-            response = requests.get(google_url, headers=headers, timeout=self.timeout)
+            self._is_throttled("google", response)
             
             if response.status_code != 200:
+                self._record_response("google", response)
                 return []
             
-            return self._parse_google_results(response.content, max_results)
+            websites = self._parse_google_results(response.content, max_results)
+            recognized = self._record_serp("google", websites, response.content)
+            self._store_results("google", query, websites, recognized)
+            return websites
             
+        except EnrichmentCancelledError:
+            raise
         except Exception:
             return []
     
+    def _build_google_request(self, query: str, max_results: int) -> Tuple[str, Dict[str, str]]:
+        """Construit l'URL et les headers d'une recherche Google"""
+        
+        headers = {
+            'User-Agent': random.choice(self.user_agents),
+            'Accept-Language': 'fr-FR,fr;q=0.9'
+        }
+        
+        # URL Google Search
+        encoded_query = urllib.parse.quote(query)
+        google_url = f"https://www.google.com/search?q={encoded_query}&num={max_results}"
+        
+        return google_url, headers
+    
     def _parse_google_results(self, content: bytes, max_results: int) -> List[str]:
         """Parse les résultats Google"""
+        with self.timer.span("serp_parse"):
+            return self.serp_parser.parse_results("google", content, max_results, is_valid_business_website)
+    
+    def _validate_website(self, website: str, company_name: str, commune: str,
+                          priority: Tuple = ()) -> Dict[str, Any]:
+        """Valide qu'un site web correspond à l'entreprise"""
         
-        try:
-            soup = BeautifulSoup(content, 'html.parser')
-            websites = []
+        with self.timer.span("page_validation"):
+            try:
+                page_text = self._fetch_page_text(website, priority)
+                
+                if page_text is None:
+                    return self._empty_validation()
+                
+                return self._score_page_text(page_text, company_name, commune)
+                
+            except EnrichmentCancelledError:
+                raise
+            except Exception:
+                return self._empty_validation()
+    
+    def _fetch_page_text(self, website: str, priority: Tuple = ()) -> Optional[str]:
+        """Texte en minuscules d'une page, via le cache partagé si possible"""
+        
+        entry = self._lookup_page(website)
+        
+        if entry and entry["fresh"]:
+            return entry["text"]
+        
+        # Télécharger le contenu du site (conditionnel si déjà en cache)
+        headers = self._build_page_headers()
+        if self.page_cache:
+            headers.update(self.page_cache.conditional_headers(entry))
+        
+        # Créneau de l'hôte (concurrence bornée, priorité) puis budget de débit par hôte
+        host = RateLimiter.host_source(website)
+        
+        with self.fetch_scheduler.slot(website, priority, self.run_control):
+            if not self._robots_allowed(website):
+                return None
             
-            # Extraire les liens de résultats Google
-            for result in soup.find_all('div', class_='g'):
-                link_tag = result.find('a', href=True)
-                if link_tag:
-                    url = link_tag.get('href', '')
-                    
-                    if url.startswith('/url?q='):
-                        # Nettoyer URL Google
-                        url = url.split('/url?q=')[1].split('&')[0]
-                        url = urllib.parse.unquote(url)
-                    
-                    if is_valid_business_website(url):
-                        websites.append(url)
-                        
-                        if len(websites) >= max_results:
-                            break
+            self._wait_for_slot(host, engine="page")
             
-            return websites
+            with self.timer.span("page_fetch") as span:
+                response = self._http_get("page", website, headers, self.validation_timeout,
+                                          session=self._http_session(), allow_redirects=True, stream=True)
+                try:
+                    content = self._read_page_body(response)
+                finally:
+                    response.close()
+                span["bytes"] = len(content or b"")
+        
+        self._is_throttled(host, response)
+        
+        return self._handle_page_response(
+            website, entry, response.status_code, content, response.headers
+        )
+    
+    def _read_page_body(self, response) -> Optional[bytes]:
+        """Corps d'une réponse en flux, plafonné (None si le contenu n'est pas du HTML)"""
+        if response.status_code != 200:
+            return b""
+        
+        if not is_html_content_type(response.headers.get("Content-Type")):
+            self._account_download(response.headers, None, False, 0)
+            return None
+        
+        # iter_content décompresse gzip / deflate au fil de l'eau
+        content, truncated = read_bounded(response.iter_content(chunk_size=16384), self.page_max_bytes)
+        wire_bytes = response.raw.tell() if hasattr(response.raw, "tell") else len(content)
+        self._account_download(response.headers, content, truncated, wire_bytes)
+        return content
+    
+    def _account_download(self, headers, content: Optional[bytes], truncated: bool, wire_bytes: int):
+        """Compte un corps de page lu et les octets évités (d'après Content-Length quand il est annoncé)"""
+        try:
+            announced = int(headers.get("Content-Length") or 0)
+        except ValueError:
+            announced = 0
+        
+        if content is None:
+            self.search_stats.record_download("not_html", 0, announced)
+        else:
+            saved = max(0, announced - wire_bytes) if truncated else 0
+            self.search_stats.record_download("truncated" if truncated else "complete", len(content), saved)
+    
+    def _robots_allowed(self, website: str) -> bool:
+        """Consulte robots.txt (téléchargé une fois par hôte) ; applique son Crawl-delay"""
+        if self.fetch_scheduler.robots_pending(website):
+            self._wait_for_slot(RateLimiter.host_source(website), engine="page")
             
-        except Exception:
-            return []
+            try:
+                response = self._http_get("robots", robots_url(website), self._build_page_headers(),
+                                          self.validation_timeout, session=self._http_session())
+                status, text = response.status_code, response.text
+            except requests.exceptions.RequestException:
+                status, text = None, ""
+            
+            self._apply_crawl_delay(website, self.fetch_scheduler.store_robots(website, status, text))
+        
+        return self.fetch_scheduler.can_fetch(website)
     
-    def _validate_website(self, website: str, company_name: str, commune: str) -> Dict[str, Any]:
-        """Valide qu'un site web correspond à l'entreprise"""
+    def _apply_crawl_delay(self, website: str, crawl_delay: Optional[float]):
+        """Crawl-delay du site : intervalle par hôte du limiteur relevé si besoin"""
+        host = RateLimiter.host_source(website)
+        if crawl_delay and crawl_delay > self.rate_limiter.get_interval(host):
+            self.rate_limiter.set_interval(host, crawl_delay)
+    
+    def _http_session(self) -> requests.Session:
+        """Session HTTP du thread courant (connexions keep-alive réutilisées par hôte)"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+    
+    def _lookup_page(self, website: str) -> Optional[Dict[str, Any]]:
+        """Entrée du cache de pages (consultation comptée : hit, stale, miss)"""
+        if not self.page_cache:
+            return None
         
-        validation = {
+        entry = self.page_cache.lookup(website)
+        self.search_stats.record_cache("pages", "miss" if entry is None else ("hit" if entry["fresh"] else "stale"))
+        return entry
+    
+    def _handle_page_response(self, website: str, entry: Optional[Dict[str, Any]],
+                              status_code: int, content: Optional[bytes], headers) -> Optional[str]:
+        """Traite la réponse d'un téléchargement de page (200, 304 ou erreur)"""
+        
+        if status_code == 304 and entry:
+            self.page_cache.mark_revalidated(website)
+            return entry["text"]
+        
+        if status_code != 200 or content is None:
+            return None
+        
+        page_text = self._extract_page_text(content, headers.get("Content-Type"))
+        
+        if self.page_cache:
+            self.page_cache.store(
+                website, page_text,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified")
+            )
+        
+        return page_text
+    
+    def _build_page_headers(self) -> Dict[str, str]:
+        """Headers pour le téléchargement d'un site candidat"""
+        return {
+            'User-Agent': random.choice(self.user_agents),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+        }
+    
+    def _empty_validation(self) -> Dict[str, Any]:
+        """Résultat de validation négatif par défaut"""
+        return {
             "is_valid": False,
             "confidence": 0,
             "details": {}
         }
+    
+    def _extract_page_text(self, content: bytes, content_type: Optional[str] = None) -> str:
+        """Extrait le texte en minuscules d'une page HTML (sans arbre DOM)"""
+        return extract_text(content, content_type)
+    
+    def _score_page_text(self, page_text: str, company_name: str, commune: str) -> Dict[str, Any]:
+        """Calcule la validation d'un couple entreprise/commune sur un texte de page"""
         
-        try:
-            # Télécharger le contenu du site
-            headers = {
-                'User-Agent': random.choice(self.user_agents),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+        # Calcul de confiance
+        confidence = self._calculate_website_confidence(
+            page_text, company_name, commune
+        )
+        
+        return {
+            "is_valid": confidence >= 50,
+            "confidence": confidence,
+            "details": {
+                "content_length": len(page_text),
+                "has_company_name": company_name.lower() in page_text,
+                "has_commune": commune.lower() in page_text
             }
-            
-            response = requests.get(website, headers=headers, timeout=8, allow_redirects=True)
-            
-            if response.status_code != 200:
-                return validation
-            
-            # Parser le contenu
-            soup = BeautifulSoup(response.content, 'html.parser')
-            page_text = soup.get_text().lower()
-            
-            # Calcul de confiance
-            confidence = self._calculate_website_confidence(
-                page_text, company_name, commune
-            )
-            
-            validation.update({
-                "is_valid": confidence >= 50,
-                "confidence": confidence,
-                "details": {
-                    "content_length": len(page_text),
-                    "has_company_name": company_name.lower() in page_text,
-                    "has_commune": commune.lower() in page_text
-                }
-            })
-            
-            return validation
-            
-        except Exception:
-            return validation
+        }
     
     def _calculate_website_confidence(self, page_text: str, company_name: str, commune: str) -> int:
         """Calcule le score de confiance pour un site web"""
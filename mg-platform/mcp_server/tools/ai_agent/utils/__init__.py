@@ -10,6 +10,7 @@ Module utils de l'Agent IA - Utilitaires et fonctions communes
 from .validators import (
     is_valid_business_website,
     is_valid_siret,
+    normalize_siret,
     is_valid_email,
     clean_company_name,
     normalize_commune_name
@@ -27,6 +28,14 @@ from .logging import (
     cleanup_old_logs
 )
 
+from .rate_limiter import RateLimiter, get_shared_rate_limiter, get_rate_limiter_stats
+from .circuit_breaker import CircuitBreaker, get_shared_circuit_breaker, get_circuit_breaker_stats
+from .run_control import RunControl
+from .session_metrics import SessionMetrics, SessionIndex, get_session_index
+from .event_log import SessionEventLog, JsonLinesFormatter, read_events
+from .stage_timer import StageTimer, StageHistogram
+from .search_stats import SearchStats, get_search_stats
+
 # Imports futurs
 # from .text_utils import TextNormalizer, NameMatcher
 
@@ -34,6 +43,7 @@ __all__ = [
     # Validateurs
     "is_valid_business_website",
     "is_valid_siret", 
+    "normalize_siret",
     "is_valid_email",
     "clean_company_name",
     "normalize_commune_name",
@@ -49,6 +59,37 @@ __all__ = [
     "log_performance_metrics",
     "cleanup_old_logs",
     
+    # Débit
+    "RateLimiter",
+    "get_shared_rate_limiter",
+    "get_rate_limiter_stats",
+    
+    # Disjoncteurs des moteurs de recherche
+    "CircuitBreaker",
+    "get_shared_circuit_breaker",
+    "get_circuit_breaker_stats",
+    
+    # Contrôle d'exécution
+    "RunControl",
+    
+    # Métriques de session
+    "SessionMetrics",
+    "SessionIndex",
+    "get_session_index",
+    
+    # Journal d'événements
+    "SessionEventLog",
+    "JsonLinesFormatter",
+    "read_events",
+    
+    # Chronométrage par étape
+    "StageTimer",
+    "StageHistogram",
+    
+    # Compteurs de recherche du processus
+    "SearchStats",
+    "get_search_stats",
+    
     # À venir
     # "TextNormalizer",
     # "NameMatcher"
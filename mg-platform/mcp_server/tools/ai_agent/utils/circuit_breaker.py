@@ -0,0 +1,239 @@
+# ============================================================================
+# DISJONCTEUR PAR MOTEUR DE RECHERCHE
+# mg-platform/mcp_server/tools/ai_agent/utils/circuit_breaker.py
+# ============================================================================
+
+"""
+Disjoncteur partagé par moteur de recherche (DuckDuckGo, Google)
+Responsabilités:
+- Ouverture après N réponses en échec (202 / 429, page de résultats non reconnue) dans une fenêtre glissante
+- Circuit ouvert : le moteur n'est plus sollicité, les requêtes sont routées ailleurs
+- Demi-ouverture après le délai de refroidissement : une seule requête sonde
+- Sonde réussie : fermeture ; sonde en échec : réouverture, délai doublé (plafonné)
+- Issue sans verdict (404, 5xx, timeout) : la sonde est libérée, le circuit reste demi-ouvert
+- Instance partagée par processus : un moteur bloqué l'est pour tous les jobs
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Dict, Any, Optional, Tuple
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Intervalle (s) de consultation du circuit pendant qu'une sonde est en cours
+PROBE_POLL_INTERVAL = 1.0
+
+
+class _ProviderCircuit:
+    """État du disjoncteur d'un moteur"""
+
+    def __init__(self, cooldown: float):
+        self.state = CLOSED
+        self.failures: deque = deque()
+        self.cooldown = cooldown
+        self.opened_until = 0.0
+        self.probe_started: Optional[float] = None
+        self.trips = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """Disjoncteurs fermé / ouvert / demi-ouvert, un par moteur"""
+
+    def __init__(self, threshold: int = 3, window: float = 60.0,
+                 cooldown: float = 30.0, max_cooldown: float = 300.0):
+        """
+        Args:
+            threshold: Échecs dans la fenêtre déclenchant l'ouverture
+            window: Fenêtre glissante de comptage des échecs (secondes)
+            cooldown: Durée d'ouverture avant la première sonde (secondes)
+            max_cooldown: Plafond de la durée d'ouverture après sondes en échec
+        """
+        self.threshold = max(1, int(threshold))
+        self.window = window
+        self.cooldown = cooldown
+        self.max_cooldown = max(cooldown, max_cooldown)
+
+        self._circuits: Dict[str, _ProviderCircuit] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "CircuitBreaker":
+        """Construit le disjoncteur depuis la configuration de l'agent"""
+        return cls(**cls._settings(config))
+
+    @staticmethod
+    def _settings(config: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "threshold": config.get("circuit_breaker_threshold", 3),
+            "window": config.get("circuit_breaker_window", 60.0),
+            "cooldown": config.get("circuit_breaker_cooldown", 30.0),
+            "max_cooldown": config.get("circuit_breaker_max_cooldown", 300.0)
+        }
+
+    def available(self, provider: str) -> bool:
+        """Le moteur peut-il recevoir une requête ? (consultation sans effet, pour le routage)"""
+        with self._lock:
+            circuit = self._circuit(provider)
+            return self._refresh(circuit, time.monotonic()) != OPEN and not self._probe_pending(circuit)
+
+    def allow(self, provider: str) -> bool:
+        """
+        Autorise une requête juste avant son émission
+
+        En demi-ouverture, seule la première requête passe (sonde) ; les autres
+        sont refusées jusqu'à son issue.
+        """
+        with self._lock:
+            circuit = self._circuit(provider)
+            now = time.monotonic()
+            state = self._refresh(circuit, now)
+
+            if state == CLOSED:
+                return True
+
+            if state == HALF_OPEN and not self._probe_pending(circuit, now):
+                circuit.probe_started = now
+                return True
+
+            circuit.rejected += 1
+            return False
+
+    def record_success(self, provider: str):
+        """Réponse normale : la sonde referme le circuit"""
+        with self._lock:
+            circuit = self._circuit(provider)
+            if circuit.state == HALF_OPEN:
+                circuit.state = CLOSED
+                circuit.cooldown = self.cooldown
+                circuit.failures.clear()
+                circuit.probe_started = None
+
+    def record_failure(self, provider: str):
+        """Réponse en échec (ralentissement, page bloquée) : ouverture au-delà du seuil"""
+        with self._lock:
+            circuit = self._circuit(provider)
+            now = time.monotonic()
+
+            if circuit.state == HALF_OPEN:
+                # Sonde en échec : réouverture plus longue
+                circuit.cooldown = min(self.max_cooldown, circuit.cooldown * 2)
+                self._open(circuit, now)
+                return
+
+            if circuit.state == OPEN:
+                return
+
+            circuit.failures.append(now)
+            while circuit.failures and circuit.failures[0] < now - self.window:
+                circuit.failures.popleft()
+
+            if len(circuit.failures) >= self.threshold:
+                self._open(circuit, now)
+
+    def release(self, provider: str):
+        """Issue sans verdict (erreur sans rapport avec un blocage) : la sonde en cours est libérée"""
+        with self._lock:
+            circuit = self._circuit(provider)
+            if circuit.state == HALF_OPEN:
+                circuit.probe_started = None
+
+    def retry_in(self, provider: str) -> float:
+        """
+        Délai (secondes) avant de reconsulter le moteur
+
+        Circuit ouvert : fin du refroidissement. Sonde en cours : son issue est
+        inconnue, délai court (au plus jusqu'à l'expiration de la sonde).
+        """
+        with self._lock:
+            circuit = self._circuit(provider)
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                return max(0.0, circuit.opened_until - now)
+            if self._probe_pending(circuit, now):
+                return max(0.0, min(PROBE_POLL_INTERVAL, circuit.probe_started + circuit.cooldown - now))
+            return 0.0
+
+    def get_state(self, provider: str) -> str:
+        with self._lock:
+            return self._refresh(self._circuit(provider), time.monotonic())
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """État, ouvertures et requêtes refusées par moteur"""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                provider: {
+                    "state": self._refresh(circuit, now),
+                    "trips": circuit.trips,
+                    "rejected": circuit.rejected,
+                    "recent_failures": len(circuit.failures),
+                    "retry_in": round(max(0.0, circuit.opened_until - now), 1) if circuit.state == OPEN else 0.0
+                }
+                for provider, circuit in self._circuits.items()
+            }
+
+    def _circuit(self, provider: str) -> _ProviderCircuit:
+        circuit = self._circuits.get(provider)
+        if circuit is None:
+            circuit = self._circuits[provider] = _ProviderCircuit(self.cooldown)
+        return circuit
+
+    def _open(self, circuit: _ProviderCircuit, now: float):
+        circuit.state = OPEN
+        circuit.opened_until = now + circuit.cooldown
+        circuit.failures.clear()
+        circuit.probe_started = None
+        circuit.trips += 1
+
+    def _refresh(self, circuit: _ProviderCircuit, now: float) -> str:
+        """Passe en demi-ouverture une fois le refroidissement écoulé"""
+        if circuit.state == OPEN and now >= circuit.opened_until:
+            circuit.state = HALF_OPEN
+            circuit.probe_started = None
+        return circuit.state
+
+    def _probe_pending(self, circuit: _ProviderCircuit, now: Optional[float] = None) -> bool:
+        """Sonde en cours (une sonde sans issue, ex: annulation, expire après le refroidissement)"""
+        if circuit.state != HALF_OPEN or circuit.probe_started is None:
+            return False
+        return (now or time.monotonic()) - circuit.probe_started < circuit.cooldown
+
+
+# Instances partagées par processus, une par réglage
+_shared_breakers: Dict[Tuple, CircuitBreaker] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_circuit_breaker(config: Dict[str, Any]) -> CircuitBreaker:
+    """Retourne le disjoncteur du processus pour ces réglages (partagé entre agents et jobs)"""
+    settings = CircuitBreaker._settings(config)
+    key = tuple(settings.values())
+
+    with _shared_lock:
+        breaker = _shared_breakers.get(key)
+        if breaker is None:
+            breaker = _shared_breakers[key] = CircuitBreaker(**settings)
+
+    return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """État des disjoncteurs partagés du processus (GET /metrics) ; le plus dégradé l'emporte"""
+    with _shared_lock:
+        breakers = list(_shared_breakers.values())
+
+    severity = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+    merged: Dict[str, Dict[str, Any]] = {}
+    for breaker in breakers:
+        for provider, stats in breaker.get_stats().items():
+            target = merged.setdefault(provider, {"state": CLOSED, "trips": 0, "rejected": 0})
+            target["trips"] += stats["trips"]
+            target["rejected"] += stats["rejected"]
+            if severity[stats["state"]] > severity[target["state"]]:
+                target["state"] = stats["state"]
+
+    return merged
@@ -0,0 +1,126 @@
+# ============================================================================
+# JOURNAL D'ÉVÉNEMENTS STRUCTURÉ (JSON LINES)
+# mg-platform/mcp_server/tools/ai_agent/utils/event_log.py
+# ============================================================================
+
+"""
+Flux d'événements lisible par machine, en parallèle du log texte de session
+Responsabilités:
+- Un objet JSON par ligne : session, SIRET, ligne, étape, durée, résultat
+- Écriture hors du chemin critique : QueueHandler côté workers, QueueListener
+  (thread dédié) pour la sérialisation et les écritures disque
+- Fichier logs/ai_agent_<session>.events.jsonl, lisible en streaming sans regex
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Sérialise l'événement attaché à l'enregistrement (exécuté dans le thread du listener)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = {"ts": round(record.created, 3), "level": record.levelname}
+        event.update(getattr(record, "event", {"message": record.getMessage()}))
+        return json.dumps(event, ensure_ascii=False, default=str)
+
+
+class SessionEventLog:
+    """Journal JSON lines d'une session, alimenté via une file non bloquante"""
+
+    def __init__(self, session_id: str, log_dir: str = "logs"):
+        self.session_id = session_id
+        self.path = Path(log_dir) / f"ai_agent_{session_id}.events.jsonl"
+
+        self._logger: Optional[logging.Logger] = None
+        self._queue_handler: Optional[logging.handlers.QueueHandler] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._file_handler: Optional[logging.FileHandler] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], session_id: str) -> Optional["SessionEventLog"]:
+        """Construit le journal depuis la configuration (None si désactivé)"""
+        if not config.get("event_log_enabled", True):
+            return None
+
+        return cls(session_id, config.get("logs_dir", "logs"))
+
+    @property
+    def is_running(self) -> bool:
+        return self._listener is not None
+
+    def start(self):
+        """Ouvre le fichier (ajout, compatible reprise) et démarre le thread d'écriture"""
+        if self._listener is not None:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        events = queue.SimpleQueue()
+
+        self._file_handler = logging.FileHandler(self.path, mode='a', encoding='utf-8')
+        self._file_handler.setFormatter(JsonLinesFormatter())
+        self._listener = logging.handlers.QueueListener(events, self._file_handler)
+
+        self._queue_handler = logging.handlers.QueueHandler(events)
+        self._logger = logging.getLogger(f"ai_agent_events.{self.session_id}")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._logger.addHandler(self._queue_handler)
+
+        self._listener.start()
+
+    def emit(self, stage: str, outcome: Optional[str] = None, siret: Optional[str] = None,
+             row: Optional[int] = None, duration: Optional[float] = None, level: int = logging.INFO,
+             **fields):
+        """
+        Publie un événement (coût côté appelant : une mise en file)
+
+        Args:
+            stage: Étape (session_start, enrich, restore, phase, session_end...)
+            outcome: Résultat de l'étape (enriched, failed, error, cancelled, completed...)
+            siret: SIRET de l'entreprise concernée
+            row: Index 1-based de la ligne dans l'échantillon
+            duration: Durée de l'étape en secondes
+            **fields: Champs complémentaires (decision, quality_score, source...)
+        """
+        if self._logger is None:
+            return
+
+        event = {
+            "session_id": self.session_id,
+            "stage": stage,
+            "outcome": outcome,
+            "siret": siret,
+            "row": row,
+            "duration": round(duration, 3) if duration is not None else None,
+            **fields
+        }
+        self._logger.log(level, stage, extra={"event": event})
+
+    def stop(self):
+        """Vide la file, arrête le thread d'écriture et ferme le fichier (idempotent)"""
+        if self._listener is None:
+            return
+
+        self._logger.removeHandler(self._queue_handler)
+        self._listener.stop()
+        self._file_handler.close()
+
+        self._logger = None
+        self._queue_handler = None
+        self._listener = None
+        self._file_handler = None
+
+
+def read_events(path: str):
+    """Relit un journal d'événements en streaming (une ligne tronquée est ignorée)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
@@ -214,7 +214,8 @@ def cleanup_old_logs(log_dir: str, days_to_keep: int = 30):
         cutoff_timestamp = cutoff_date.timestamp()
         
         deleted_count = 0
-        for log_file in log_path.glob("ai_agent_*.log"):
+        log_files = [*log_path.glob("ai_agent_*.log"), *log_path.glob("ai_agent_*.events.jsonl")]
+        for log_file in log_files:
             if log_file.stat().st_mtime < cutoff_timestamp:
                 log_file.unlink()
                 deleted_count += 1
@@ -0,0 +1,243 @@
+# ============================================================================
+# LIMITEUR DE DÉBIT CENTRALISÉ
+# mg-platform/mcp_server/tools/ai_agent/utils/rate_limiter.py
+# ============================================================================
+
+"""
+Limiteur de débit partagé entre les workers d'enrichissement
+Responsabilités:
+- Seau à jetons par source (DuckDuckGo, Google, hôtes des sites candidats) :
+  débit = 1 / intervalle, capacité de rafale configurable
+- Réservation des créneaux thread-safe (GCRA : pas de thread de remplissage,
+  débit tenu exactement au plafond même avec de nombreux workers)
+- Attente hors verrou pour ne pas bloquer les autres sources
+- reserve() non bloquant pour les appelants asyncio
+- Backoff adaptatif sur HTTP 202 / 429 (Retry-After respecté), retour progressif
+  au débit nominal après des réponses normales
+- Statistiques par source : jetons servis, attentes, ralentissements
+- Instance partagée par processus : plusieurs jobs se partagent le même budget
+"""
+
+import time
+import threading
+import urllib.parse
+from typing import Dict, Any, Optional, Tuple
+
+HOST_PREFIX = "host:"
+
+
+class RateLimiter:
+    """Seaux à jetons par source avec réservation de créneaux et backoff adaptatif"""
+
+    def __init__(self, intervals: Dict[str, float], default_interval: float = 0.0,
+                 bursts: Optional[Dict[str, int]] = None, host_interval: float = 0.0,
+                 backoff_max: float = 8.0, backoff_recovery: float = 0.8):
+        """
+        Args:
+            intervals: Intervalle moyen (secondes) entre deux appels, par source
+            default_interval: Intervalle pour les sources non configurées
+            bursts: Capacité du seau par source (appels émis sans attente après une pause)
+            host_interval: Intervalle par hôte pour les sources "host:<domaine>"
+            backoff_max: Multiplicateur maximum de l'intervalle après ralentissements
+            backoff_recovery: Facteur appliqué au multiplicateur à chaque réponse normale
+        """
+        self.intervals = dict(intervals)
+        self.default_interval = default_interval
+        self.bursts = dict(bursts or {})
+        self.host_interval = host_interval
+        self.backoff_max = backoff_max
+        self.backoff_recovery = backoff_recovery
+
+        # Heure d'arrivée théorique (GCRA) et multiplicateur de backoff par source
+        self._tat: Dict[str, float] = {}
+        self._backoff: Dict[str, float] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RateLimiter":
+        """Construit le limiteur depuis la configuration de l'agent"""
+        return cls(**cls._settings(config))
+
+    @staticmethod
+    def _settings(config: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "intervals": config.get("rate_limits", {}),
+            "default_interval": config.get("rate_limit_default_interval", 0.0),
+            "bursts": config.get("rate_limit_bursts", {}),
+            "host_interval": config.get("rate_limit_host_interval", 0.0),
+            "backoff_max": config.get("rate_limit_backoff_max", 8.0),
+            "backoff_recovery": config.get("rate_limit_backoff_recovery", 0.8)
+        }
+
+    @staticmethod
+    def host_source(url: str) -> str:
+        """Source associée à l'hôte d'une URL (budget par site candidat)"""
+        return HOST_PREFIX + urllib.parse.urlsplit(url).netloc.lower()
+
+    def get_interval(self, source: str) -> Optional[float]:
+        """Intervalle nominal d'une source (hors backoff)"""
+        if source in self.intervals:
+            return self.intervals[source]
+        if source.startswith(HOST_PREFIX) and self.host_interval > 0:
+            return self.host_interval
+        return self.default_interval
+
+    def set_interval(self, source: str, interval: float):
+        """Intervalle propre à une source (ex: Crawl-delay annoncé par un site)"""
+        with self._lock:
+            self.intervals[source] = interval
+
+    def get_burst(self, source: str) -> int:
+        key = HOST_PREFIX if source.startswith(HOST_PREFIX) and source not in self.bursts else source
+        return max(1, int(self.bursts.get(key, 1)))
+
+    def reserve(self, source: str) -> float:
+        """
+        Prend un jeton d'une source sans attendre
+
+        Args:
+            source: Nom de la source (ex: "duckduckgo", "host:www.exemple.fr")
+
+        Returns:
+            Délai (secondes) à attendre avant d'émettre la requête
+        """
+        interval = self.get_interval(source)
+
+        if interval <= 0:
+            return 0.0
+
+        with self._lock:
+            effective = interval * self._backoff.get(source, 1.0)
+            # Tolérance de rafale : burst - 1 créneaux d'avance autorisés
+            tolerance = (self.get_burst(source) - 1) * effective
+
+            now = time.monotonic()
+            tat = max(now, self._tat.get(source, now))
+            wait = max(0.0, tat - tolerance - now)
+            self._tat[source] = tat + effective
+
+            stats = self._source_stats(source)
+            stats["acquired"] += 1
+            stats["delayed"] += 1 if wait > 0 else 0
+            stats["wait_seconds"] += wait
+
+        return wait
+
+    def acquire(self, source: str) -> float:
+        """
+        Prend un jeton d'une source et attend le créneau
+
+        Args:
+            source: Nom de la source (ex: "duckduckgo")
+
+        Returns:
+            Temps d'attente effectif en secondes
+        """
+        wait_time = self.reserve(source)
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+        return wait_time
+
+    def penalize(self, source: str, retry_after: Optional[float] = None):
+        """
+        Signale un ralentissement demandé par la source (HTTP 202 / 429)
+        Double l'intervalle (jusqu'à backoff_max) et vide le seau ; Retry-After
+        repousse le prochain créneau d'autant au minimum.
+        """
+        interval = self.get_interval(source) or 1.0
+
+        with self._lock:
+            factor = min(self.backoff_max, self._backoff.get(source, 1.0) * 2)
+            self._backoff[source] = factor
+
+            now = time.monotonic()
+            pause = max(interval * factor, retry_after or 0.0)
+            # Seau vidé : la tolérance de rafale ne permet pas de passer avant la pause
+            tolerance = (self.get_burst(source) - 1) * interval * factor
+            self._tat[source] = max(self._tat.get(source, now), now + pause + tolerance)
+            self._source_stats(source)["throttled"] += 1
+
+    def reward(self, source: str):
+        """Réponse normale : le multiplicateur de backoff revient vers 1"""
+        with self._lock:
+            factor = self._backoff.get(source)
+            if factor is None:
+                return
+            factor *= self.backoff_recovery
+            if factor <= 1.0:
+                del self._backoff[source]
+            else:
+                self._backoff[source] = factor
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Statistiques par source (hôtes agrégés sous "host:*")"""
+        with self._lock:
+            stats = {}
+            for source, values in self._stats.items():
+                key = HOST_PREFIX + "*" if source.startswith(HOST_PREFIX) else source
+                target = stats.setdefault(key, {"acquired": 0, "delayed": 0, "wait_seconds": 0.0,
+                                                "throttled": 0, "backoff_factor": 1.0})
+                for name, value in values.items():
+                    target[name] += value
+                target["backoff_factor"] = max(target["backoff_factor"], self._backoff.get(source, 1.0))
+
+            for target in stats.values():
+                target["wait_seconds"] = round(target["wait_seconds"], 3)
+                target["backoff_factor"] = round(target["backoff_factor"], 3)
+
+        return stats
+
+    def _source_stats(self, source: str) -> Dict[str, float]:
+        stats = self._stats.get(source)
+        if stats is None:
+            stats = self._stats[source] = {"acquired": 0, "delayed": 0, "wait_seconds": 0.0, "throttled": 0}
+        return stats
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Délai d'un en-tête Retry-After en secondes (forme date HTTP ignorée)"""
+    try:
+        return max(0.0, float(value)) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+# Instances partagées par processus, une par réglage de budgets
+_shared_limiters: Dict[Tuple, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(config: Dict[str, Any]) -> RateLimiter:
+    """Retourne le limiteur du processus pour ces budgets (partagé entre agents et jobs)"""
+    settings = RateLimiter._settings(config)
+    key = tuple(
+        tuple(sorted(value.items())) if isinstance(value, dict) else value
+        for value in settings.values()
+    )
+
+    with _shared_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            limiter = _shared_limiters[key] = RateLimiter(**settings)
+
+    return limiter
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Statistiques cumulées des limiteurs partagés du processus (GET /metrics)"""
+    with _shared_lock:
+        limiters = list(_shared_limiters.values())
+
+    merged: Dict[str, Dict[str, Any]] = {}
+    for limiter in limiters:
+        for source, stats in limiter.get_stats().items():
+            target = merged.setdefault(source, {"acquired": 0, "delayed": 0, "wait_seconds": 0.0,
+                                                "throttled": 0, "backoff_factor": 1.0})
+            for name in ("acquired", "delayed", "wait_seconds", "throttled"):
+                target[name] += stats[name]
+            target["backoff_factor"] = max(target["backoff_factor"], stats["backoff_factor"])
+
+    return merged
@@ -0,0 +1,97 @@
+# ============================================================================
+# CONTRÔLE D'EXÉCUTION (ANNULATION / PAUSE)
+# mg-platform/mcp_server/tools/ai_agent/utils/run_control.py
+# ============================================================================
+
+"""
+Jeton de contrôle coopératif d'un enrichissement
+Responsabilités:
+- Annulation demandée depuis un autre thread (endpoint, stream fermé)
+- Pause / reprise : les workers se bloquent au prochain point de contrôle
+- Points de contrôle entre entreprises et entre requêtes de recherche
+- Attentes interruptibles (une annulation réveille les workers en pause ou en sommeil)
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ..core.exceptions import EnrichmentCancelledError
+
+
+class RunControl:
+    """Jeton partagé entre l'appelant et les workers d'un enrichissement"""
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+        self.cancel_reason: Optional[str] = None
+        self.paused_seconds = 0.0
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def is_paused(self) -> bool:
+        return not self._running.is_set()
+
+    def cancel(self, reason: str = "Annulation demandée"):
+        """Demande l'arrêt (effectif au prochain point de contrôle)"""
+        if not self._cancelled.is_set():
+            self.cancel_reason = reason
+        self._cancelled.set()
+        # Débloquer les workers en pause pour qu'ils constatent l'annulation
+        self._running.set()
+
+    def pause(self):
+        """Suspend les workers au prochain point de contrôle"""
+        if not self._cancelled.is_set():
+            self._running.clear()
+
+    def resume(self):
+        """Reprend un enrichissement en pause"""
+        self._running.set()
+
+    def checkpoint(self):
+        """
+        Point de contrôle appelé par les workers
+        Bloque tant que l'exécution est en pause.
+
+        Raises:
+            EnrichmentCancelledError: si l'annulation a été demandée
+        """
+        if not self._running.is_set():
+            start = time.monotonic()
+            self._running.wait()
+            self.paused_seconds += time.monotonic() - start
+
+        if self._cancelled.is_set():
+            raise EnrichmentCancelledError(self.cancel_reason or "Annulation demandée")
+
+    async def acheckpoint(self, poll_interval: float = 0.5):
+        """Point de contrôle pour les coroutines (pause attendue sans bloquer la boucle)"""
+        if not self._running.is_set():
+            start = time.monotonic()
+            while not self._running.is_set():
+                await asyncio.sleep(poll_interval)
+            self.paused_seconds += time.monotonic() - start
+
+        self.checkpoint()
+
+    def sleep(self, seconds: float):
+        """Attente interruptible par une annulation, suivie d'un point de contrôle"""
+        if seconds > 0:
+            self._cancelled.wait(seconds)
+        self.checkpoint()
+
+    def get_state(self) -> Dict[str, Any]:
+        """État exposé dans le statut des jobs"""
+        return {
+            "cancelled": self.is_cancelled,
+            "paused": self.is_paused,
+            "cancel_reason": self.cancel_reason,
+            "paused_seconds": round(self.paused_seconds, 1)
+        }
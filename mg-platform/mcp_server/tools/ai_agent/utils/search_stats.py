@@ -0,0 +1,82 @@
+# ============================================================================
+# COMPTEURS DE RECHERCHE DU PROCESSUS
+# mg-platform/mcp_server/tools/ai_agent/utils/search_stats.py
+# ============================================================================
+
+"""
+Compteurs cumulés de toutes les sessions du processus (exposés par GET /metrics)
+Responsabilités:
+- Requêtes HTTP par moteur et code de statut (timeout / error pour les exceptions)
+- Attentes imposées par le limiteur de débit, par moteur
+- Consultations des caches (résultats de recherche, pages) par issue
+- Téléchargements de pages : issue (complète, tronquée, non HTML), octets lus et évités
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+class SearchStats:
+    """Compteurs thread-safe partagés par tous les moteurs de recherche"""
+
+    def __init__(self):
+        self.requests: Dict[Tuple[str, str], int] = {}
+        self.rate_limit_waits: Dict[str, Dict[str, float]] = {}
+        self.cache_lookups: Dict[Tuple[str, str], int] = {}
+        self.page_downloads: Dict[str, int] = {}
+        self.page_bytes = {"read": 0, "saved": 0}
+
+        self._lock = threading.Lock()
+
+    def record_request(self, engine: str, status: Any):
+        """Requête terminée (status : code HTTP, 'timeout' ou 'error')"""
+        key = (engine, str(status))
+        with self._lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+    def record_wait(self, engine: str, seconds: float):
+        """Délai imposé par le limiteur avant une requête (0 compté aussi)"""
+        with self._lock:
+            waits = self.rate_limit_waits.setdefault(engine, {"count": 0, "seconds": 0.0, "delayed": 0})
+            waits["count"] += 1
+            waits["seconds"] += seconds
+            waits["delayed"] += 1 if seconds > 0 else 0
+
+    def record_cache(self, cache: str, outcome: str):
+        """Consultation d'un cache (hit, miss, stale)"""
+        key = (cache, outcome)
+        with self._lock:
+            self.cache_lookups[key] = self.cache_lookups.get(key, 0) + 1
+
+    def record_download(self, outcome: str, bytes_read: int, bytes_saved: int = 0):
+        """Corps de page lu (complete, truncated, not_html) ; bytes_saved : estimation des octets non téléchargés"""
+        with self._lock:
+            self.page_downloads[outcome] = self.page_downloads.get(outcome, 0) + 1
+            self.page_bytes["read"] += bytes_read
+            self.page_bytes["saved"] += bytes_saved
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "rate_limit_waits": {engine: dict(waits) for engine, waits in self.rate_limit_waits.items()},
+                "cache_lookups": dict(self.cache_lookups),
+                "page_downloads": dict(self.page_downloads),
+                "page_bytes": dict(self.page_bytes)
+            }
+
+
+# Instance partagée par processus
+_search_stats: Optional[SearchStats] = None
+_stats_lock = threading.Lock()
+
+
+def get_search_stats() -> SearchStats:
+    """Retourne les compteurs de recherche du processus"""
+    global _search_stats
+
+    with _stats_lock:
+        if _search_stats is None:
+            _search_stats = SearchStats()
+
+    return _search_stats
@@ -0,0 +1,210 @@
+# ============================================================================
+# MÉTRIQUES STRUCTURÉES DE SESSION
+# mg-platform/mcp_server/tools/ai_agent/utils/session_metrics.py
+# ============================================================================
+
+"""
+Métriques d'une session d'enrichissement, tenues à jour pendant l'exécution
+Responsabilités:
+- Compteurs (traitées, enrichies, échecs, erreurs, reprises), décisions IA, sources
+- Durées par entreprise (total, min, max) et par phase (chargement, enrichissement...)
+- Histogrammes par étape du pipeline (StageTimer de la session)
+- Derniers échecs conservés en nombre borné (taille indépendante du volume de logs)
+- Index processus des sessions récentes (mémoire) adossé au store SQLite (persistance)
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Dict, Optional
+
+from .stage_timer import StageTimer
+
+DEFAULT_MAX_FAILURES = 20
+DEFAULT_MAX_SESSIONS = 50
+
+
+class SessionMetrics:
+    """Compteurs et durées d'une session (thread-safe, snapshot JSON-sérialisable)"""
+
+    def __init__(self, session_id: str, sample_size: int = 0, max_failures: int = DEFAULT_MAX_FAILURES,
+                 stage_timer: Optional[StageTimer] = None):
+        self.session_id = session_id
+        self.sample_size = sample_size
+        self.stage_timer = stage_timer
+        self.status = "running"
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.output_file: Optional[str] = None
+
+        self.counters = {
+            "total": 0, "processed": 0, "enriched": 0, "failed": 0,
+            "errors": 0, "restored": 0, "skipped": 0
+        }
+        self.decisions: Dict[str, int] = {}
+        self.sources: Dict[str, int] = {}
+        self.quality = {"count": 0, "sum": 0.0}
+        self.timings = {"count": 0, "total": 0.0, "min": None, "max": None}
+        self.phases: Dict[str, float] = {}
+        self.failures = deque(maxlen=max_failures)
+
+        self._lock = threading.Lock()
+
+    def set_total(self, total: int):
+        with self._lock:
+            self.counters["total"] = total
+
+    def record_phase(self, phase: str, seconds: float):
+        """Durée d'une phase (load, sample, enrich, save...)"""
+        with self._lock:
+            self.phases[phase] = round(self.phases.get(phase, 0.0) + seconds, 3)
+
+    def record_outcome(self, row_idx: int, company_name: str, outcome: Dict[str, Any], restored: bool = False):
+        """
+        Intègre le résultat d'une entreprise
+
+        Args:
+            row_idx: Index 1-based de la ligne
+            company_name: Nom affiché
+            outcome: Résultat du moteur (result, error, processing_time)
+            restored: Résultat repris d'un checkpoint ou du store (pas de travail réseau)
+        """
+        if outcome.get("cancelled"):
+            return
+
+        result = outcome.get("result") or {}
+        decision = result.get("ai_decision_log", {}).get("decision") or ("ERROR" if outcome.get("error") else "UNKNOWN")
+
+        with self._lock:
+            self.counters["processed"] += 1
+            self.decisions[decision] = self.decisions.get(decision, 0) + 1
+
+            if restored:
+                self.counters["restored"] += 1
+            else:
+                self._record_timing(outcome.get("processing_time", 0.0))
+
+            if outcome.get("error") is None and result.get("success"):
+                self.counters["enriched"] += 1
+                source = result.get("data", {}).get("search_source", "AI_Generated")
+                self.sources[source] = self.sources.get(source, 0) + 1
+                self.quality["count"] += 1
+                self.quality["sum"] += result.get("quality_score", 0)
+                return
+
+            self.counters["failed"] += 1
+            if outcome.get("error") is not None:
+                self.counters["errors"] += 1
+
+            self.failures.append({
+                "row": row_idx,
+                "company": str(company_name)[:60],
+                "decision": decision,
+                "reason": outcome.get("error") or result.get("error_reason", "Raison inconnue")
+            })
+
+    def finish(self, status: str, error: Optional[str] = None, output_file: Optional[str] = None, skipped: int = 0):
+        """Clôture la session (completed, cancelled, failed)"""
+        with self._lock:
+            self.status = status
+            self.error = error
+            self.output_file = output_file
+            self.counters["skipped"] = skipped
+            self.finished_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Vue figée des métriques (coût constant, indépendant du nombre d'entreprises)"""
+        with self._lock:
+            processed = self.counters["processed"]
+            end = self.finished_at or time.time()
+
+            return {
+                "session_id": self.session_id,
+                "status": self.status,
+                "sample_size": self.sample_size,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "duration_seconds": round(end - self.started_at, 1),
+                "counters": dict(self.counters),
+                "success_rate": round(self.counters["enriched"] / processed * 100, 1) if processed else 0.0,
+                "avg_quality_score": round(self.quality["sum"] / self.quality["count"], 1) if self.quality["count"] else 0.0,
+                "progress_percentage": round(processed / self.counters["total"] * 100, 1) if self.counters["total"] else 0.0,
+                "decisions": dict(self.decisions),
+                "sources": dict(self.sources),
+                "timings": {
+                    **self.timings,
+                    "total": round(self.timings["total"], 3),
+                    "avg": round(self.timings["total"] / self.timings["count"], 3) if self.timings["count"] else None
+                },
+                "phases": dict(self.phases),
+                "stages": self.stage_timer.summary() if self.stage_timer is not None else {},
+                "recent_failures": list(self.failures),
+                "output_file": self.output_file,
+                "error": self.error
+            }
+
+    def _record_timing(self, seconds: float):
+        seconds = round(seconds or 0.0, 3)
+        timings = self.timings
+        timings["count"] += 1
+        timings["total"] += seconds
+        timings["min"] = seconds if timings["min"] is None else min(timings["min"], seconds)
+        timings["max"] = seconds if timings["max"] is None else max(timings["max"], seconds)
+
+
+class SessionIndex:
+    """
+    Index des sessions : métriques vivantes en mémoire, snapshots persistés dans le store
+    par l'agent (démarrage, chaque lot écrit, fin de session)
+    Lookups en O(1) (dictionnaire puis clé primaire SQLite)
+    """
+
+    def __init__(self, store=None, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        self.store = store
+        self.max_sessions = max_sessions
+
+        self._sessions: "OrderedDict[str, SessionMetrics]" = OrderedDict()
+        self._latest: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def register(self, metrics: SessionMetrics):
+        """Rend une session visible dès son démarrage"""
+        with self._lock:
+            self._sessions[metrics.session_id] = metrics
+            self._sessions.move_to_end(metrics.session_id)
+            self._latest = metrics.session_id
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def get(self, session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Snapshot d'une session (la plus récente si session_id absent)"""
+        with self._lock:
+            metrics = self._sessions.get(session_id or self._latest or "")
+
+        if metrics is not None:
+            return metrics.snapshot()
+
+        if self.store is None:
+            return None
+
+        session = self.store.get_session(session_id)
+        return session.get("metrics") if session else None
+
+
+# Instance partagée par processus (agent et endpoints)
+_session_index: Optional[SessionIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_session_index(store=None) -> SessionIndex:
+    """Retourne l'index des sessions du processus (store attaché au premier appel qui le fournit)"""
+    global _session_index
+
+    with _index_lock:
+        if _session_index is None:
+            _session_index = SessionIndex(store)
+        elif _session_index.store is None and store is not None:
+            _session_index.store = store
+
+    return _session_index
@@ -0,0 +1,135 @@
+# ============================================================================
+# CHRONOMÉTRAGE PAR ÉTAPE
+# mg-platform/mcp_server/tools/ai_agent/utils/stage_timer.py
+# ============================================================================
+
+"""
+Spans légers pour mesurer où passe le temps d'un enrichissement
+Responsabilités:
+- Span par étape (DuckDuckGo, Google, attente limiteur, validation de page,
+  génération fallback, validation qualité, écriture Excel...)
+- Histogramme à buckets géométriques par étape (mémoire constante, thread-safe)
+- Percentiles p50 / p95 / p99 estimés, compteurs, erreurs, octets téléchargés
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# Bornes supérieures des buckets : 1 ms x 1.25^i (jusqu'à ~9 min, erreur relative <= 25 %)
+BUCKET_BOUNDS = tuple(0.001 * 1.25 ** i for i in range(60))
+
+
+class StageHistogram:
+    """Distribution des durées d'une étape"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.bytes = 0
+        self.buckets: List[int] = [0] * (len(BUCKET_BOUNDS) + 1)
+
+    def observe(self, seconds: float, bytes_downloaded: int = 0, error: bool = False):
+        self.count += 1
+        self.errors += 1 if error else 0
+        self.total += seconds
+        self.bytes += bytes_downloaded
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+        self.buckets[self._bucket_index(seconds)] += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Percentile estimé par interpolation linéaire dans le bucket du rang visé"""
+        if self.count == 0:
+            return None
+
+        rank = max(1, math.ceil(q * self.count))
+        cumulative = 0
+
+        for index, bucket_count in enumerate(self.buckets):
+            if cumulative + bucket_count >= rank:
+                lower = BUCKET_BOUNDS[index - 1] if index > 0 else 0.0
+                upper = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+                estimate = lower + (upper - lower) * (rank - cumulative) / bucket_count
+                return min(max(estimate, self.min), self.max)
+            cumulative += bucket_count
+
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total": round(self.total, 3),
+            "avg": round(self.total / self.count, 4) if self.count else None,
+            "min": round(self.min, 4) if self.min is not None else None,
+            "p50": self._rounded(self.percentile(0.50)),
+            "p95": self._rounded(self.percentile(0.95)),
+            "p99": self._rounded(self.percentile(0.99)),
+            "max": round(self.max, 4) if self.max is not None else None,
+            "bytes": self.bytes
+        }
+
+    @staticmethod
+    def _bucket_index(seconds: float) -> int:
+        if seconds <= BUCKET_BOUNDS[0]:
+            return 0
+        index = math.ceil(math.log(seconds / BUCKET_BOUNDS[0], 1.25))
+        # Arrondi flottant : garantir seconds <= borne du bucket retenu
+        while index < len(BUCKET_BOUNDS) and seconds > BUCKET_BOUNDS[index]:
+            index += 1
+        return min(index, len(BUCKET_BOUNDS))
+
+    @staticmethod
+    def _rounded(value: Optional[float]) -> Optional[float]:
+        return round(value, 4) if value is not None else None
+
+
+class StageTimer:
+    """Histogrammes par étape d'une session, alimentés par des spans"""
+
+    def __init__(self):
+        self._stages: Dict[str, StageHistogram] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[Dict[str, Any]]:
+        """
+        Mesure un bloc de code
+
+        Usage:
+            with timer.span("duckduckgo") as span:
+                response = requests.get(...)
+                span["bytes"] = len(response.content)
+
+        Une exception est comptée comme erreur de l'étape puis propagée.
+        """
+        span = {"bytes": 0}
+        start = time.perf_counter()
+        error = False
+
+        try:
+            yield span
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.record(stage, time.perf_counter() - start, span["bytes"], error)
+
+    def record(self, stage: str, seconds: float, bytes_downloaded: int = 0, error: bool = False):
+        """Enregistre une durée mesurée ailleurs (ex: processing_time du moteur)"""
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = StageHistogram()
+            histogram.observe(seconds, bytes_downloaded, error)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Statistiques par étape (count, total, p50 / p95 / p99, octets...)"""
+        with self._lock:
+            return {stage: histogram.summary() for stage, histogram in sorted(self._stages.items())}
@@ -69,6 +69,28 @@ def is_valid_siret(siret: str) -> bool:
     return True
 
 
+def normalize_siret(siret: Any) -> str:
+    """
+    SIRET sur 14 chiffres, zéros de tête restaurés ("" si absent)
+    
+    Accepte les valeurs numériques lues par pandas (12345678901234.0, 1234567890123)
+    et leur forme texte ("12345678901234.0") : la partie décimale nulle est retirée
+    avant le complément à 14 chiffres.
+    """
+    if siret is None:
+        return ""
+    
+    if isinstance(siret, float):
+        if siret != siret:  # NaN
+            return ""
+        if siret.is_integer():
+            siret = int(siret)
+    
+    text = re.sub(r'\.0*$', '', str(siret).strip())
+    digits = re.sub(r'\D', '', text)
+    return digits.zfill(14) if digits else ""
+
+
 def is_valid_email(email: str) -> bool:
     """Valide une adresse email"""
     
@@ -5,13 +5,26 @@
 import pandas as pd
 import numpy as np
 import os
+import re
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
-def analyze_complete_file(file_path: str = None) -> Dict[str, Any]:
+# Import relatif si chargé comme package, absolu si chargé par chemin de fichier
+try:
+    from .excel_cache import read_excel_cached
+except ImportError:
+    from mcp_server.tools.excel_cache import read_excel_cached
+
+# Version des résultats d'analyse (à incrémenter si leur contenu change : invalide les caches)
+ANALYZER_VERSION = "2.0"
+
+def analyze_complete_file(file_path: str = None, df: pd.DataFrame = None) -> Dict[str, Any]:
     """
     Analyseur simple qui fonctionne à coup sûr
     Analyse TOUTES les colonnes avec détection automatique basique
+    
+    Si df est fourni (DataFrame déjà nettoyé, ex: registre du serveur),
+    le fichier n'est ni relu ni renettoyé.
     """
     
     try:
@@ -22,11 +35,14 @@ def analyze_complete_file(file_path: str = None) -> Dict[str, Any]:
         if not file_path:
             return {"error": "Aucun fichier Excel trouvé dans data/raw/"}
         
-        # 2. Lire le fichier
-        df = read_excel_safe(file_path)
-        
-        # 3. Nettoyer les données
-        df_clean = clean_dataframe(df)
+        if df is not None:
+            df_clean = df
+        else:
+            # 2. Lire le fichier
+            df = read_excel_safe(file_path)
+            
+            # 3. Nettoyer les données
+            df_clean = clean_dataframe(df)
         
         print(f"📊 Analyse: {len(df_clean)} lignes × {len(df_clean.columns)} colonnes")
         
@@ -95,7 +111,11 @@ def find_excel_file() -> Optional[str]:
         return None
 
 def read_excel_safe(file_path: str) -> pd.DataFrame:
-    """Lecture sécurisée du fichier Excel"""
+    """Lecture sécurisée du fichier Excel (via le cache colonnaire)"""
+    return read_excel_cached(file_path, reader=_read_excel_uncached)
+
+def _read_excel_uncached(file_path: str) -> pd.DataFrame:
+    """Lecture Excel directe avec fallback de moteur"""
     try:
         df = pd.read_excel(file_path, engine='openpyxl')
         return df
@@ -120,8 +140,115 @@ def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     
     return df_clean
 
+# Patterns standards de valeurs manquantes
+STANDARD_MISSING_PATTERNS = ['', 'nan', 'NaN', 'NULL', 'null', 'N/A', 'n/a', '-', '--']
+SPECIFIC_MISSING_WORDS = ['INFORMATION', 'NON', 'DIFFUSIBLE', 'RENSEIGNE']
+
+# Séparateur absent des données : les regex de contenu ne peuvent pas le traverser
+_CONTENT_SEPARATOR = "\x00"
+_NUMBER_RE = re.compile(r'\d')
+_URL_RE = re.compile(r'http|www\.')
+
 def analyze_column(series: pd.Series, col_name: str) -> Dict[str, Any]:
-    """Analyse complète d'une colonne"""
+    """Analyse complète d'une colonne (profil vectorisé en une passe)"""
+    
+    profile = profile_column(series)
+    missing_count = profile["missing_count"]
+    content_analysis = profile["content_analysis"]
+    
+    total_count = len(series)
+    present_count = total_count - missing_count
+    completion_rate = (present_count / total_count * 100) if total_count > 0 else 0
+    
+    # Détecter le type de colonne
+    column_type = detect_column_type(col_name, series, content_analysis)
+    
+    # Évaluer le potentiel d'enrichissement
+    enrichment_potential = assess_enrichment_potential(col_name, column_type, missing_count)
+    
+    return {
+        "completion_rate": round(completion_rate, 1),
+        "missing_count": missing_count,
+        "present_count": present_count,
+        "missing_patterns_detected": profile["missing_patterns"],
+        "content_analysis": content_analysis,
+        "detected_type": column_type,
+        "enrichment_potential": enrichment_potential
+    }
+
+def profile_column(series: pd.Series) -> Dict[str, Any]:
+    """
+    Profil d'une colonne à partir d'une seule normalisation texte
+    
+    La colonne est convertie/strippée une fois, puis tout est dérivé de
+    value_counts() (patterns manquants, comptes, uniques, longueurs, mode)
+    et des seules valeurs distinctes (recherche de chiffres, emails, URLs).
+    """
+    
+    text = series.astype(str).str.strip()
+    value_counts = text.value_counts()
+    total = len(text)
+    
+    # Patterns manquants : standards présents + valeurs fréquentes type "NON-DIFFUSIBLE"
+    missing_patterns = {p for p in STANDARD_MISSING_PATTERNS if p in value_counts.index}
+    for value, count in value_counts.head(10).items():
+        if count > total * 0.05 and any(word in value.upper() for word in SPECIFIC_MISSING_WORDS):
+            missing_patterns.add(value)
+    
+    missing_patterns = list(missing_patterns)
+    present_counts = value_counts.drop(missing_patterns)
+    missing_count = int(total - present_counts.sum())
+    
+    return {
+        "missing_patterns": missing_patterns,
+        "missing_count": missing_count,
+        "content_analysis": _content_from_counts(series, text, present_counts, missing_patterns)
+    }
+
+def _content_from_counts(series: pd.Series, text: pd.Series, present_counts: pd.Series,
+                         missing_patterns: List[str]) -> Dict[str, Any]:
+    """Analyse de contenu calculée sur les valeurs distinctes et leurs effectifs"""
+    
+    if present_counts.empty:
+        return {
+            "unique_values": 0,
+            "avg_length": 0,
+            "sample_values": [],
+            "contains_numbers": False,
+            "contains_emails": False,
+            "contains_urls": False
+        }
+    
+    # Valeurs distinctes en tableau numpy (évite l'itération élément par élément)
+    values = present_counts.index.to_numpy(dtype=object)
+    counts = present_counts.to_numpy()
+    
+    # Longueur moyenne pondérée par les effectifs
+    lengths = present_counts.index.str.len().to_numpy()
+    avg_length = float((lengths * counts).sum() / counts.sum())
+    
+    # Mode : effectif maximal, plus petite valeur en cas d'égalité
+    top_count = counts.max()
+    most_common = min(values[counts == top_count])
+    
+    # Premières valeurs non manquantes dans l'ordre du fichier
+    sample_values = series[~text.isin(missing_patterns)].head(3).astype(str).tolist()
+    
+    # Une seule chaîne pour les recherches de contenu
+    joined = _CONTENT_SEPARATOR.join(values)
+    
+    return {
+        "unique_values": int(len(present_counts)),
+        "avg_length": round(avg_length, 1),
+        "sample_values": sample_values,
+        "contains_numbers": _NUMBER_RE.search(joined) is not None,
+        "contains_emails": "@" in joined,
+        "contains_urls": _URL_RE.search(joined) is not None,
+        "most_common": most_common
+    }
+
+def analyze_column_legacy(series: pd.Series, col_name: str) -> Dict[str, Any]:
+    """Analyse d'une colonne en plusieurs passes (référence pour le benchmark du profileur)"""
     
     # Détecter les valeurs manquantes
     missing_patterns = detect_missing_patterns(series)
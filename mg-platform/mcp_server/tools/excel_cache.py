@@ -0,0 +1,141 @@
+# ============================================================================
+# CACHE COLONNAIRE DES FICHIERS EXCEL - mcp_server/tools/excel_cache.py
+# ============================================================================
+
+"""
+Cache colonnaire (Feather/Arrow) des fichiers Excel bruts
+- Empreinte du fichier : chemin + mtime + taille + hash du contenu
+- 1ère lecture : parsing openpyxl puis écriture dans .excel_cache/ à côté du fichier
+- Lectures suivantes : Feather mappé en mémoire (pickle si pyarrow absent)
+- Invalidation automatique : toute modification de l'Excel change l'empreinte
+"""
+
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Callable, Optional
+
+import pandas as pd
+
+# Import conditionnel : Feather nécessite pyarrow
+try:
+    import pyarrow.feather as feather
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+CACHE_DIR_NAME = ".excel_cache"
+CACHE_SUFFIXES = (".feather", ".pkl")
+
+
+def compute_file_fingerprint(file_path: str) -> str:
+    """Empreinte stable d'un fichier : chemin absolu, mtime, taille et hash SHA-1"""
+    path = Path(file_path).resolve()
+    stat = path.stat()
+
+    content_hash = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            content_hash.update(chunk)
+
+    fingerprint = hashlib.sha1(
+        f"{path}|{stat.st_mtime_ns}|{stat.st_size}|{content_hash.hexdigest()}".encode("utf-8")
+    )
+    return fingerprint.hexdigest()
+
+
+def _default_excel_reader(file_path: str) -> pd.DataFrame:
+    """Lecture Excel standard du projet"""
+    return pd.read_excel(file_path, engine='openpyxl')
+
+
+def read_excel_cached(file_path: str,
+                      reader: Optional[Callable[[str], pd.DataFrame]] = None,
+                      fingerprint: Optional[str] = None) -> pd.DataFrame:
+    """
+    Lit un fichier Excel via le cache colonnaire
+
+    Args:
+        file_path: Chemin du fichier Excel
+        reader: Fonction de lecture Excel à utiliser en cas de cache absent
+        fingerprint: Empreinte déjà calculée (évite un second hash)
+
+    Returns:
+        DataFrame brut (identique à la lecture Excel)
+    """
+    reader = reader or _default_excel_reader
+    fingerprint = fingerprint or compute_file_fingerprint(file_path)
+
+    cache_dir = Path(file_path).parent / CACHE_DIR_NAME
+    stem = Path(file_path).stem
+
+    cached = _find_cache_file(cache_dir, stem, fingerprint)
+    if cached is not None:
+        try:
+            return _read_cache_file(cached)
+        except Exception:
+            # Cache corrompu : on le reconstruit
+            cached.unlink(missing_ok=True)
+
+    df = reader(file_path)
+
+    try:
+        _write_cache_file(df, cache_dir, stem, fingerprint)
+    except Exception as e:
+        print(f"⚠️ Cache colonnaire non écrit: {e}")
+
+    return df
+
+
+def _find_cache_file(cache_dir: Path, stem: str, fingerprint: str) -> Optional[Path]:
+    """Cherche le fichier de cache correspondant à l'empreinte"""
+    for suffix in CACHE_SUFFIXES:
+        candidate = cache_dir / f"{stem}.{fingerprint[:16]}{suffix}"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _cache_files(cache_dir: Path, stem: str):
+    """Fichiers de cache d'un fichier Excel : <stem>.<empreinte 16 hex>.feather|.pkl (+ .tmp)"""
+    suffixes = "|".join(re.escape(suffix) for suffix in CACHE_SUFFIXES)
+    pattern = re.compile(rf"{re.escape(stem)}\.[0-9a-f]{{16}}(?:{suffixes})(?:\.tmp)?")
+    return [path for path in cache_dir.iterdir() if pattern.fullmatch(path.name)]
+
+
+def _read_cache_file(cache_file: Path) -> pd.DataFrame:
+    """Lit un fichier de cache (Feather mappé en mémoire ou pickle)"""
+    if cache_file.suffix == ".feather":
+        if not ARROW_AVAILABLE:
+            raise RuntimeError("pyarrow requis pour lire le cache Feather")
+        return feather.read_table(str(cache_file), memory_map=True).to_pandas()
+    return pd.read_pickle(cache_file)
+
+
+def _write_cache_file(df: pd.DataFrame, cache_dir: Path, stem: str, fingerprint: str):
+    """Écrit le cache et supprime les versions périmées du même fichier"""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # Nettoyer les anciennes empreintes de ce fichier (et seulement de lui :
+    # "foo" ne doit pas emporter le cache de "foo.bar.xlsx")
+    for stale in _cache_files(cache_dir, stem):
+        stale.unlink(missing_ok=True)
+
+    base = cache_dir / f"{stem}.{fingerprint[:16]}"
+    tmp_path = None
+
+    if ARROW_AVAILABLE:
+        try:
+            tmp_path = base.with_name(base.name + ".feather.tmp")
+            df.to_feather(tmp_path)
+            os.replace(tmp_path, base.with_name(base.name + ".feather"))
+            return
+        except Exception:
+            # Colonnes à types mixtes non supportées par Arrow : repli pickle
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+    tmp_path = base.with_name(base.name + ".pkl.tmp")
+    df.to_pickle(tmp_path)
+    os.replace(tmp_path, base.with_name(base.name + ".pkl"))
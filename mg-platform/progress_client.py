@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Client Python SIMPLE pour lancer l'Agent IA et voir le résultat
+Client Python SIMPLE pour lancer l'Agent IA (job en arrière-plan) et voir le résultat
 Usage: python progress_client.py --sample_size 5
 """
 
@@ -10,7 +10,7 @@ import time
 import argparse
 import sys
 
-def launch_ai_enrichment_client(base_url="http://localhost:8080", sample_size=10):
+def launch_ai_enrichment_client(base_url="http://localhost:8080", sample_size=10, poll_interval=2.0):
     """
     Lance l'enrichissement IA et affiche le résultat final
     SIMPLE ET FONCTIONNEL
@@ -18,25 +18,40 @@ def launch_ai_enrichment_client(base_url="http://localhost:8080", sample_size=10
     
     print(f"🚀 Lancement enrichissement IA - {sample_size} entreprises")
     print("📊 Traitement de vos données réelles")
-    print("⏳ Patience... (regardez le terminal du serveur pour la progression)")
+    print("⏳ Le serveur traite en arrière-plan, suivi par interrogation du job")
     print("=" * 60)
     
     url = f"{base_url}/ai-agent/enrich"
     params = {"sample_size": sample_size, "test_mode": True}
     
     start_time = time.time()
+    job_id = None
     
     try:
-        print("🔄 Envoi de la requête...")
+        print("🔄 Soumission du job...")
         
-        # Faire la requête (peut prendre du temps)
-        response = requests.post(url, params=params, timeout=600)  # 10 min max
+        # Soumission : le serveur répond immédiatement avec un job_id
+        response = requests.post(url, params=params, timeout=30)
+        
+        if response.status_code not in (200, 202) or "job_id" not in response.json():
+            print(f"❌ Erreur HTTP: {response.status_code}")
+            try:
+                error_data = response.json()
+                print(f"   Détail: {error_data.get('error', 'Erreur inconnue')}")
+            except:
+                print(f"   Réponse: {response.text}")
+            return
+        
+        job_id = response.json()["job_id"]
+        print(f"📋 Job {job_id} soumis")
+        
+        job = wait_for_job(base_url, job_id, poll_interval)
         
         end_time = time.time()
         duration = end_time - start_time
         
-        if response.status_code == 200:
-            result = response.json()
+        if job["status"] == "succeeded":
+            result = job["result"]
             
             print(f"\n🎉 Enrichissement terminé en {duration:.1f}s !")
             print("=" * 60)
@@ -80,16 +95,12 @@ def launch_ai_enrichment_client(base_url="http://localhost:8080", sample_size=10
             print("✅ Succès ! Votre fichier Excel enrichi est prêt.")
             
         else:
-            print(f"❌ Erreur HTTP: {response.status_code}")
-            try:
-                error_data = response.json()
-                print(f"   Détail: {error_data.get('error', 'Erreur inconnue')}")
-            except:
-                print(f"   Réponse: {response.text}")
+            print(f"\n❌ Job {job_id} {job['status']}: {job.get('error') or 'Erreur inconnue'}")
     
     except requests.exceptions.Timeout:
-        print("\n⏰ Timeout - L'enrichissement prend plus de 10 minutes")
-        print("   Vérifiez le terminal du serveur pour voir s'il continue")
+        print("\n⏰ Timeout - Le serveur ne répond pas")
+        if job_id:
+            print(f"   Le job continue côté serveur: GET {base_url}/jobs/{job_id}")
     
     except requests.exceptions.ConnectionError:
         print("❌ Impossible de se connecter au serveur")
@@ -97,10 +108,39 @@ def launch_ai_enrichment_client(base_url="http://localhost:8080", sample_size=10
     
     except KeyboardInterrupt:
         print("\n\n⏹️  Arrêt demandé par l'utilisateur")
+        if job_id:
+            print(f"   Le job continue côté serveur: GET {base_url}/jobs/{job_id}")
     
     except Exception as e:
         print(f"\n❌ Erreur: {str(e)}")
 
+def wait_for_job(base_url, job_id, poll_interval=2.0):
+    """Interroge GET /jobs/{id} jusqu'à un état final en affichant la progression"""
+    last_message = None
+    
+    while True:
+        response = requests.get(f"{base_url}/jobs/{job_id}", params={"include_result": False}, timeout=10)
+        response.raise_for_status()
+        job = response.json()
+        
+        progress = job.get("progress", {})
+        message = progress.get("last_message")
+        if message and message != last_message:
+            percentage = progress.get("percentage")
+            prefix = f"[{percentage:5.1f}%] " if percentage is not None else ""
+            print(f"   {prefix}{message}")
+            last_message = message
+        
+        if job["status"] in ("succeeded", "failed", "cancelled"):
+            break
+        
+        time.sleep(poll_interval)
+    
+    # Résultat complet une seule fois, à la fin
+    response = requests.get(f"{base_url}/jobs/{job_id}", timeout=30)
+    response.raise_for_status()
+    return response.json()
+
 def test_connection(base_url="http://localhost:8080"):
     """Test de connexion basique"""
     try:
@@ -123,6 +163,7 @@ if __name__ == "__main__":
     parser.add_argument("--sample_size", type=int, default=5, help="Nombre d'entreprises à traiter")
     parser.add_argument("--url", default="http://localhost:8080", help="URL du serveur")
     parser.add_argument("--test", action="store_true", help="Test de connexion seulement")
+    parser.add_argument("--poll", type=float, default=2.0, help="Intervalle de suivi du job (secondes)")
     
     args = parser.parse_args()
     
@@ -132,7 +173,7 @@ if __name__ == "__main__":
         print("🧪 Test de connexion...")
         if test_connection(args.url):
             print("🚀 Connexion OK, lancement enrichissement...\n")
-            launch_ai_enrichment_client(args.url, args.sample_size)
+            launch_ai_enrichment_client(args.url, args.sample_size, args.poll)
         else:
             print("💡 Démarrez le serveur avec :")
             print("   python mcp_server/main.py")
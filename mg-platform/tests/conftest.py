@@ -0,0 +1,11 @@
+"""
+Configuration pytest des tests unitaires
+À exécuter depuis mg-platform/ : python -m pytest -q tests
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le projet au Python path (comme les scripts de test existants)
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
@@ -0,0 +1,213 @@
+"""Tests du disjoncteur par moteur : transitions fermé / ouvert / demi-ouvert et verdicts des réponses"""
+
+from pathlib import Path
+
+import pytest
+
+from mcp_server.tools.ai_agent.core.config import get_config
+from mcp_server.tools.ai_agent.search import web_search
+from mcp_server.tools.ai_agent.search.web_search import WebSearchEngine
+from mcp_server.tools.ai_agent.utils import circuit_breaker
+from mcp_server.tools.ai_agent.utils.circuit_breaker import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+
+SERP_FIXTURE = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures" / "serp" / "duckduckgo_garage_torcy.html"
+
+
+class FakeClock:
+    """Horloge monotone pilotée par le test"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", fake)
+    return fake
+
+
+def open_breaker(breaker, provider="duckduckgo"):
+    for _ in range(breaker.threshold):
+        breaker.record_failure(provider)
+
+
+def test_opens_once_failures_reach_the_threshold(clock):
+    breaker = CircuitBreaker(threshold=3, window=60, cooldown=30)
+
+    breaker.record_failure("duckduckgo")
+    breaker.record_failure("duckduckgo")
+    assert breaker.get_state("duckduckgo") == CLOSED
+    assert breaker.allow("duckduckgo")
+
+    breaker.record_failure("duckduckgo")
+    assert breaker.get_state("duckduckgo") == OPEN
+    assert not breaker.available("duckduckgo")
+    assert not breaker.allow("duckduckgo")
+    assert breaker.retry_in("duckduckgo") == pytest.approx(30.0)
+
+    stats = breaker.get_stats()["duckduckgo"]
+    assert stats["trips"] == 1
+    assert stats["rejected"] == 1
+
+
+def test_failures_outside_the_window_are_forgotten(clock):
+    breaker = CircuitBreaker(threshold=2, window=10, cooldown=30)
+
+    breaker.record_failure("duckduckgo")
+    clock.advance(11)
+    breaker.record_failure("duckduckgo")
+
+    assert breaker.get_state("duckduckgo") == CLOSED
+
+
+def test_providers_are_independent(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=30)
+
+    breaker.record_failure("duckduckgo")
+
+    assert breaker.get_state("duckduckgo") == OPEN
+    assert breaker.allow("google")
+
+
+def test_half_open_after_cooldown_lets_a_single_probe_through(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=30)
+    open_breaker(breaker)
+
+    clock.advance(30)
+    assert breaker.get_state("duckduckgo") == HALF_OPEN
+    assert breaker.available("duckduckgo")
+
+    assert breaker.allow("duckduckgo")
+    # Sonde en cours : les autres requêtes sont refusées
+    assert not breaker.allow("duckduckgo")
+    assert not breaker.available("duckduckgo")
+    assert 0 < breaker.retry_in("duckduckgo") <= circuit_breaker.PROBE_POLL_INTERVAL
+
+
+def test_successful_probe_closes_and_resets_the_cooldown(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=30, max_cooldown=300)
+    open_breaker(breaker)
+    clock.advance(30)
+    assert breaker.allow("duckduckgo")
+    breaker.record_failure("duckduckgo")
+    clock.advance(60)
+    assert breaker.allow("duckduckgo")
+
+    breaker.record_success("duckduckgo")
+
+    assert breaker.get_state("duckduckgo") == CLOSED
+    assert breaker.allow("duckduckgo")
+    open_breaker(breaker)
+    assert breaker.retry_in("duckduckgo") == pytest.approx(30.0)
+
+
+def test_failed_probe_reopens_with_a_doubled_capped_cooldown(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=30, max_cooldown=100)
+    open_breaker(breaker)
+
+    for expected in (60.0, 100.0, 100.0):
+        clock.advance(breaker.retry_in("duckduckgo"))
+        assert breaker.allow("duckduckgo")
+        breaker.record_failure("duckduckgo")
+
+        assert breaker.get_state("duckduckgo") == OPEN
+        assert breaker.retry_in("duckduckgo") == pytest.approx(expected)
+
+    assert breaker.get_stats()["duckduckgo"]["trips"] == 4
+
+
+def test_release_frees_the_probe_without_a_verdict(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=30)
+    open_breaker(breaker)
+    clock.advance(30)
+    assert breaker.allow("duckduckgo")
+
+    breaker.release("duckduckgo")
+
+    assert breaker.get_state("duckduckgo") == HALF_OPEN
+    assert breaker.allow("duckduckgo")
+
+
+def test_abandoned_probe_expires_after_the_cooldown(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=30)
+    open_breaker(breaker)
+    clock.advance(30)
+    assert breaker.allow("duckduckgo")
+
+    clock.advance(30)
+
+    assert breaker.allow("duckduckgo")
+
+
+def test_success_while_closed_keeps_counting_failures(clock):
+    breaker = CircuitBreaker(threshold=2, window=60, cooldown=30)
+
+    breaker.record_failure("duckduckgo")
+    breaker.record_success("duckduckgo")
+    breaker.record_failure("duckduckgo")
+
+    assert breaker.get_state("duckduckgo") == OPEN
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b""):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+
+
+@pytest.fixture
+def search_engine(monkeypatch):
+    """Moteur de recherche sans attente ni cache, avec un disjoncteur propre au test"""
+    config = get_config({
+        "rate_limits": {"duckduckgo": 0, "google": 0},
+        "search_cache_enabled": False,
+        "rate_limit_backoff_max": 1
+    })
+    engine = WebSearchEngine(config)
+    engine.circuit_breaker = CircuitBreaker(threshold=2, cooldown=30)
+
+    def serve(status_code, content=b""):
+        monkeypatch.setattr(web_search.requests, "get", lambda *args, **kwargs: FakeResponse(status_code, content))
+
+    return engine, serve
+
+
+@pytest.mark.parametrize("status_code, content, expected", [
+    (404, b"", CLOSED),
+    (500, b"", CLOSED),
+    (202, b"", OPEN),
+    (200, b"<html><body>Please complete the captcha</body></html>", OPEN),
+    (200, None, CLOSED)
+])
+def test_search_verdict_comes_from_the_serp(search_engine, status_code, content, expected):
+    engine, serve = search_engine
+    serve(status_code, SERP_FIXTURE.read_bytes() if content is None else content)
+
+    for _ in range(3):
+        engine._search_duckduckgo("garage du centre torcy")
+
+    assert engine.circuit_breaker.get_state("duckduckgo") == expected
+
+
+def test_recognized_serp_closes_a_half_open_breaker(search_engine, monkeypatch):
+    engine, serve = search_engine
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    open_breaker(engine.circuit_breaker)
+    clock.advance(30)
+
+    serve(404)
+    assert engine._search_duckduckgo("garage du centre torcy") == []
+    assert engine.circuit_breaker.get_state("duckduckgo") == HALF_OPEN
+
+    serve(200, SERP_FIXTURE.read_bytes())
+    assert engine._search_duckduckgo("garage du centre torcy")
+    assert engine.circuit_breaker.get_state("duckduckgo") == CLOSED
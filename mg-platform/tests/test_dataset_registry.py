@@ -0,0 +1,77 @@
+"""Tests du registre des datasets partagés (DatasetRegistry.get)"""
+
+import threading
+
+import pandas as pd
+import pytest
+
+from mcp_server.dataset_registry import DatasetRegistry
+
+
+def write_excel(path, rows=3, commune="Torcy"):
+    pd.DataFrame({
+        "SIRET": [f"1234567890{i:04d}" for i in range(rows)],
+        "Nom courant/Dénomination": [f"Entreprise {i}" for i in range(rows)],
+        "Commune": [commune] * rows
+    }).to_excel(path, index=False, engine="openpyxl")
+    return str(path)
+
+
+def test_get_loads_once_then_serves_the_shared_entry(tmp_path):
+    registry = DatasetRegistry()
+    file_path = write_excel(tmp_path / "entreprises.xlsx")
+
+    first = registry.get(file_path)
+    second = registry.get(file_path)
+
+    assert second is first
+    assert first["df"].shape == (3, 3)
+    assert first["context"]["total_companies"] == 3
+    assert registry.stats["loads"] == 1
+    assert registry.stats["misses"] == 1
+    assert registry.stats["hits"] == 1
+
+
+def test_get_reloads_a_modified_file_and_drops_the_old_version(tmp_path):
+    registry = DatasetRegistry()
+    file_path = write_excel(tmp_path / "entreprises.xlsx")
+    first = registry.get(file_path)
+
+    write_excel(tmp_path / "entreprises.xlsx", rows=5, commune="Lagny-sur-Marne")
+    second = registry.get(file_path)
+
+    assert second["fingerprint"] != first["fingerprint"]
+    assert len(second["df"]) == 5
+    assert registry.stats["loads"] == 2
+    assert [dataset["fingerprint"] for dataset in registry.get_stats()["datasets"]] == [second["fingerprint"]]
+
+
+def test_concurrent_gets_share_a_single_load(tmp_path):
+    registry = DatasetRegistry()
+    file_path = write_excel(tmp_path / "entreprises.xlsx")
+    entries = []
+
+    threads = [threading.Thread(target=lambda: entries.append(registry.get(file_path))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert registry.stats["loads"] == 1
+    assert all(entry is entries[0] for entry in entries)
+
+
+def test_get_evicts_least_recently_used_over_budget(tmp_path):
+    registry = DatasetRegistry(memory_budget_mb=0)
+    first = registry.get(write_excel(tmp_path / "a.xlsx"))
+    second = registry.get(write_excel(tmp_path / "b.xlsx"))
+
+    fingerprints = [dataset["fingerprint"] for dataset in registry.get_stats()["datasets"]]
+    assert fingerprints == [second["fingerprint"]]
+    assert first["fingerprint"] not in fingerprints
+    assert registry.stats["evictions"] == 1
+
+
+def test_get_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        DatasetRegistry().get(str(tmp_path / "absent.xlsx"))
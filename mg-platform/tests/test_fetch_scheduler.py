@@ -0,0 +1,212 @@
+"""Tests de l'ordonnanceur de téléchargements : créneaux par hôte, priorités, annulation et robots.txt"""
+
+import threading
+import time
+
+import pytest
+
+from mcp_server.tools.ai_agent.core.exceptions import EnrichmentCancelledError
+from mcp_server.tools.ai_agent.search import fetch_scheduler
+from mcp_server.tools.ai_agent.search.fetch_scheduler import FetchScheduler
+from mcp_server.tools.ai_agent.utils.run_control import RunControl
+
+TIMEOUT = 5.0
+
+
+@pytest.fixture(autouse=True)
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(fetch_scheduler, "WAIT_POLL_INTERVAL", 0.01)
+
+
+def wait_until(condition, timeout=TIMEOUT):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition non atteinte"
+        time.sleep(0.005)
+
+
+def start_acquire(scheduler, host, granted, priority=(), run_control=None):
+    """Demande un créneau dans un thread ; l'hôte est ajouté à granted une fois servi"""
+    errors = []
+
+    def worker():
+        try:
+            scheduler.acquire(host, priority, run_control)
+        except BaseException as e:
+            errors.append(e)
+            return
+        granted.append(host)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    return thread, errors
+
+
+def test_per_host_limit_queues_the_extra_request():
+    scheduler = FetchScheduler(max_in_flight=16, max_per_host=2)
+    granted = []
+
+    scheduler.acquire("garage-torcy.fr")
+    scheduler.acquire("garage-torcy.fr")
+    thread, _ = start_acquire(scheduler, "garage-torcy.fr", granted)
+    wait_until(lambda: scheduler.get_stats()["queued"] == 1)
+
+    # L'hôte saturé ne bloque pas les autres
+    scheduler.acquire("boulangerie-lagny.fr")
+    assert granted == []
+    stats = scheduler.get_stats()
+    assert stats["in_flight"] == 3
+    assert stats["hosts_in_flight"] == 2
+
+    scheduler.release("garage-torcy.fr")
+    thread.join(TIMEOUT)
+
+    assert granted == ["garage-torcy.fr"]
+    stats = scheduler.get_stats()
+    assert stats["in_flight"] == 3
+    assert stats["queued"] == 0
+    assert stats["granted"] == 4
+
+
+def test_per_host_limit_holds_under_concurrency():
+    scheduler = FetchScheduler(max_in_flight=16, max_per_host=2)
+    lock = threading.Lock()
+    current = {"garage-torcy.fr": 0, "boulangerie-lagny.fr": 0}
+    peak = dict(current)
+
+    def worker(url):
+        host = fetch_scheduler.host_of(url)
+        with scheduler.slot(url):
+            with lock:
+                current[host] += 1
+                peak[host] = max(peak[host], current[host])
+            time.sleep(0.01)
+            with lock:
+                current[host] -= 1
+
+    threads = [
+        threading.Thread(target=worker, args=(url,))
+        for url in ["https://Garage-Torcy.fr/contact", "https://boulangerie-lagny.fr/"] * 6
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(TIMEOUT)
+
+    assert peak == {"garage-torcy.fr": 2, "boulangerie-lagny.fr": 2}
+    stats = scheduler.get_stats()
+    assert stats["in_flight"] == 0
+    assert stats["granted"] == 12
+
+
+def test_global_limit_applies_across_hosts():
+    scheduler = FetchScheduler(max_in_flight=2, max_per_host=2)
+    granted = []
+
+    scheduler.acquire("garage-torcy.fr")
+    scheduler.acquire("boulangerie-lagny.fr")
+    thread, _ = start_acquire(scheduler, "plombier-bussy.fr", granted)
+    wait_until(lambda: scheduler.get_stats()["queued"] == 1)
+    assert granted == []
+
+    scheduler.release("garage-torcy.fr")
+    thread.join(TIMEOUT)
+
+    assert granted == ["plombier-bussy.fr"]
+
+
+def test_highest_priority_waiter_is_served_first():
+    scheduler = FetchScheduler(max_in_flight=1, max_per_host=2)
+    granted = []
+
+    scheduler.acquire("garage-torcy.fr")
+    low, _ = start_acquire(scheduler, "boulangerie-lagny.fr", granted, priority=(1, 0))
+    wait_until(lambda: scheduler.get_stats()["queued"] == 1)
+    high, _ = start_acquire(scheduler, "plombier-bussy.fr", granted, priority=(0, 3))
+    wait_until(lambda: scheduler.get_stats()["queued"] == 2)
+
+    scheduler.release("garage-torcy.fr")
+    high.join(TIMEOUT)
+    assert granted == ["plombier-bussy.fr"]
+
+    scheduler.release("plombier-bussy.fr")
+    low.join(TIMEOUT)
+    assert granted == ["plombier-bussy.fr", "boulangerie-lagny.fr"]
+
+
+def test_saturated_host_does_not_block_lower_priority_hosts():
+    scheduler = FetchScheduler(max_in_flight=16, max_per_host=1)
+    granted = []
+
+    scheduler.acquire("garage-torcy.fr")
+    blocked, _ = start_acquire(scheduler, "garage-torcy.fr", granted, priority=(0,))
+    wait_until(lambda: scheduler.get_stats()["queued"] == 1)
+
+    other, _ = start_acquire(scheduler, "boulangerie-lagny.fr", granted, priority=(9,))
+    other.join(TIMEOUT)
+
+    assert granted == ["boulangerie-lagny.fr"]
+    scheduler.release("garage-torcy.fr")
+    blocked.join(TIMEOUT)
+    assert granted == ["boulangerie-lagny.fr", "garage-torcy.fr"]
+
+
+def test_cancellation_leaves_the_queue():
+    scheduler = FetchScheduler(max_in_flight=16, max_per_host=1)
+    run_control = RunControl()
+    granted = []
+
+    scheduler.acquire("garage-torcy.fr")
+    thread, errors = start_acquire(scheduler, "garage-torcy.fr", granted, run_control=run_control)
+    wait_until(lambda: scheduler.get_stats()["queued"] == 1)
+
+    run_control.cancel("Test")
+    thread.join(TIMEOUT)
+
+    assert granted == []
+    assert len(errors) == 1 and isinstance(errors[0], EnrichmentCancelledError)
+    stats = scheduler.get_stats()
+    assert stats["queued"] == 0
+    assert stats["in_flight"] == 1
+
+
+def test_slot_releases_on_error():
+    scheduler = FetchScheduler(max_in_flight=16, max_per_host=1)
+
+    with pytest.raises(RuntimeError):
+        with scheduler.slot("https://garage-torcy.fr/contact"):
+            raise RuntimeError("échec du téléchargement")
+
+    stats = scheduler.get_stats()
+    assert stats["in_flight"] == 0
+    assert stats["hosts_in_flight"] == 0
+
+
+def test_robots_rules_and_capped_crawl_delay():
+    scheduler = FetchScheduler(max_crawl_delay=10.0)
+    robots = "User-agent: *\nDisallow: /admin/\nCrawl-delay: 60\n"
+
+    assert scheduler.robots_pending("https://garage-torcy.fr/contact")
+    assert scheduler.store_robots("https://garage-torcy.fr/contact", 200, robots) == 10.0
+
+    assert not scheduler.robots_pending("https://garage-torcy.fr/")
+    assert scheduler.can_fetch("https://garage-torcy.fr/contact")
+    assert not scheduler.can_fetch("https://garage-torcy.fr/admin/login")
+    assert scheduler.get_stats()["robots_disallowed"] == 1
+
+
+@pytest.mark.parametrize("status, allowed", [(403, False), (401, False), (404, True), (None, True)])
+def test_robots_status_conventions(status, allowed):
+    scheduler = FetchScheduler()
+
+    scheduler.store_robots("https://garage-torcy.fr/", status)
+
+    assert scheduler.can_fetch("https://garage-torcy.fr/contact") is allowed
+
+
+def test_robots_ignored_when_disabled():
+    scheduler = FetchScheduler(respect_robots=False)
+    scheduler.store_robots("https://garage-torcy.fr/", 403)
+
+    assert not scheduler.robots_pending("https://garage-torcy.fr/")
+    assert scheduler.can_fetch("https://garage-torcy.fr/contact")
@@ -0,0 +1,151 @@
+"""Tests du mode incrémental : planification, réutilisation et stabilité d'une relance"""
+
+import logging
+import time
+
+import pandas as pd
+import pytest
+
+from mcp_server.tools.ai_agent.core.agent import AIEnrichmentAgent
+from mcp_server.tools.ai_agent.core.persistence import SessionPersistence
+from mcp_server.tools.ai_agent.enrichment.strategies import EnrichmentStrategy
+from mcp_server.tools.ai_agent.output.checkpoint import group_content_hashes, row_content_hash
+from mcp_server.tools.ai_agent.output.enrichment_store import EnrichmentStore
+
+
+def companies_df():
+    """Le SIRET 1 figure deux fois avec un contenu différent (site renseigné sur une seule ligne)"""
+    return pd.DataFrame({
+        "SIRET": ["11111111100011", "22222222200022", "11111111100011", "33333333300033"],
+        "Nom courant/Dénomination": ["Boulangerie A", "Garage B", "Boulangerie A", "Plombier C"],
+        "Commune": ["Torcy", "Lagny-sur-Marne", "Torcy", "Bussy-Saint-Georges"],
+        "Site Web établissement": ["", "", "https://boulangerie-a.fr", ""]
+    })
+
+
+@pytest.fixture
+def enrich_calls(monkeypatch):
+    """Remplace la recherche réseau : succès pour les SIRET pairs, échec sinon"""
+    calls = []
+
+    def enrich_single_company(self, company, company_idx, logger):
+        calls.append(company["SIRET"])
+        if int(company["SIRET"][-1]) % 2 == 0:
+            return {
+                "success": True,
+                "data": {"website": "https://garage-b.fr", "search_source": "DuckDuckGo"},
+                "quality_score": 80,
+                "quality_report": {"quality_score": 80},
+                "ai_decision_log": {"decision": "ACCEPT"}
+            }
+        return {
+            "success": False,
+            "error_reason": "Aucun site web valide trouvé",
+            "ai_decision_log": {"decision": "NO_RESULTS"}
+        }
+
+    monkeypatch.setattr(EnrichmentStrategy, "enrich_single_company", enrich_single_company)
+    return calls
+
+
+@pytest.fixture
+def agent_config(tmp_path):
+    """Agent isolé : checkpoints, sorties et logs dans tmp_path, historique depuis les checkpoints"""
+    return {
+        "checkpoint_dir": str(tmp_path / "checkpoints"),
+        "processed_data_dir": str(tmp_path / "processed"),
+        "logs_dir": str(tmp_path / "logs"),
+        "enrichment_store_enabled": False,
+        "search_cache_enabled": False,
+        "page_cache_enabled": False,
+        "session_id_format": "%Y%m%d_%H%M%S_%f"
+    }
+
+
+def run_incremental(config, df, sample_size=10):
+    result = AIEnrichmentAgent(config).enrich_sample(sample_size, df=df, incremental=True)
+    assert "error" not in result, result.get("error")
+    return result["detailed_results"]
+
+
+def test_rerun_of_unchanged_file_reports_no_changes(agent_config, enrich_calls):
+    first = run_incremental(agent_config, companies_df())
+    assert first["incremental"]["new"] == 4
+    assert len(enrich_calls) == 3  # SIRET 1 dédupliqué
+
+    for _ in range(2):
+        rerun = run_incremental(agent_config, companies_df())
+        assert rerun["incremental"]["changed"] == 0
+        assert rerun["incremental"]["reused"] == 4
+        assert rerun["incremental"]["selected"] == 0
+        assert len(enrich_calls) == 3
+
+    # Les lignes réutilisées restent dans les résultats (et donc dans le fichier de sortie)
+    assert rerun["processed"] == first["processed"] == 3
+    assert rerun["enrichment_data"] == first["enrichment_data"]
+    assert rerun["reused"] == 3
+
+
+def test_changed_duplicate_row_replans_its_whole_siret(agent_config, enrich_calls):
+    run_incremental(agent_config, companies_df())
+
+    df = companies_df()
+    df.loc[2, "Site Web établissement"] = "https://boulangerie-a.com"
+    rerun = run_incremental(agent_config, df)
+
+    assert rerun["incremental"]["changed"] == 2
+    assert rerun["incremental"]["reused"] == 2
+    assert enrich_calls[3:] == ["11111111100011"]
+
+
+def test_empty_incremental_sample_completes(agent_config, enrich_calls):
+    result = AIEnrichmentAgent(agent_config).enrich_sample(0, df=companies_df(), incremental=True)
+
+    assert "error" not in result
+    assert result["detailed_results"]["processed"] == 0
+    assert enrich_calls == []
+
+
+def test_group_content_hash_covers_every_row_of_a_siret():
+    rows = [company for _, company in companies_df().iterrows()]
+    hashes = group_content_hashes(rows)
+
+    assert hashes["22222222200022"] == row_content_hash(rows[1])
+    assert hashes["11111111100011"] not in (row_content_hash(rows[0]), row_content_hash(rows[2]))
+    assert group_content_hashes(rows, {"33333333300033"}) == {"33333333300033": row_content_hash(rows[3])}
+
+
+def test_plan_incremental_classifies_store_history(tmp_path):
+    persistence = SessionPersistence({"incremental_ttl_days": 30, "incremental_failure_ttl_hours": 24},
+                                     "20260101_000000", logging.getLogger(__name__),
+                                     EnrichmentStore(str(tmp_path / "store.sqlite3")))
+    company = companies_df().iloc[1]
+    now = time.time()
+    found = {"result": {"success": True, "data": {}}, "error": None, "processing_time": 1.0}
+    not_found = {"result": {"success": False, "error_reason": "x"}, "error": None, "processing_time": 1.0}
+
+    persistence.record("10000000000001", 1, company, found, "h")
+    persistence.record("10000000000002", 2, company, found, "h")
+    persistence.record("10000000000003", 3, company, not_found, "h", enriched_at=now - 3600)
+    persistence.record("10000000000004", 4, company, not_found, "h", enriched_at=now - 2 * 86400)
+    persistence.record("10000000000005", 5, company, found, "h", enriched_at=now - 40 * 86400)
+    persistence.flush()
+
+    keys = ["10000000000001", "10000000000002", "10000000000003", "10000000000004", "10000000000005",
+            "10000000000006", "row-7"]
+    todo, stats, reused = persistence.plan_incremental(keys, ["h", "other", "h", "h", "h", "h", "h"])
+
+    assert todo == [False, True, False, True, True, True, True]
+    assert stats == {"new": 2, "changed": 1, "failed": 1, "stale": 1, "reused": 2}
+    assert sorted(reused) == ["10000000000001", "10000000000003"]
+
+
+def test_plan_incremental_keeps_checkpointed_rows(tmp_path):
+    persistence = SessionPersistence({"checkpoint_dir": str(tmp_path)}, "20260101_000000",
+                                     logging.getLogger(__name__))
+
+    todo, stats, reused = persistence.plan_incremental(["10000000000001"], ["h"], {"10000000000001": {}})
+
+    assert todo == [True]
+    assert sum(stats.values()) == 0
+    assert reused == {}
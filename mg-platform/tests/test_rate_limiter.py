@@ -0,0 +1,156 @@
+"""Tests du limiteur de débit : rafales, backoff adaptatif et retour au débit nominal"""
+
+import pytest
+
+from mcp_server.tools.ai_agent.utils import rate_limiter
+from mcp_server.tools.ai_agent.utils.rate_limiter import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    """Horloge monotone pilotée par le test"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", fake)
+    return fake
+
+
+def test_reserve_spaces_calls_by_the_interval(clock):
+    limiter = RateLimiter({"duckduckgo": 2.0})
+
+    assert limiter.reserve("duckduckgo") == 0.0
+    assert limiter.reserve("duckduckgo") == pytest.approx(2.0)
+    assert limiter.reserve("duckduckgo") == pytest.approx(4.0)
+
+    stats = limiter.get_stats()["duckduckgo"]
+    assert stats["acquired"] == 3
+    assert stats["delayed"] == 2
+    assert stats["wait_seconds"] == pytest.approx(6.0)
+
+
+def test_reserve_serves_a_burst_then_holds_the_rate(clock):
+    limiter = RateLimiter({"duckduckgo": 2.0}, bursts={"duckduckgo": 3})
+
+    assert [limiter.reserve("duckduckgo") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.reserve("duckduckgo") == pytest.approx(2.0)
+
+    # Après une pause, le seau est de nouveau plein
+    clock.advance(60)
+    assert [limiter.reserve("duckduckgo") for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_unconfigured_source_is_not_limited(clock):
+    limiter = RateLimiter({"duckduckgo": 2.0})
+
+    assert limiter.reserve("google") == 0.0
+    assert limiter.reserve("google") == 0.0
+
+
+def test_host_sources_share_the_host_interval_but_not_their_budget(clock):
+    limiter = RateLimiter({}, host_interval=1.0, bursts={"host:": 2})
+    first = RateLimiter.host_source("https://WWW.Garage-Torcy.fr/contact")
+    other = RateLimiter.host_source("https://boulangerie-lagny.fr/")
+
+    assert first == "host:www.garage-torcy.fr"
+    assert limiter.get_interval(first) == 1.0
+    assert limiter.get_burst(first) == 2
+
+    assert [limiter.reserve(first) for _ in range(3)] == [0.0, 0.0, pytest.approx(1.0)]
+    assert limiter.reserve(other) == 0.0
+
+    # Hôtes agrégés sous "host:*"
+    assert limiter.get_stats()["host:*"]["acquired"] == 4
+
+
+def test_set_interval_overrides_the_host_interval(clock):
+    limiter = RateLimiter({}, host_interval=1.0)
+    source = RateLimiter.host_source("https://www.garage-torcy.fr/")
+
+    limiter.set_interval(source, 5.0)
+
+    assert limiter.reserve(source) == 0.0
+    assert limiter.reserve(source) == pytest.approx(5.0)
+
+
+def test_penalize_doubles_the_interval_up_to_backoff_max(clock):
+    limiter = RateLimiter({"duckduckgo": 1.0}, backoff_max=4.0)
+
+    limiter.penalize("duckduckgo")
+    assert limiter.get_stats()["duckduckgo"]["backoff_factor"] == 2.0
+    # Prochain créneau repoussé d'un intervalle doublé
+    assert limiter.reserve("duckduckgo") == pytest.approx(2.0)
+
+    limiter.penalize("duckduckgo")
+    limiter.penalize("duckduckgo")
+    stats = limiter.get_stats()["duckduckgo"]
+    assert stats["backoff_factor"] == 4.0
+    assert stats["throttled"] == 3
+
+    clock.advance(60)
+    assert limiter.reserve("duckduckgo") == 0.0
+    assert limiter.reserve("duckduckgo") == pytest.approx(4.0)
+
+
+def test_penalize_respects_retry_after(clock):
+    limiter = RateLimiter({"google": 1.0})
+
+    limiter.penalize("google", retry_after=30.0)
+
+    assert limiter.reserve("google") == pytest.approx(30.0)
+
+
+def test_penalize_empties_the_burst(clock):
+    limiter = RateLimiter({"duckduckgo": 1.0}, bursts={"duckduckgo": 3})
+
+    limiter.penalize("duckduckgo")
+
+    # Aucune rafale tolérée avant la fin de la pause
+    assert limiter.reserve("duckduckgo") == pytest.approx(2.0)
+
+
+def test_reward_returns_progressively_to_the_nominal_rate(clock):
+    limiter = RateLimiter({"duckduckgo": 1.0}, backoff_recovery=0.5)
+    limiter.penalize("duckduckgo")
+    limiter.penalize("duckduckgo")
+
+    limiter.reward("duckduckgo")
+    assert limiter.get_stats()["duckduckgo"]["backoff_factor"] == 2.0
+
+    limiter.reward("duckduckgo")
+    assert limiter.get_stats()["duckduckgo"]["backoff_factor"] == 1.0
+
+    clock.advance(60)
+    assert limiter.reserve("duckduckgo") == 0.0
+    assert limiter.reserve("duckduckgo") == pytest.approx(1.0)
+
+
+def test_reward_without_backoff_is_a_no_op(clock):
+    limiter = RateLimiter({"duckduckgo": 1.0})
+
+    limiter.reward("duckduckgo")
+
+    assert limiter.reserve("duckduckgo") == 0.0
+    assert limiter.get_stats()["duckduckgo"]["backoff_factor"] == 1.0
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("12", 12.0),
+    ("1.5", 1.5),
+    ("-3", 0.0),
+    (None, None),
+    ("", None),
+    ("Wed, 21 Oct 2026 07:28:00 GMT", None)
+])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
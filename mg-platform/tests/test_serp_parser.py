@@ -0,0 +1,110 @@
+"""Tests du parseur de pages de résultats : parité des backends et reconnaissance des pages"""
+
+from pathlib import Path
+
+import pytest
+
+from mcp_server.tools.ai_agent.search import serp_parser
+from mcp_server.tools.ai_agent.search.serp_parser import BACKENDS, SerpParser, clean_result_url, resolve_backend
+from mcp_server.tools.ai_agent.utils.validators import is_valid_business_website
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures" / "serp"
+FIXTURES = sorted(FIXTURES_DIR.glob("*.html"))
+
+# Même plafond que la recherche (et que benchmarks/bench_serp_parser.py)
+MAX_RESULTS = {"duckduckgo": 5, "google": 3}
+
+AVAILABLE = {
+    "selectolax": serp_parser.SELECTOLAX_AVAILABLE,
+    "lxml": serp_parser.LXML_AVAILABLE,
+    "targeted": True,
+    "bs4": serp_parser.BS4_AVAILABLE
+}
+
+backends = pytest.mark.parametrize("backend", [
+    pytest.param(name, marks=pytest.mark.skipif(not AVAILABLE[name], reason=f"{name} non installé"))
+    for name in BACKENDS
+])
+fixtures = pytest.mark.parametrize("fixture", FIXTURES, ids=[path.stem for path in FIXTURES])
+
+
+def engine_of(fixture: Path) -> str:
+    return fixture.stem.split("_")[0]
+
+
+def test_fixtures_are_present():
+    assert {engine_of(fixture) for fixture in FIXTURES} == set(MAX_RESULTS)
+
+
+@pytest.mark.skipif(not serp_parser.BS4_AVAILABLE, reason="bs4 (référence) non installé")
+@backends
+@fixtures
+@pytest.mark.parametrize("all_links", [False, True], ids=["search", "all-links"])
+def test_backend_matches_the_bs4_reference(backend, fixture, all_links):
+    engine = engine_of(fixture)
+    content = fixture.read_bytes()
+    max_results = 1000 if all_links else MAX_RESULTS[engine]
+    accept = (lambda url: True) if all_links else is_valid_business_website
+
+    expected = SerpParser("bs4").parse_results(engine, content, max_results, accept)
+    links = SerpParser(backend).parse_results(engine, content, max_results, accept)
+
+    assert links
+    assert links == expected
+
+
+@backends
+def test_backend_extracts_the_duckduckgo_results_in_page_order(backend):
+    content = (FIXTURES_DIR / "duckduckgo_garage_torcy.html").read_bytes()
+
+    links = SerpParser(backend).parse_results("duckduckgo", content, 5, is_valid_business_website)
+
+    assert links == [
+        "https://www.garage-du-centre-torcy.fr/",
+        "https://garage-du-centre-torcy.wixsite.com/accueil",
+        "https://www.tripadvisor.fr/Restaurant_Review-g728514",
+        "https://www.ville-torcy.fr/annuaire/garage-du-centre-torcy",
+        "https://www.linkedin.com/company/garage-du-centre-torcy"
+    ]
+
+
+@backends
+def test_max_results_caps_the_links(backend):
+    content = (FIXTURES_DIR / "duckduckgo_garage_torcy.html").read_bytes()
+
+    assert len(SerpParser(backend).parse_results("duckduckgo", content, 2)) == 2
+
+
+@fixtures
+def test_fixtures_are_results_pages(fixture):
+    assert SerpParser().is_results_page(engine_of(fixture), fixture.read_bytes())
+
+
+@pytest.mark.parametrize("engine, content, expected", [
+    ("duckduckgo", b"<html><body><form id='challenge'>Please complete the captcha</form></body></html>", False),
+    ("google", b"<html><body><div id='captcha-form'>unusual traffic</div></body></html>", False),
+    ("duckduckgo", b"<html><body><div class='no-results'>No results.</div></body></html>", True),
+    ("google", "<html><body><p>Aucun document ne correspond aux termes</p></body></html>".encode(), True)
+])
+def test_is_results_page_recognizes_blocked_and_empty_pages(engine, content, expected):
+    assert SerpParser().is_results_page(engine, content) is expected
+    assert SerpParser().parse_results(engine, content, 5) == []
+
+
+def test_clean_result_url_unwraps_engine_redirects():
+    assert clean_result_url(
+        "duckduckgo", "//duckduckgo.com/l/?uddg=https%3A%2F%2Fwww.garage-torcy.fr%2F&rut=abc"
+    ) == "https://www.garage-torcy.fr/"
+    assert clean_result_url(
+        "google", "/url?q=https://www.plombier-bussy.fr/contact&sa=U"
+    ) == "https://www.plombier-bussy.fr/contact"
+    assert clean_result_url("google", "https://www.plombier-bussy.fr/") == "https://www.plombier-bussy.fr/"
+
+
+def test_unavailable_backend_falls_back_to_an_installed_one():
+    for name in BACKENDS:
+        resolved = resolve_backend(name)
+        assert AVAILABLE[resolved]
+        assert resolved == name or not AVAILABLE[name]
+
+    assert resolve_backend("inconnu") in BACKENDS